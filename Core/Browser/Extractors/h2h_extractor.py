@@ -13,8 +13,9 @@ from playwright.async_api import Page, TimeoutError, ElementHandle
 import re
 from typing import Dict, Any, List
 from Core.Intelligence.intelligence import get_selector_auto, get_selector
-from Data.Access.db_helpers import save_schedule_entry
+from Data.Access.db_helpers import save_schedule_entries, save_team_entries
 from Core.Browser.site_helpers import fs_universal_popup_dismissal
+from Core.Browser.wait_toolkit import wait_for_visible
 import asyncio
 
 async def activate_h2h_tab(page: Page) -> bool:
@@ -33,7 +34,8 @@ async def activate_h2h_tab(page: Page) -> bool:
         if await page.locator(tab_selector).is_visible(timeout=5000):
             await page.click(tab_selector)
             await page.wait_for_load_state("domcontentloaded")
-            await asyncio.sleep(5.0)
+            # H2H rows arrive via XHR after the click; wait for the first one rather than a fixed 5s
+            await wait_for_visible(page, get_selector("fs_h2h_tab", "h2h_row_general") or ".h2h__row", "h2h_rows", timeout_ms=8000)
             await fs_universal_popup_dismissal(page, "fs_h2h_tab") # Use specific context popup dismissal if needed, or generic
             return True
         else:
@@ -268,9 +270,8 @@ async def save_extracted_h2h_to_schedules(h2h_data: Dict[str, Any]) -> List[Dict
     """
     Saves historical matches found during extraction to the schedules.csv file.
     Returns a list of the newly saved match dictionaries for further processing.
+    Schedules and teams are each written in a single bulk UPSERT.
     """
-    from Data.Access.db_helpers import save_team_entry
-
     all_past_matches = (
         h2h_data.get("home_last_10_matches", []) +
         h2h_data.get("away_last_10_matches", []) +
@@ -278,6 +279,7 @@ async def save_extracted_h2h_to_schedules(h2h_data: Dict[str, Any]) -> List[Dict
     )
 
     saved_matches = []
+    team_entries = []
     for match in all_past_matches:
         if not match or not match.get('date') or not match.get('score'):
             continue
@@ -306,16 +308,17 @@ async def save_extracted_h2h_to_schedules(h2h_data: Dict[str, Any]) -> List[Dict
             'match_link': match_link
         }
 
-        save_schedule_entry(entry_to_save)
-
-        # Save team entries
+        # Collect team entries
         if home_team_id:
             home_team_url = f"https://www.flashscore.com/team/{home_team.lower().replace(' ', '-')}/{home_team_id}/"
-            save_team_entry({'team_id': home_team_id, 'team_name': home_team, 'region_league': h2h_data.get("region_league", "Unknown"), 'team_url': home_team_url})
+            team_entries.append({'team_id': home_team_id, 'team_name': home_team, 'region_league': h2h_data.get("region_league", "Unknown"), 'team_url': home_team_url})
         if away_team_id:
             away_team_url = f"https://www.flashscore.com/team/{away_team.lower().replace(' ', '-')}/{away_team_id}/"
-            save_team_entry({'team_id': away_team_id, 'team_name': away_team, 'region_league': h2h_data.get("region_league", "Unknown"), 'team_url': away_team_url})
+            team_entries.append({'team_id': away_team_id, 'team_name': away_team, 'region_league': h2h_data.get("region_league", "Unknown"), 'team_url': away_team_url})
 
         saved_matches.append(entry_to_save)
 
+    save_schedule_entries(saved_matches)
+    save_team_entries(team_entries)
+
     return saved_matches
@@ -8,6 +8,7 @@ import re
 from typing import Dict, Any, List
 from Core.Intelligence.intelligence import get_selector_auto, get_selector
 from Core.Browser.site_helpers import fs_universal_popup_dismissal
+from Core.Browser.wait_toolkit import wait_for_visible
 import asyncio
 
 async def activate_standings_tab(page: Page) -> bool:
@@ -64,9 +65,10 @@ async def activate_standings_tab(page: Page) -> bool:
 async def _post_activation_prep(page: Page):
     """Wait for content and dismiss popups after tab activation."""
     await page.wait_for_load_state("domcontentloaded")
-    await asyncio.sleep(2.0)
+    # Rows are rendered from an XHR; draw (cup) tables have none, so the wait is bounded.
+    row_selector = get_selector("fs_standings_tab", "standings_row") or ".ui-table__row"
+    await wait_for_visible(page, row_selector, "standings_rows", timeout_ms=6000)
     await fs_universal_popup_dismissal(page, "fs_standings_tab")
-    await asyncio.sleep(3.0)
 
 async def extract_standings_data(page: Page, context: str = "fs_standings_tab") -> Dict[str, Any]:
     """
@@ -0,0 +1,121 @@
+# page_health.py: Memory-based recycling for long-lived browser pages.
+# Refactored for Clean Architecture (v2.7)
+# This script samples renderer metrics and swaps bloated pages for fresh ones.
+
+"""
+Page Health Module
+The live streamer and the Football.com persistent context keep one page open
+for days; a periodic reload does not release everything the renderer leaks
+(detached DOM, listeners, timers). The manager samples CDP Performance metrics
+(JSHeapUsedSize, Nodes) at most every LEO_PAGE_HEALTH_INTERVAL seconds
+(default 120) and reports a page as unhealthy when:
+- its JS heap exceeds LEO_PAGE_HEALTH_MAX_HEAP_MB (default 400), or
+- it holds more than LEO_PAGE_HEALTH_MAX_NODES DOM nodes (default 150000).
+recycle() closes the page, opens a new one in the same context (cookies,
+storage and login survive) and restores it (default: the previous URL).
+Owners of a private context can instead close the whole context and rebuild
+it. Every recycle is printed and written to the audit log.
+"""
+
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from playwright.async_api import Page
+
+from Data.Access.db_helpers import log_audit_event
+
+MAX_HEAP_MB = float(os.getenv('LEO_PAGE_HEALTH_MAX_HEAP_MB', 400))
+MAX_NODES = int(os.getenv('LEO_PAGE_HEALTH_MAX_NODES', 150000))
+SAMPLE_INTERVAL = float(os.getenv('LEO_PAGE_HEALTH_INTERVAL', 120))  # seconds
+
+
+class PageHealthManager:
+    """Samples per-page renderer memory and recycles pages past the thresholds."""
+
+    def __init__(self, max_heap_mb: float = MAX_HEAP_MB, max_nodes: int = MAX_NODES,
+                 sample_interval: float = SAMPLE_INTERVAL):
+        self.max_heap_mb = max_heap_mb
+        self.max_nodes = max_nodes
+        self.sample_interval = sample_interval
+        self._sessions: Dict[Page, Any] = {}  # page -> CDP session with Performance enabled
+        self._last_sample: Dict[Page, float] = {}
+        self.stats = {'samples': 0, 'recycles': 0}
+
+    async def metrics(self, page: Page) -> Dict[str, float]:
+        """{'heap_mb', 'nodes'} from CDP; falls back to performance.memory (nodes 0) if CDP is unavailable."""
+        try:
+            session = self._sessions.get(page)
+            if session is None:
+                session = await page.context.new_cdp_session(page)
+                await session.send("Performance.enable")
+                self._sessions[page] = session
+            raw = await session.send("Performance.getMetrics")
+            values = {m['name']: m['value'] for m in raw.get('metrics', [])}
+            return {'heap_mb': values.get('JSHeapUsedSize', 0) / (1024 * 1024), 'nodes': values.get('Nodes', 0)}
+        except Exception:
+            self._sessions.pop(page, None)
+        try:
+            used = await page.evaluate("() => (performance.memory && performance.memory.usedJSHeapSize) || 0")
+            return {'heap_mb': used / (1024 * 1024), 'nodes': 0}
+        except Exception:
+            return {'heap_mb': 0.0, 'nodes': 0}
+
+    async def check(self, page: Page, force: bool = False) -> Optional[str]:
+        """Reason the page should be recycled, or None (also when the sample interval has not elapsed)."""
+        now = time.monotonic()
+        if not force and now - self._last_sample.get(page, 0.0) < self.sample_interval:
+            return None
+        self._last_sample[page] = now
+        self.stats['samples'] += 1
+
+        m = await self.metrics(page)
+        if m['heap_mb'] > self.max_heap_mb:
+            return f"JS heap {m['heap_mb']:.0f} MB > {self.max_heap_mb:.0f} MB ({m['nodes']:.0f} nodes)"
+        if m['nodes'] > self.max_nodes:
+            return f"{m['nodes']:.0f} DOM nodes > {self.max_nodes} (heap {m['heap_mb']:.0f} MB)"
+        return None
+
+    def forget(self, page: Page):
+        """Drops per-page state; call when a page is closed outside recycle()."""
+        self._sessions.pop(page, None)
+        self._last_sample.pop(page, None)
+
+    def log_recycle(self, label: str, reason: str):
+        self.stats['recycles'] += 1
+        print(f"    [Page Health] Recycling {label}: {reason}.")
+        log_audit_event("PAGE_RECYCLE", f"{label}: {reason}")
+
+    async def recycle(self, page: Page, label: str, reason: str,
+                      restore: Optional[Callable[[Page, str], Awaitable[None]]] = None) -> Page:
+        """Replaces `page` with a new page in the same context and restores its state."""
+        self.log_recycle(label, reason)
+        url = page.url
+        context = page.context
+        self.forget(page)
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+        new_page = await context.new_page()
+        try:
+            if restore:
+                await restore(new_page, url)
+            elif url.startswith("http"):
+                await new_page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        except Exception as e:
+            # The fresh page is still usable; the caller's next navigation recovers
+            print(f"    [Page Health] Could not restore {label} to {url}: {e}")
+        return new_page
+
+    async def ensure_healthy(self, page: Page, label: str,
+                             restore: Optional[Callable[[Page, str], Awaitable[None]]] = None) -> Page:
+        """The same page while healthy, otherwise its recycled replacement."""
+        reason = await self.check(page)
+        if reason is None:
+            return page
+        return await self.recycle(page, label, reason, restore)
+
+
+page_health = PageHealthManager()
@@ -0,0 +1,202 @@
+# page_pool.py: Warm, reusable browser pages for batch scraping.
+# Refactored for Clean Architecture (v2.7)
+# This script keeps a context and a set of pages alive across match tasks.
+
+"""
+Page Pool Module
+Hands out pre-created pages from one long-lived browser context instead of
+creating and closing a context per task, so caches, cookies and consent
+state stay warm. Pages are reset between leases and retired when:
+- they have served LEO_PAGE_MAX_USES leases (default 25),
+- their JS heap exceeds LEO_PAGE_MAX_HEAP_MB (default 300),
+- they crashed or failed to reset (quarantined, never handed out again).
+Pool size follows the BatchProcessor concurrency (see resize()).
+"""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from playwright.async_api import Browser, BrowserContext, Page
+
+PAGE_MAX_USES = int(os.getenv('LEO_PAGE_MAX_USES', 25))
+PAGE_MAX_HEAP_MB = float(os.getenv('LEO_PAGE_MAX_HEAP_MB', 300))
+
+
+class PagePool:
+    """Fixed-size pool of reusable pages in a shared browser context."""
+
+    def __init__(self, browser: Browser, size: int, context_options: Optional[Dict[str, Any]] = None,
+                 setup: Optional[Callable[[Page], Awaitable[None]]] = None,
+                 max_uses: int = PAGE_MAX_USES, max_heap_mb: float = PAGE_MAX_HEAP_MB):
+        self.browser = browser
+        self.size = max(1, size)
+        self.context_options = context_options or {}
+        self.setup = setup  # Runs once per new page (listeners, routing, warm-up)
+        self.max_uses = max_uses
+        self.max_heap_mb = max_heap_mb
+
+        self.context: Optional[BrowserContext] = None
+        self._idle: List[Page] = []
+        self._uses: Dict[Page, int] = {}
+        self._crashed: set = set()
+        self._total = 0  # idle + leased
+        self._cond: Optional[asyncio.Condition] = None
+        self.stats = {'created': 0, 'reused': 0, 'recycled': 0, 'quarantined': 0}
+
+    def _get_cond(self) -> asyncio.Condition:
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    async def _ensure_context(self):
+        if self.context is None:
+            self.context = await self.browser.new_context(**self.context_options)
+
+    async def _new_page(self) -> Page:
+        await self._ensure_context()
+        page = await self.context.new_page()
+        page.on("crash", lambda p: self._crashed.add(p))
+        if self.setup:
+            await self.setup(page)
+        self._uses[page] = 0
+        self.stats['created'] += 1
+        return page
+
+    async def start(self):
+        """Pre-creates all pages so the first leases are warm."""
+        async with self._get_cond():
+            missing = self.size - self._total
+            if missing <= 0:
+                return
+            self._total += missing
+        pages = await asyncio.gather(*(self._new_page() for _ in range(missing)), return_exceptions=True)
+        async with self._get_cond():
+            for page in pages:
+                if isinstance(page, Exception):
+                    self._total -= 1
+                    print(f"    [Page Pool] Could not pre-create page: {page}")
+                else:
+                    self._idle.append(page)
+            self._get_cond().notify_all()
+
+    async def resize(self, size: int):
+        """Changes the pool size; surplus pages are retired as they come back, waiters are woken on growth."""
+        cond = self._get_cond()
+        async with cond:
+            grew = size > self.size
+            self.size = max(1, size)
+            if grew:
+                cond.notify_all()
+
+    async def acquire(self) -> Page:
+        cond = self._get_cond()
+        page, discarded = None, []
+        async with cond:
+            while True:
+                while self._idle and page is None:
+                    candidate = self._idle.pop()
+                    if candidate.is_closed() or candidate in self._crashed:
+                        self._discard(candidate, quarantine=True)
+                        discarded.append(candidate)
+                        continue
+                    self.stats['reused'] += 1
+                    page = candidate
+                if page is not None:
+                    break
+                if self._total < self.size:
+                    self._total += 1
+                    break
+                await cond.wait()
+        for dead in discarded:
+            await self._close_page(dead)
+        if page is not None:
+            return page
+        try:
+            return await self._new_page()
+        except Exception:
+            async with cond:
+                self._total -= 1
+                cond.notify()
+            raise
+
+    async def release(self, page: Page):
+        """Returns a page: reset and re-queued, or retired if worn out, bloated or crashed."""
+        self._uses[page] = self._uses.get(page, 0) + 1
+        reason = None
+        if page.is_closed() or page in self._crashed:
+            reason = 'quarantined'
+        elif self._total > self.size or self._uses[page] >= self.max_uses:
+            reason = 'recycled'
+        elif await self._heap_mb(page) > self.max_heap_mb:
+            reason = 'recycled'
+        elif not await self._reset(page):
+            reason = 'quarantined'
+
+        cond = self._get_cond()
+        async with cond:
+            if reason:
+                self._discard(page, quarantine=(reason == 'quarantined'))
+            else:
+                self._idle.append(page)
+            cond.notify()
+        if reason:
+            await self._close_page(page)
+
+    @asynccontextmanager
+    async def page(self):
+        """Leases a page for the duration of the block."""
+        page = await self.acquire()
+        try:
+            yield page
+        finally:
+            await self.release(page)
+
+    def _discard(self, page: Page, quarantine: bool):
+        self._total -= 1
+        self._uses.pop(page, None)
+        self._crashed.discard(page)
+        self.stats['quarantined' if quarantine else 'recycled'] += 1
+        if quarantine:
+            print("    [Page Pool] Quarantined a crashed/unresponsive page.")
+
+    @staticmethod
+    async def _close_page(page: Page):
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    async def _heap_mb(page: Page) -> float:
+        try:
+            used = await page.evaluate("() => (performance.memory && performance.memory.usedJSHeapSize) || 0")
+            return used / (1024 * 1024)
+        except Exception:
+            return 0.0
+
+    @staticmethod
+    async def _reset(page: Page) -> bool:
+        """Drops the previous match's DOM, timers and sockets; cookies and cache are kept."""
+        try:
+            await page.goto("about:blank", timeout=10000)
+            return True
+        except Exception:
+            return False
+
+    async def close(self):
+        async with self._get_cond():
+            self._idle.clear()
+            self._uses.clear()
+            self._total = 0
+        if self.context is not None:
+            try:
+                await self.context.close()
+            except Exception:
+                pass
+            self.context = None
+        s = self.stats
+        print(f"    [Page Pool] Closed: {s['created']} pages created, {s['reused']} reuses, "
+              f"{s['recycled']} recycled, {s['quarantined']} quarantined.")
@@ -0,0 +1,149 @@
+# resource_blocker.py: Request-level resource blocking for scraping contexts.
+# Refactored for Clean Architecture (v2.7)
+# This script aborts images, media, fonts and ad/tracker requests per named profile.
+
+"""
+Resource Blocker Module
+Extractors read text through page.evaluate, so most of what a page downloads
+(images, video, web fonts, ads, analytics) is wasted bandwidth and Chromium
+memory. apply_resource_profile() installs a route handler on a page or
+context that aborts those requests according to a named profile.
+
+Stylesheets are never blocked: visibility checks (is_visible, :visible)
+depend on them, and layout must stay intact for screenshots.
+
+Configuration:
+- LEO_RESOURCE_BLOCKING: set to 0 to disable all blocking.
+- LEO_RESOURCE_ALLOW: per-profile allow-list overrides, e.g.
+  "flashscore:image;enrichment:image,font".
+
+Selector heals screenshot pages opened under text-only profiles; they wrap
+the heal in vision_profile(page), which switches that page to the 'vision'
+profile and re-requests its images, so the AI sees crests and flags.
+"""
+
+import os
+from contextlib import asynccontextmanager
+from typing import Dict, FrozenSet, Union
+from urllib.parse import urlsplit
+
+from playwright.async_api import BrowserContext, Page, Route
+
+RESOURCE_BLOCKING = os.getenv('LEO_RESOURCE_BLOCKING', '1') != '0'
+
+# Ad, analytics and tracking hosts (suffix match). Consent providers are
+# deliberately absent: cookie banners must still load to be dismissed.
+AD_TRACKER_HOSTS = (
+    'doubleclick.net', 'googlesyndication.com', 'googleadservices.com', 'googletagservices.com',
+    'googletagmanager.com', 'google-analytics.com', 'adservice.google.com', 'amazon-adsystem.com',
+    'adnxs.com', 'criteo.com', 'criteo.net', 'taboola.com', 'outbrain.com', 'scorecardresearch.com',
+    'hotjar.com', 'facebook.net', 'quantserve.com', 'moatads.com', 'pubmatic.com', 'rubiconproject.com',
+    'openx.net', 'casalemedia.com', 'teads.tv', 'smartadserver.com', 'chartbeat.com', 'chartbeat.net',
+    'yieldmo.com', 'adform.net', 'bidswitch.net', 'sharethrough.com', 'media.net', 'onesignal.com',
+)
+
+TEXT_ONLY = frozenset({'image', 'media', 'font'})
+
+# Profile name -> resource types to abort (ad/tracker hosts are aborted for every profile)
+RESOURCE_PROFILES: Dict[str, FrozenSet[str]] = {
+    'flashscore': TEXT_ONLY,          # Schedule pages and match processing
+    'flashscore_live': TEXT_ONLY,     # Live score streamer
+    'enrichment': TEXT_ONLY,          # Scripts/enrich_all_schedules.py
+    'outcome_review': TEXT_ONLY,      # Browser fallback of the outcome reviewer
+    'vision': frozenset(),            # Pages screenshotted for AI vision: ads/trackers only
+}
+
+# Requests aborted per profile since start-up
+BLOCK_STATS: Dict[str, int] = {}
+
+
+def _parse_allow_overrides(raw: str) -> Dict[str, FrozenSet[str]]:
+    overrides = {}
+    for part in raw.split(';'):
+        if ':' not in part:
+            continue
+        name, types = part.split(':', 1)
+        overrides[name.strip()] = frozenset(t.strip() for t in types.split(',') if t.strip())
+    return overrides
+
+
+ALLOW_OVERRIDES = _parse_allow_overrides(os.getenv('LEO_RESOURCE_ALLOW', ''))
+
+
+def blocked_types(profile: str) -> FrozenSet[str]:
+    """Resource types aborted for a profile after allow-list overrides."""
+    return RESOURCE_PROFILES.get(profile, frozenset()) - ALLOW_OVERRIDES.get(profile, frozenset())
+
+
+def is_ad_or_tracker(url: str) -> bool:
+    host = urlsplit(url).hostname or ''
+    return any(host == h or host.endswith('.' + h) for h in AD_TRACKER_HOSTS)
+
+
+def _route_handler(profile: str):
+    types = blocked_types(profile)
+    BLOCK_STATS.setdefault(profile, 0)
+
+    async def _handle(route: Route):
+        request = route.request
+        try:
+            if request.resource_type in types or is_ad_or_tracker(request.url):
+                BLOCK_STATS[profile] += 1
+                await route.abort()
+            else:
+                await route.continue_()
+        except Exception:
+            pass  # Page/context closed while the request was in flight
+
+    return _handle
+
+
+async def apply_resource_profile(target: Union[Page, BrowserContext], profile: str):
+    """Routes all requests of a page or context through the named blocking profile."""
+    if not RESOURCE_BLOCKING:
+        return
+    if profile not in RESOURCE_PROFILES:
+        print(f"    [Resource Blocker] Unknown profile '{profile}', nothing blocked.")
+        return
+    await target.route("**/*", _route_handler(profile))
+
+
+# Re-requests every <img> (blocked loads are not cached) and waits up to 3s for them
+_RELOAD_IMAGES_JS = """async () => {
+    const imgs = [...document.images];
+    for (const img of imgs) {
+        const src = img.getAttribute('src');
+        if (src) { img.removeAttribute('src'); img.setAttribute('src', src); }
+    }
+    const loaded = imgs.map((img) => img.complete ? null : new Promise((resolve) => {
+        img.addEventListener('load', resolve, {once: true});
+        img.addEventListener('error', resolve, {once: true});
+    }));
+    await Promise.race([Promise.all(loaded), new Promise((resolve) => setTimeout(resolve, 3000))]);
+    return imgs.length;
+}"""
+
+
+@asynccontextmanager
+async def vision_profile(page: Page):
+    """
+    Renders a page for AI vision inside the block: its requests use the
+    'vision' profile (page routes take precedence over the context's) and
+    images dropped under a text-only profile are loaded again.
+    """
+    if not RESOURCE_BLOCKING:
+        yield
+        return
+    handler = _route_handler('vision')
+    try:
+        await page.route("**/*", handler)
+        await page.evaluate(_RELOAD_IMAGES_JS)
+    except Exception:
+        pass  # Best effort: the heal still runs on the page as it is
+    try:
+        yield
+    finally:
+        try:
+            await page.unroute("**/*", handler)
+        except Exception:
+            pass
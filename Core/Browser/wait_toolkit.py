@@ -0,0 +1,110 @@
+# wait_toolkit.py: Condition-based waits with recorded timings.
+# Refactored for Clean Architecture (v2.7)
+# This script replaces fixed sleeps with bounded waits on concrete page signals.
+
+"""
+Wait Toolkit Module
+Each wait returns as soon as its readiness signal fires (a selector becomes
+visible, a row count changes, the network goes idle) and never blocks longer
+than its timeout. Every wait records how long it actually took under a label.
+Once a label has enough samples, its timeout is tuned from the observed p95
+instead of the hard-coded default, always within [floor, default].
+"""
+
+import time
+from collections import defaultdict, deque
+from typing import Deque, Dict, Optional
+
+from playwright.async_api import Page
+
+TUNE_MIN_SAMPLES = 20
+TUNE_HEADROOM = 1.5     # timeout = p95 * headroom (+ floor), capped at the default
+TUNE_FLOOR_MS = 1000
+
+# label -> recent wait durations in ms (timeouts recorded at their full length)
+WAIT_TIMINGS: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=200))
+WAIT_TIMEOUTS: Dict[str, int] = defaultdict(int)
+
+
+def _record(label: str, started: float, satisfied: bool) -> float:
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    WAIT_TIMINGS[label].append(elapsed_ms)
+    if not satisfied:
+        WAIT_TIMEOUTS[label] += 1
+    return elapsed_ms
+
+
+def tuned_timeout(label: str, default_ms: int) -> int:
+    """Timeout for a label: p95 of observed waits with headroom, never above the default."""
+    samples = WAIT_TIMINGS.get(label)
+    if not samples or len(samples) < TUNE_MIN_SAMPLES:
+        return default_ms
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return int(min(default_ms, max(TUNE_FLOOR_MS, p95 * TUNE_HEADROOM + TUNE_FLOOR_MS)))
+
+
+async def wait_for_visible(page: Page, selector: str, label: str, timeout_ms: int = 8000) -> bool:
+    """Waits until `selector` is visible. Returns False on timeout instead of raising."""
+    started = time.perf_counter()
+    try:
+        await page.wait_for_selector(selector, state='visible', timeout=tuned_timeout(label, timeout_ms))
+        _record(label, started, True)
+        return True
+    except Exception:
+        _record(label, started, False)
+        return False
+
+
+async def wait_for_count_change(page: Page, selector: str, previous: int, label: str, timeout_ms: int = 3000) -> int:
+    """Waits until the number of elements matching `selector` differs from `previous`; returns the new count."""
+    started = time.perf_counter()
+    try:
+        await page.wait_for_function(
+            "([sel, prev]) => document.querySelectorAll(sel).length !== prev",
+            arg=[selector, previous], timeout=tuned_timeout(label, timeout_ms)
+        )
+        _record(label, started, True)
+    except Exception:
+        _record(label, started, False)
+    try:
+        return await page.locator(selector).count()
+    except Exception:
+        return previous
+
+
+async def wait_for_network_idle(page: Page, label: str, timeout_ms: int = 5000) -> bool:
+    """Waits for in-flight XHR/fetch traffic to settle (Playwright 'networkidle')."""
+    started = time.perf_counter()
+    try:
+        await page.wait_for_load_state("networkidle", timeout=tuned_timeout(label, timeout_ms))
+        _record(label, started, True)
+        return True
+    except Exception:
+        _record(label, started, False)
+        return False
+
+
+def wait_summary() -> Dict[str, Dict[str, float]]:
+    """Per-label sample count, mean/p95 wait (ms), and timeouts."""
+    summary = {}
+    for label, samples in WAIT_TIMINGS.items():
+        if not samples:
+            continue
+        ordered = sorted(samples)
+        summary[label] = {
+            'samples': len(ordered),
+            'mean_ms': round(sum(ordered) / len(ordered), 1),
+            'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1),
+            'timeouts': WAIT_TIMEOUTS[label],
+        }
+    return summary
+
+
+def print_wait_summary(prefix: Optional[str] = None):
+    summary = wait_summary()
+    if not summary:
+        return
+    print(f"    [Waits]{' ' + prefix if prefix else ''}")
+    for label, s in sorted(summary.items()):
+        print(f"      {label}: n={s['samples']} mean={s['mean_ms']}ms p95={s['p95_ms']}ms timeouts={s['timeouts']}")
@@ -0,0 +1,69 @@
+# artifact_registry.py: Process-wide cache for model and weight artifacts.
+# Refactored for Clean Architecture (v2.7)
+# This script loads each artifact once and reloads it only when the file changes.
+
+"""
+Artifact Registry Module
+Prediction used to unpickle the ML models and re-parse learning_weights.json
+once per fixture. The registry keeps the loaded object per path, keyed by a
+stamp of (mtime_ns, size, version):
+- a changed file on disk (retraining, weight updates) is picked up on the
+  next lookup (hot reload),
+- writers in this process call bump() so a rewrite is seen even when the
+  filesystem's mtime resolution hides it.
+Artifacts loaded before worker processes are forked (warm()) are inherited
+copy-on-write, so workers share them instead of loading their own copies.
+"""
+
+import os
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class ArtifactRegistry:
+    """path -> loaded artifact, reloaded when the file's stamp changes."""
+
+    def __init__(self):
+        self._cache: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+        self._versions: Dict[str, int] = {}
+        self.stats = {'hits': 0, 'loads': 0, 'reloads': 0}
+
+    def _stamp(self, path: str) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, self._versions.get(path, 0))
+
+    def get(self, path: str, loader: Callable[[str], Any]) -> Any:
+        """Cached artifact at `path`, (re)loaded with `loader(path)` when new or changed. None if missing."""
+        stamp = self._stamp(path)
+        if stamp is None:
+            self._cache.pop(path, None)
+            return None
+
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            self.stats['hits'] += 1
+            return cached[1]
+
+        value = loader(path)
+        self._cache[path] = (stamp, value)
+        if cached is None:
+            self.stats['loads'] += 1
+        else:
+            self.stats['reloads'] += 1
+            print(f"    [Artifacts] Reloaded {os.path.basename(path)} (changed on disk).")
+        return value
+
+    def bump(self, path: str):
+        """Marks an artifact as rewritten by this process."""
+        self._versions[path] = self._versions.get(path, 0) + 1
+
+    def invalidate(self, path: Optional[str] = None):
+        if path is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(path, None)
+
+
+artifact_registry = ArtifactRegistry()
@@ -0,0 +1,246 @@
+# feature_frame.py: Columnar feature extraction for batch rule analysis.
+# Refactored for Clean Architecture (v2.7)
+# This script turns N vision_data inputs into padded NumPy arrays.
+
+"""
+Feature Frame Module
+Parses the per-fixture form, H2H and standings inputs used by
+RuleEngine.analyze into fixed-shape arrays (one row per fixture) so that
+RuleEngine.analyze_batch can compute tags, goal distributions and the
+weighted vote with array operations. Parsing mirrors TagGenerator and
+GoalPredictor exactly, including their quirks (raw home/away goals in form
+tags, unparseable scores skipped only by the goal distribution).
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+from .tag_generator import TagGenerator
+from .rule_config import RuleConfig
+
+FORM_WIDTH = 10
+
+# Result codes
+RES_W, RES_D, RES_L = 0, 1, 2
+# H2H winner codes (from the fixture's perspective)
+H2H_HOME, H2H_AWAY, H2H_OTHER = 0, 1, 2
+# Opponent strength codes (-1 = opponent not in standings)
+STRENGTHS = ('top', 'mid', 'bottom')
+
+
+class _FormBlock:
+    """Padded last-10 arrays for one side (home or away) of every fixture."""
+
+    def __init__(self, n: int):
+        self.present = np.zeros((n, FORM_WIDTH), dtype=bool)
+        self.parsed = np.zeros((n, FORM_WIDTH), dtype=bool)
+        self.raw_home = np.zeros((n, FORM_WIDTH), dtype=np.int64)  # 0 when unparseable (TagGenerator)
+        self.raw_away = np.zeros((n, FORM_WIDTH), dtype=np.int64)
+        self.team_is_home = np.zeros((n, FORM_WIDTH), dtype=bool)
+        self.result = np.full((n, FORM_WIDTH), RES_L, dtype=np.int8)
+        self.strength = np.full((n, FORM_WIDTH), -1, dtype=np.int8)
+        self.n = np.zeros(n, dtype=np.int64)
+
+
+class FeatureFrame:
+    """Columnar per-fixture inputs for RuleEngine.analyze_batch."""
+
+    def __init__(self, n: int, h2h_width: int):
+        self.n = n
+        self.vision_data: List[Optional[Dict[str, Any]]] = [None] * n
+        self.home_team: List[str] = [""] * n
+        self.away_team: List[str] = [""] * n
+        self.home_slug: List[str] = [""] * n
+        self.away_slug: List[str] = [""] * n
+        self.region_league: List[str] = [""] * n
+        self.home_form_matches: List[List[Dict]] = [[] for _ in range(n)]
+        self.away_form_matches: List[List[Dict]] = [[] for _ in range(n)]
+        self.h2h_matches: List[List[Dict]] = [[] for _ in range(n)]
+
+        self.home = _FormBlock(n)
+        self.away = _FormBlock(n)
+
+        self.h2h_present = np.zeros((n, h2h_width), dtype=bool)
+        self.h2h_parsed = np.zeros((n, h2h_width), dtype=bool)
+        self.h2h_goals = np.zeros((n, h2h_width), dtype=np.int64)
+        self.h2h_btts = np.zeros((n, h2h_width), dtype=bool)
+        self.h2h_winner = np.full((n, h2h_width), H2H_OTHER, dtype=np.int8)
+        self.h2h_n = np.zeros(n, dtype=np.int64)
+
+        self.has_standings = np.zeros(n, dtype=bool)
+        self.league_size = np.zeros(n, dtype=np.float64)
+        self.home_rank = np.zeros(n, dtype=np.float64)
+        self.away_rank = np.zeros(n, dtype=np.float64)
+        self.home_gd = np.zeros(n, dtype=np.float64)
+        self.away_gd = np.zeros(n, dtype=np.float64)
+
+        # Rows whose inputs hit an edge the array path does not model (colliding
+        # slugs, non-numeric standings, parse errors); these run through analyze().
+        self.scalar_only = np.zeros(n, dtype=bool)
+
+        # Slug substrings that decide the "vs_top ... _w" form signal
+        self.home_slug_vs_top = np.zeros(n, dtype=bool)
+        self.home_slug_w = np.zeros(n, dtype=bool)
+        self.away_slug_vs_top = np.zeros(n, dtype=bool)
+        self.away_slug_w = np.zeros(n, dtype=bool)
+
+    @staticmethod
+    def filter_h2h(h2h_raw: List[Dict], cutoff: datetime) -> List[Dict]:
+        """Applies RuleEngine's H2H lookback filter (unparseable dates are kept)."""
+        h2h = []
+        for m in h2h_raw:
+            if not m:
+                continue
+            try:
+                date_str = m.get("date", "")
+                if date_str:
+                    if "-" in date_str and len(date_str.split("-")[0]) == 4:
+                        d = datetime.strptime(date_str, "%Y-%m-%d")
+                    else:
+                        d = datetime.strptime(date_str, "%d.%m.%Y")
+                    if d >= cutoff:
+                        h2h.append(m)
+            except:
+                h2h.append(m)  # keep if date parse fails
+        return h2h
+
+    @staticmethod
+    def _parse_score(score) -> Optional[tuple]:
+        try:
+            gf, ga = map(int, score.replace(" ", "").split("-"))
+            return gf, ga
+        except:
+            return None
+
+    @staticmethod
+    def _fill_form(block: _FormBlock, row: int, matches: List[Dict], team: str,
+                   team_to_rank: Dict[str, Any], league_size: int):
+        block.n[row] = len(matches)
+        for j, m in enumerate(matches):
+            block.present[row, j] = True
+            parsed = FeatureFrame._parse_score(m.get("score", "0-0"))
+            if parsed is not None:
+                block.parsed[row, j] = True
+                block.raw_home[row, j], block.raw_away[row, j] = parsed
+
+            home = m.get("home", "")
+            away = m.get("away", "")
+            winner = m.get("winner", "")
+            block.team_is_home[row, j] = home == team
+            if winner == "Draw":
+                block.result[row, j] = RES_D
+            elif (winner == "Home" and home == team) or (winner == "Away" and away == team):
+                block.result[row, j] = RES_W
+
+            opponent = away if home == team else home
+            if opponent in team_to_rank:
+                strength = TagGenerator.classify_opponent_strength(team_to_rank[opponent], league_size)
+                block.strength[row, j] = STRENGTHS.index(strength)
+
+    @staticmethod
+    def _needs_scalar(home_slug: str, away_slug: str, standings: List[Dict]) -> bool:
+        """True when tag strings could collide or standings are not plain numbers."""
+        if home_slug == away_slug or home_slug.startswith("H2H") or away_slug.startswith("H2H"):
+            return True
+        if "_WINS_H2H" in home_slug or "_WINS_H2H" in away_slug:
+            return True
+        for t in standings:
+            if not isinstance(t.get("position"), (int, float)):
+                return True
+            gd = t.get("goal_difference", (t.get("goals_for") or 0) - (t.get("goals_against") or 0))
+            if not isinstance(gd, (int, float)):
+                return True
+        return False
+
+    @staticmethod
+    def from_vision_data(items: List[Dict[str, Any]], config: RuleConfig) -> 'FeatureFrame':
+        """
+        Builds the frame for fixtures that have both teams. Callers are
+        expected to have filtered out the rest (analyze returns SKIP for them).
+        """
+        cutoff = datetime.now() - timedelta(days=config.h2h_lookback_days)
+        parsed_inputs = []
+        for vision_data in items:
+            try:
+                h2h_data = vision_data.get("h2h_data", {})
+                home_form = [m for m in h2h_data.get("home_last_10_matches", []) if m][:FORM_WIDTH]
+                away_form = [m for m in h2h_data.get("away_last_10_matches", []) if m][:FORM_WIDTH]
+                h2h = FeatureFrame.filter_h2h(h2h_data.get("head_to_head", []), cutoff)
+                parsed_inputs.append((vision_data, h2h_data, home_form, away_form, h2h))
+            except Exception:
+                parsed_inputs.append(None)
+
+        h2h_width = max([len(p[4]) for p in parsed_inputs if p] + [1])
+        frame = FeatureFrame(len(items), h2h_width)
+
+        for row, parsed_input in enumerate(parsed_inputs):
+            if parsed_input is None:
+                frame.scalar_only[row] = True
+                continue
+            vision_data, h2h_data, home_form, away_form, h2h = parsed_input
+            try:
+                standings = vision_data.get("standings", [])
+                home_team = h2h_data.get("home_team")
+                away_team = h2h_data.get("away_team")
+                home_slug = home_team.replace(" ", "_").upper()
+                away_slug = away_team.replace(" ", "_").upper()
+
+                frame.vision_data[row] = vision_data
+                frame.home_team[row] = home_team
+                frame.away_team[row] = away_team
+                frame.home_slug[row] = home_slug
+                frame.away_slug[row] = away_slug
+                frame.region_league[row] = h2h_data.get("region_league", "GLOBAL")
+                frame.home_form_matches[row] = home_form
+                frame.away_form_matches[row] = away_form
+                frame.h2h_matches[row] = h2h
+
+                frame.home_slug_vs_top[row] = "vs_top" in home_slug.lower()
+                frame.home_slug_w[row] = "_w" in home_slug.lower()
+                frame.away_slug_vs_top[row] = "vs_top" in away_slug.lower()
+                frame.away_slug_w[row] = "_w" in away_slug.lower()
+
+                # Form (TagGenerator.generate_form_tags / GoalPredictor inputs)
+                team_to_rank = {t["team_name"]: t["position"] for t in standings}
+                form_league_size = len(standings) or 20
+                FeatureFrame._fill_form(frame.home, row, home_form, home_team, team_to_rank, form_league_size)
+                FeatureFrame._fill_form(frame.away, row, away_form, away_team, team_to_rank, form_league_size)
+
+                # H2H (TagGenerator.generate_h2h_tags)
+                frame.h2h_n[row] = len(h2h)
+                for j, m in enumerate(h2h):
+                    frame.h2h_present[row, j] = True
+                    parsed = FeatureFrame._parse_score(m.get("score", "0-0"))
+                    if parsed is None:
+                        continue
+                    hg, ag = parsed
+                    frame.h2h_parsed[row, j] = True
+                    frame.h2h_goals[row, j] = hg + ag
+                    frame.h2h_btts[row, j] = hg > 0 and ag > 0
+                    if (m.get("winner") == "Home" and m.get("home") == home_team) or \
+                       (m.get("winner") == "Away" and m.get("away") == home_team):
+                        frame.h2h_winner[row, j] = H2H_HOME
+                    elif (m.get("winner") == "Home" and m.get("home") == away_team) or \
+                         (m.get("winner") == "Away" and m.get("away") == away_team):
+                        frame.h2h_winner[row, j] = H2H_AWAY
+
+                # Standings (TagGenerator.generate_standings_tags)
+                if standings:
+                    rank = team_to_rank
+                    gd = {t["team_name"]: t.get("goal_difference", (t.get("goals_for") or 0) - (t.get("goals_against") or 0)) for t in standings}
+                    frame.has_standings[row] = True
+                    frame.league_size[row] = len(standings)
+                    frame.home_rank[row] = rank.get(home_team, 999)
+                    frame.away_rank[row] = rank.get(away_team, 999)
+                    frame.home_gd[row] = gd.get(home_team, 0)
+                    frame.away_gd[row] = gd.get(away_team, 0)
+            except Exception:
+                frame.scalar_only[row] = True
+                continue
+
+            if FeatureFrame._needs_scalar(home_slug, away_slug, standings):
+                frame.scalar_only[row] = True
+
+        return frame
@@ -10,6 +10,8 @@ Predicts goal distributions and expected goals (xG) for teams.
 from typing import List, Dict, Any
 from collections import Counter
 
+from . import poisson_kernel
+
 
 class GoalPredictor:
     """Predicts goal distributions and expected goals for team analysis"""
@@ -101,31 +103,23 @@ class GoalPredictor:
         }
 
     @staticmethod
-    def predict_score_probabilities(home_xg: float, away_xg: float) -> List[Dict[str, Any]]:
+    def predict_score_probabilities(home_xg: float, away_xg: float,
+                                    rho: float = poisson_kernel.DIXON_COLES_RHO) -> List[Dict[str, Any]]:
         """
         Predict most probable scores based on expected goals.
-        Uses Poisson distribution approximation.
+        Uses the Poisson kernel (scores up to 5-5, optional Dixon-Coles rho).
         """
-        import math
-
-        scores = []
-        max_goals = 5  # Consider scores up to 5-5
-
-        for home_goals in range(max_goals + 1):
-            for away_goals in range(max_goals + 1):
-                # Poisson probability for each score
-                home_prob = math.exp(-home_xg) * (home_xg ** home_goals) / math.factorial(home_goals)
-                away_prob = math.exp(-away_xg) * (away_xg ** away_goals) / math.factorial(away_goals)
-                total_prob = home_prob * away_prob
-
-                if total_prob > 0.01:  # Only include reasonably probable scores
-                    score_str = f"{home_goals}-{away_goals}"
-                    scores.append({
-                        "score": score_str,
-                        "probability": round(total_prob, 4),
-                        "home_goals": home_goals,
-                        "away_goals": away_goals
-                    })
+        matrix = poisson_kernel.score_matrix(home_xg, away_xg, max_goals=5, rho=rho)[0]
+
+        scores = [
+            {
+                "score": f"{home_goals}-{away_goals}",
+                "probability": round(prob, 4),
+                "home_goals": home_goals,
+                "away_goals": away_goals
+            }
+            for home_goals, away_goals, prob in poisson_kernel.scoreline_list(matrix, min_prob=0.01)  # Only reasonably probable scores
+        ]
 
         # Sort by probability (highest first)
         scores.sort(key=lambda x: x["probability"], reverse=True)
@@ -15,10 +15,11 @@ Handles prediction learning, performance analysis, and weight adaptation with re
 
 import json
 import os
-import csv
 from collections import defaultdict
 from typing import Dict, Any, List, Tuple
 
+from .artifact_registry import artifact_registry
+
 class LearningEngine:
     """Self-learning component that analyzes prediction performance and adjusts weights per region/league."""
 
@@ -65,23 +66,26 @@ class LearningEngine:
         }
     }
 
+    @staticmethod
+    def _read_all_weights(path: str) -> Dict[str, Any]:
+        try:
+            with open(path, 'r') as f:
+                all_weights = json.load(f)
+        except:
+            return {}
+        # If the file is the old flat format, migrate it to the new structure
+        if "h2h_home_win" in all_weights:
+            all_weights = {"GLOBAL": all_weights}
+        return all_weights
+
     @staticmethod
     def load_weights(region_league: str = "GLOBAL") -> Dict[str, Any]:
         """
         Load learned weights for a specific region/league.
         Falls back to GLOBAL if specific weights don't exist.
+        The file is parsed once and re-read only when it changes.
         """
-        all_weights = {}
-        if os.path.exists(LearningEngine.LEARNING_DB):
-            try:
-                with open(LearningEngine.LEARNING_DB, 'r') as f:
-                    all_weights = json.load(f)
-            except:
-                pass
-        
-        # If the file is the old flat format, migrate it to the new structure
-        if "h2h_home_win" in all_weights:
-            all_weights = {"GLOBAL": all_weights}
+        all_weights = artifact_registry.get(LearningEngine.LEARNING_DB, LearningEngine._read_all_weights) or {}
 
         # 1. Try exact match
         if region_league in all_weights:
@@ -95,16 +99,20 @@ class LearningEngine:
         # 3. Fallback to GLOBAL
         return LearningEngine._merge_defaults(all_weights.get("GLOBAL", {}))
 
+    @staticmethod
+    def warm():
+        """Loads the weights file before worker processes fork, so they inherit it."""
+        artifact_registry.get(LearningEngine.LEARNING_DB, LearningEngine._read_all_weights)
+
     @staticmethod
     def _merge_defaults(weights: Dict[str, Any]) -> Dict[str, Any]:
-        """Ensure all keys exist by merging with defaults."""
+        """Ensure all keys exist by merging with defaults. Neither input is modified (both are shared)."""
         merged = LearningEngine.DEFAULT_WEIGHTS.copy()
         # Deep merge for confidence_calibration
-        if "confidence_calibration" in weights:
-            merged["confidence_calibration"].update(weights["confidence_calibration"])
-            del weights["confidence_calibration"]
-            
-        merged.update(weights)
+        merged["confidence_calibration"] = dict(LearningEngine.DEFAULT_WEIGHTS["confidence_calibration"])
+        merged["confidence_calibration"].update(weights.get("confidence_calibration", {}))
+
+        merged.update({k: v for k, v in weights.items() if k != "confidence_calibration"})
         return merged
 
     @staticmethod
@@ -113,6 +121,7 @@ class LearningEngine:
         os.makedirs("Data/Store", exist_ok=True)
         with open(LearningEngine.LEARNING_DB, 'w') as f:
             json.dump(all_weights, f, indent=2)
+        artifact_registry.bump(LearningEngine.LEARNING_DB)
 
     @staticmethod
     def analyze_performance() -> Tuple[Dict[str, Dict[str, Dict[str, int]]], Dict[str, Dict[str, Dict[str, int]]]]:
@@ -121,7 +130,7 @@ class LearningEngine:
         Returns: (rule_performance, confidence_performance)
         where each is { RegionLeague: { Key: { 'correct': int, 'total': int } } }
         """
-        from Data.Access.db_helpers import PREDICTIONS_CSV
+        from Data.Access.db_helpers import PREDICTIONS_CSV, _read_csv
         
         if not os.path.exists(PREDICTIONS_CSV):
             return {}, {}
@@ -133,34 +142,32 @@ class LearningEngine:
         conf_performance = defaultdict(lambda: defaultdict(lambda: {"correct": 0, "total": 0}))
 
         try:
-            with open(PREDICTIONS_CSV, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Only analyze resolved matches
-                    if row.get('outcome_correct') not in ['True', 'False']:
-                        continue
-                        
-                    is_correct = row.get('outcome_correct') == 'True'
-                    region_league = row.get('region_league', 'Unknown')
-                    prediction_conf = row.get('confidence', 'Medium')
-                    reasoning_text = row.get('reason', '')
+            for row in _read_csv(PREDICTIONS_CSV):
+                # Only analyze resolved matches
+                if row.get('outcome_correct') not in ['True', 'False']:
+                    continue
                     
-                    # Track confidence accuracy
-                    conf_performance[region_league][prediction_conf]["total"] += 1
-                    conf_performance["GLOBAL"][prediction_conf]["total"] += 1
-                    if is_correct:
-                        conf_performance[region_league][prediction_conf]["correct"] += 1
-                        conf_performance["GLOBAL"][prediction_conf]["correct"] += 1
-
-                    # Track rule accuracy based on reasoning text
-                    for phrase, rule_key in LearningEngine.REASON_TO_RULE_MAP.items():
-                        if phrase in reasoning_text:
-                            performance[region_league][rule_key]["total"] += 1
-                            performance["GLOBAL"][rule_key]["total"] += 1
-                            if is_correct:
-                                performance[region_league][rule_key]["correct"] += 1
-                                performance["GLOBAL"][rule_key]["correct"] += 1
-                                
+                is_correct = row.get('outcome_correct') == 'True'
+                region_league = row.get('region_league', 'Unknown')
+                prediction_conf = row.get('confidence', 'Medium')
+                reasoning_text = row.get('reason', '')
+                
+                # Track confidence accuracy
+                conf_performance[region_league][prediction_conf]["total"] += 1
+                conf_performance["GLOBAL"][prediction_conf]["total"] += 1
+                if is_correct:
+                    conf_performance[region_league][prediction_conf]["correct"] += 1
+                    conf_performance["GLOBAL"][prediction_conf]["correct"] += 1
+
+                # Track rule accuracy based on reasoning text
+                for phrase, rule_key in LearningEngine.REASON_TO_RULE_MAP.items():
+                    if phrase in reasoning_text:
+                        performance[region_league][rule_key]["total"] += 1
+                        performance["GLOBAL"][rule_key]["total"] += 1
+                        if is_correct:
+                            performance[region_league][rule_key]["correct"] += 1
+                            performance["GLOBAL"][rule_key]["correct"] += 1
+                            
         except Exception as e:
             print(f"Error analyzing performance: {e}")
             return {}, {}
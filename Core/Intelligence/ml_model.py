@@ -11,9 +11,11 @@ Responsible for ensemble ML-based prediction capabilities.
 import os
 import joblib
 import numpy as np
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 
+from .artifact_registry import artifact_registry
+
 
 class MLModel:
     """Machine Learning component for ensemble predictions"""
@@ -114,21 +116,18 @@ class MLModel:
     @staticmethod
     def train_models() -> bool:
         """Train ML models using historical prediction data"""
-        from Data.Access.db_helpers import PREDICTIONS_CSV
-        import csv
+        from Data.Access.db_helpers import PREDICTIONS_CSV, _read_csv
 
         if not os.path.exists(PREDICTIONS_CSV):
             return False
 
         # Load historical data
         data = []
-        with open(PREDICTIONS_CSV, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row.get('outcome_correct') in ['True', 'False']:
-                    # We need to reconstruct features from stored data
-                    # This is a simplified version - in practice you'd store features
-                    data.append(row)
+        for row in _read_csv(PREDICTIONS_CSV):
+            if row.get('outcome_correct') in ['True', 'False']:
+                # We need to reconstruct features from stored data
+                # This is a simplified version - in practice you'd store features
+                data.append(row)
 
         if len(data) < 50:  # Need minimum data for training
             return False
@@ -158,11 +157,13 @@ class MLModel:
         rf = RandomForestClassifier(n_estimators=100, random_state=42)
         rf.fit(X, y)
         joblib.dump(rf, os.path.join(MLModel.MODEL_DIR, 'random_forest.pkl'))
+        artifact_registry.bump(os.path.join(MLModel.MODEL_DIR, 'random_forest.pkl'))
 
         # Gradient Boosting
         gb = GradientBoostingClassifier(n_estimators=100, random_state=42)
         gb.fit(X, y)
         joblib.dump(gb, os.path.join(MLModel.MODEL_DIR, 'gradient_boosting.pkl'))
+        artifact_registry.bump(os.path.join(MLModel.MODEL_DIR, 'gradient_boosting.pkl'))
 
         # Cross-validation scores
         from sklearn.model_selection import cross_val_score
@@ -172,19 +173,24 @@ class MLModel:
         print(f"ML Models trained - RF: {rf_scores.mean():.3f}, GB: {gb_scores.mean():.3f}")
         return True
 
+    @staticmethod
+    def load_models() -> Optional[tuple]:
+        """(rf, gb) from the artifact registry (unpickled once, reloaded on change), or None if untrained."""
+        rf = artifact_registry.get(os.path.join(MLModel.MODEL_DIR, 'random_forest.pkl'), joblib.load)
+        gb = artifact_registry.get(os.path.join(MLModel.MODEL_DIR, 'gradient_boosting.pkl'), joblib.load)
+        if rf is None or gb is None:
+            return None
+        return rf, gb
+
     @staticmethod
     def predict(features: Dict[str, Any]) -> Dict[str, Any]:
         """Make ML predictions using ensemble of trained models"""
-        rf_path = os.path.join(MLModel.MODEL_DIR, 'random_forest.pkl')
-        gb_path = os.path.join(MLModel.MODEL_DIR, 'gradient_boosting.pkl')
-
-        if not (os.path.exists(rf_path) and os.path.exists(gb_path)):
-            return {"confidence": 0.5, "prediction": "UNKNOWN"}
-
         try:
             # Load models
-            rf = joblib.load(rf_path)
-            gb = joblib.load(gb_path)
+            models = MLModel.load_models()
+            if models is None:
+                return {"confidence": 0.5, "prediction": "UNKNOWN"}
+            rf, gb = models
 
             # Prepare feature vector
             feature_vector = np.array([[features.get(f, 0) for f in MLModel.FEATURES]])
@@ -206,3 +212,39 @@ class MLModel:
         except Exception as e:
             print(f"ML Prediction error: {e}")
             return {"confidence": 0.5, "prediction": "UNKNOWN"}
+
+    @staticmethod
+    def predict_batch(features_list: List[Optional[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Batch variant of predict: scores all rows in one predict_proba call.
+        Rows without features get the neutral default.
+        """
+        default = {"confidence": 0.5, "prediction": "UNKNOWN"}
+        results: List[Dict[str, Any]] = [dict(default) for _ in features_list]
+        rows = [i for i, f in enumerate(features_list) if f]
+
+        if not rows:
+            return results
+
+        try:
+            models = MLModel.load_models()
+            if models is None:
+                return results
+            rf, gb = models
+
+            matrix = np.array([[features_list[i].get(f, 0) for f in MLModel.FEATURES] for i in rows])
+            rf_preds = rf.predict_proba(matrix)[:, 1]
+            gb_preds = gb.predict_proba(matrix)[:, 1]
+
+            for i, rf_pred, gb_pred in zip(rows, rf_preds, gb_preds):
+                ensemble_confidence = (rf_pred + gb_pred) / 2
+                results[i] = {
+                    "confidence": ensemble_confidence,
+                    "rf_confidence": rf_pred,
+                    "gb_confidence": gb_pred,
+                    "prediction": "HIGH" if ensemble_confidence > 0.6 else "MEDIUM" if ensemble_confidence > 0.4 else "LOW"
+                }
+        except Exception as e:
+            print(f"ML Prediction error: {e}")
+
+        return results
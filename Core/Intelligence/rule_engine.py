@@ -17,9 +17,13 @@ from .ml_model import MLModel
 from .tag_generator import TagGenerator
 from .goal_predictor import GoalPredictor
 from .betting_markets import BettingMarkets
+from .feature_frame import FeatureFrame, RES_W, RES_D, RES_L, H2H_HOME, H2H_AWAY, H2H_OTHER, STRENGTHS
 
 from .rule_config import RuleConfig
 
+# TagGenerator.generate_form_tags count keys, in insertion order
+FORM_KEYS = ['SNG', 'CS', 'S1+', 'S2+', 'S3+', 'C1+', 'C2+', 'C3+', 'W', 'D', 'L']
+
 class RuleEngine:
     @staticmethod
     def analyze(vision_data: Dict[str, Any], config: RuleConfig = None) -> Dict[str, Any]:
@@ -159,6 +163,370 @@ class RuleEngine:
                     scores.append({"score": f"{hg.replace('3+', '3+')}-{ag.replace('3+', '3+')}", "prob": round(p, 3)})
         scores.sort(key=lambda x: x["prob"], reverse=True)
 
+        return RuleEngine._finalize(
+            home_team, away_team, home_score, away_score, draw_score, btts_prob, over25_prob,
+            scores, home_xg, away_xg, reasoning, weights, ml_prediction.get("confidence", 0.5),
+            home_tags, away_tags, h2h_tags, standings_tags, len(h2h), len(home_form), len(away_form)
+        )
+
+    # --- Batch mode ---
+
+    @staticmethod
+    def analyze_batch(vision_data_list: List[Dict[str, Any]], config: RuleConfig = None) -> List[Dict[str, Any]]:
+        """
+        Vectorized analyze() for N fixtures. Inputs are parsed once into a
+        columnar FeatureFrame; tags, goal distributions, xG and the weighted
+        vote are computed with NumPy, the ML ensemble is scored in one call and
+        weights are loaded once per league. Market selection shares _finalize
+        with analyze(), so each result equals analyze(vision_data, config).
+        Fixtures that make analyze() raise yield a SKIP entry instead of
+        aborting the batch.
+        """
+        if config is None:
+            config = RuleConfig()
+
+        results: List[Dict[str, Any]] = [None] * len(vision_data_list)
+        batch_rows = []
+        for i, vision_data in enumerate(vision_data_list):
+            try:
+                h2h_data = vision_data.get("h2h_data", {})
+                if not h2h_data.get("home_team") or not h2h_data.get("away_team"):
+                    results[i] = {"type": "SKIP", "confidence": "Low", "reason": "Missing teams"}
+                    continue
+            except Exception as e:
+                results[i] = RuleEngine._batch_error(e)
+                continue
+            batch_rows.append(i)
+
+        if not batch_rows:
+            return results
+
+        frame = FeatureFrame.from_vision_data([vision_data_list[i] for i in batch_rows], config)
+
+        ml_features = []
+        for row in range(frame.n):
+            try:
+                ml_features.append(None if frame.scalar_only[row] else MLModel.prepare_features(frame.vision_data[row]))
+            except Exception:
+                frame.scalar_only[row] = True
+                ml_features.append(None)
+        ml_predictions = MLModel.predict_batch(ml_features)
+
+        weights_cache: Dict[str, Dict[str, Any]] = {}
+        sig = RuleEngine._batch_signals(frame, config)
+
+        for row, i in enumerate(batch_rows):
+            if frame.scalar_only[row]:
+                try:
+                    results[i] = RuleEngine.analyze(vision_data_list[i], config=config)
+                except Exception as e:
+                    results[i] = RuleEngine._batch_error(e)
+                continue
+
+            try:
+                region_league = frame.region_league[row]
+                if region_league not in weights_cache:
+                    weights_cache[region_league] = LearningEngine.load_weights(region_league)
+
+                results[i] = RuleEngine._finalize(
+                    frame.home_team[row], frame.away_team[row],
+                    float(sig["home_score"][row]), float(sig["away_score"][row]), float(sig["draw_score"][row]),
+                    float(sig["btts_prob"][row]), float(sig["over25_prob"][row]),
+                    RuleEngine._batch_scores(sig["score_grid"][row]),
+                    float(sig["home_xg"][row]), float(sig["away_xg"][row]),
+                    RuleEngine._batch_reasoning(frame, sig, row),
+                    weights_cache[region_league], ml_predictions[row].get("confidence", 0.5),
+                    RuleEngine._batch_form_tags(frame.home_slug[row], sig["home_form"], row),
+                    RuleEngine._batch_form_tags(frame.away_slug[row], sig["away_form"], row),
+                    RuleEngine._batch_h2h_tags(frame, sig, row),
+                    RuleEngine._batch_standings_tags(frame, sig, row),
+                    int(frame.h2h_n[row]), int(frame.home.n[row]), int(frame.away.n[row])
+                )
+            except Exception as e:
+                results[i] = RuleEngine._batch_error(e)
+
+        return results
+
+    @staticmethod
+    def _batch_error(e: Exception) -> Dict[str, Any]:
+        return {"type": "SKIP", "confidence": "Low", "reason": f"Analysis error: {e}"}
+
+    @staticmethod
+    def _threshold(counts: np.ndarray, total: np.ndarray, majority: bool) -> np.ndarray:
+        """Array form of TagGenerator.check_threshold ('majority' or 'third')."""
+        if majority:
+            return (total > 0) & (counts >= total // 2 + 1)
+        return (total > 0) & (counts >= np.maximum(3, total // 3))
+
+    @staticmethod
+    def _batch_form(block, slug_vs_top: np.ndarray, slug_w: np.ndarray) -> Dict[str, np.ndarray]:
+        """Form tag flags (TagGenerator.generate_form_tags) for one side of every fixture."""
+        gf, ga, res = block.raw_home, block.raw_away, block.result
+        hits = np.stack([
+            gf == 0, ga == 0, gf >= 1, gf >= 2, gf >= 3, ga >= 1, ga >= 2, ga >= 3,
+            res == RES_W, res == RES_D, res == RES_L
+        ], axis=-1) & block.present[..., None]                           # (N, 10, keys)
+
+        n = block.n
+        enough = n >= 3
+        counts = hits.sum(axis=1)                                         # (N, keys)
+        total = n[:, None]
+        base = enough[:, None] & (RuleEngine._threshold(counts, total, True) | RuleEngine._threshold(counts, total, False))
+
+        strength = np.zeros((len(n), len(STRENGTHS), len(FORM_KEYS)), dtype=bool)
+        strength_n = np.zeros((len(n), len(STRENGTHS)), dtype=np.int64)
+        for s in range(len(STRENGTHS)):
+            in_band = block.present & (block.strength == s)
+            s_n = in_band.sum(axis=1)
+            s_counts = (hits & in_band[..., None]).sum(axis=1)
+            strength[:, s, :] = (enough & (s_n >= 2))[:, None] & RuleEngine._threshold(s_counts, s_n[:, None], False)
+            strength_n[:, s] = s_n
+
+        # any(tag has "vs_top" and "_w"): decided by the slug substrings, the
+        # TOP band and the 'W' key (see feature_frame).
+        w = FORM_KEYS.index('W')
+        any_tag = base.any(axis=1) | strength.any(axis=(1, 2))
+        any_w_key = base[:, w] | strength[:, :, w].any(axis=1)
+        vs_top_win = np.where(
+            slug_vs_top,
+            np.where(slug_w, any_tag, any_w_key),
+            np.where(slug_w, strength[:, 0, :].any(axis=1), strength[:, 0, w])
+        )
+        return {"base": base, "strength": strength, "strength_n": strength_n, "enough": enough, "vs_top_win": vs_top_win}
+
+    @staticmethod
+    def _batch_goal_dist(block, is_home_game: bool) -> np.ndarray:
+        """GoalPredictor.predict_goals_distribution 'goals_scored' as (N, 4) for keys 0, 1, 2, 3+."""
+        valid = block.present & block.parsed
+        goals_for = np.where(block.team_is_home, block.raw_home, block.raw_away).astype(np.float64)
+        if is_home_game:
+            goals_for = np.where(~block.team_is_home, np.trunc(goals_for * 1.25), goals_for)
+        else:
+            goals_for = np.where(block.team_is_home, np.trunc(goals_for * 0.80), goals_for)
+        scored = np.minimum(goals_for, 5)
+
+        total = valid.sum(axis=1)
+        total = np.where(total == 0, 1, total)
+        dist = np.stack([
+            (valid & (scored == 0)).sum(axis=1),
+            (valid & (scored == 1)).sum(axis=1),
+            (valid & (scored == 2)).sum(axis=1),
+            (valid & (scored >= 3)).sum(axis=1),
+        ], axis=-1) / total[:, None]
+
+        no_matches = block.n == 0
+        dist[no_matches] = [0.4, 0.3, 0.2, 0.1]
+        return dist
+
+    @staticmethod
+    def _batch_signals(frame: FeatureFrame, config: RuleConfig) -> Dict[str, Any]:
+        """All numeric per-fixture signals, in the accumulation order used by analyze()."""
+        home_form = RuleEngine._batch_form(frame.home, frame.home_slug_vs_top, frame.home_slug_w)
+        away_form = RuleEngine._batch_form(frame.away, frame.away_slug_vs_top, frame.away_slug_w)
+        home_tags = home_form["base"]
+        away_tags = away_form["base"]
+        k = FORM_KEYS.index
+
+        # H2H counts (unparseable scores count towards N only)
+        parsed = frame.h2h_parsed
+        h2h_counts = np.stack([
+            (parsed & (frame.h2h_winner == H2H_HOME)).sum(axis=1),
+            (parsed & (frame.h2h_winner == H2H_AWAY)).sum(axis=1),
+            (parsed & (frame.h2h_winner == H2H_OTHER)).sum(axis=1),
+            (parsed & (frame.h2h_goals > 2)).sum(axis=1),
+            (parsed & (frame.h2h_goals <= 2)).sum(axis=1),
+            (parsed & frame.h2h_btts).sum(axis=1),
+        ], axis=-1)
+        h2h_total = frame.h2h_n[:, None]
+        h2h_major = RuleEngine._threshold(h2h_counts, h2h_total, True)
+        h2h_third = ~h2h_major & RuleEngine._threshold(h2h_counts, h2h_total, False)
+        h2h_any = h2h_major | h2h_third
+
+        # Standings flags
+        has = frame.has_standings
+        hr, ar, size = frame.home_rank, frame.away_rank, frame.league_size
+        hgd, agd = frame.home_gd, frame.away_gd
+        standings = {
+            "home_top3": has & (hr <= 3), "home_bottom5": has & (hr > size - 5),
+            "away_top3": has & (ar <= 3), "away_bottom5": has & (ar > size - 5),
+            "home_gd_pos": has & (hgd > 0), "home_gd_neg": has & (hgd < 0),
+            "away_gd_pos": has & (agd > 0), "away_gd_neg": has & (agd < 0),
+            "home_adv8": has & (hr < ar - 8), "away_adv8": has & (ar < hr - 8),
+            "home_gd_strong": has & (hgd > 10), "home_gd_weak": has & (hgd < -10),
+            "away_gd_strong": has & (agd > 10), "away_gd_weak": has & (agd < -10),
+        }
+
+        # Goal distributions and xG (same summation order as analyze)
+        home_dist = RuleEngine._batch_goal_dist(frame.home, True)
+        away_dist = RuleEngine._batch_goal_dist(frame.away, False)
+        goal_values = (0.0, 1.0, 2.0, 3.5)
+        home_xg = home_dist[:, 0] * goal_values[0]
+        away_xg = away_dist[:, 0] * goal_values[0]
+        for g in range(1, 4):
+            home_xg = home_xg + home_dist[:, g] * goal_values[g]
+            away_xg = away_xg + away_dist[:, g] * goal_values[g]
+
+        # Weighted vote, conditions in analyze() order
+        xg_home_adv = home_xg > away_xg + 0.5
+        xg_away_adv = ~xg_home_adv & (away_xg > home_xg + 0.5)
+        xg_close = ~xg_home_adv & ~xg_away_adv & (np.abs(home_xg - away_xg) < 0.3)
+
+        home_score = np.zeros(frame.n)
+        away_score = np.zeros(frame.n)
+        draw_score = np.zeros(frame.n)
+
+        def vote(score, cond, weight):
+            return np.where(cond, score + weight, score)
+
+        home_score = vote(home_score, xg_home_adv, config.xg_advantage)
+        away_score = vote(away_score, xg_away_adv, config.xg_advantage)
+        draw_score = vote(draw_score, xg_close, config.xg_draw)
+
+        home_score = vote(home_score, h2h_any[:, 0], config.h2h_home_win)
+        away_score = vote(away_score, h2h_any[:, 1], config.h2h_away_win)
+        draw_score = vote(draw_score, h2h_any[:, 2], config.h2h_draw)
+
+        top_home = standings["home_top3"] & standings["away_bottom5"]
+        top_away = standings["away_top3"] & standings["home_bottom5"]
+        home_score = vote(home_score, top_home, config.standings_top_vs_bottom)
+        away_score = vote(away_score, top_away, config.standings_top_vs_bottom)
+        home_score = vote(home_score, standings["home_adv8"], config.standings_table_advantage)
+        away_score = vote(away_score, standings["away_adv8"], config.standings_table_advantage)
+        home_score = vote(home_score, standings["home_gd_strong"], config.standings_gd_strong)
+        away_score = vote(away_score, standings["away_gd_strong"], config.standings_gd_strong)
+        away_score = vote(away_score, standings["home_gd_weak"], config.standings_gd_weak)
+        home_score = vote(home_score, standings["away_gd_weak"], config.standings_gd_weak)
+
+        home_score = vote(home_score, home_tags[:, k('S2+')], config.form_score_2plus)
+        away_score = vote(away_score, away_tags[:, k('S2+')], config.form_score_2plus)
+        home_score = vote(home_score, home_tags[:, k('S3+')], config.form_score_3plus)
+        away_score = vote(away_score, away_tags[:, k('S3+')], config.form_score_3plus)
+        home_score = vote(home_score, away_tags[:, k('C2+')], config.form_concede_2plus)
+        away_score = vote(away_score, home_tags[:, k('C2+')], config.form_concede_2plus)
+        away_score = vote(away_score, home_tags[:, k('SNG')], config.form_no_score)
+        home_score = vote(home_score, away_tags[:, k('SNG')], config.form_no_score)
+        home_score = vote(home_score, home_tags[:, k('CS')], config.form_clean_sheet)
+        away_score = vote(away_score, away_tags[:, k('CS')], config.form_clean_sheet)
+        home_score = vote(home_score, home_form["vs_top_win"], config.form_vs_top_win)
+        away_score = vote(away_score, away_form["vs_top_win"], config.form_vs_top_win)
+
+        # BTTS / Over 2.5 in analyze()'s pair order (keys 0, 1, 2, 3+)
+        btts_prob = np.zeros(frame.n)
+        over25_prob = np.zeros(frame.n)
+        goal_counts = (0, 1, 2, 3)
+        for h in range(4):
+            for a in range(4):
+                pair = home_dist[:, h] * away_dist[:, a]
+                if h != 0 and a != 0:
+                    btts_prob = btts_prob + pair
+                if goal_counts[h] + goal_counts[a] > 2:
+                    over25_prob = over25_prob + pair
+
+        # Correct-score grid: analyze() only produces 0..2 goals per side
+        score_grid = home_dist[:, :3, None] * away_dist[:, None, :3]
+
+        return {
+            "home_form": home_form, "away_form": away_form,
+            "h2h_major": h2h_major, "h2h_third": h2h_third, "h2h_any": h2h_any,
+            "standings": standings, "top_home": top_home, "top_away": top_away,
+            "home_xg": home_xg, "away_xg": away_xg,
+            "xg_home_adv": xg_home_adv, "xg_away_adv": xg_away_adv, "xg_close": xg_close,
+            "home_score": home_score, "away_score": away_score, "draw_score": draw_score,
+            "btts_prob": btts_prob, "over25_prob": over25_prob, "score_grid": score_grid,
+        }
+
+    @staticmethod
+    def _batch_scores(grid: np.ndarray) -> List[Dict[str, Any]]:
+        scores = []
+        for hg in range(3):
+            for ag in range(3):
+                p = float(grid[hg, ag])
+                if p > 0.03:
+                    scores.append({"score": f"{hg}-{ag}", "prob": round(p, 3)})
+        scores.sort(key=lambda x: x["prob"], reverse=True)
+        return scores
+
+    @staticmethod
+    def _batch_reasoning(frame: FeatureFrame, sig: Dict[str, Any], row: int) -> List[str]:
+        """Rebuilds analyze()'s reasoning list from the signal arrays."""
+        home_team, away_team = frame.home_team[row], frame.away_team[row]
+        st = sig["standings"]
+        hf, af = sig["home_form"]["base"][row], sig["away_form"]["base"][row]
+        k = FORM_KEYS.index
+        checks = [
+            (sig["xg_home_adv"][row], f"{home_team} has xG advantage"),
+            (sig["xg_away_adv"][row], f"{away_team} has xG advantage"),
+            (sig["xg_close"][row], "Close xG suggests draw"),
+            (sig["h2h_any"][row, 0], f"{home_team} strong in H2H"),
+            (sig["h2h_any"][row, 1], f"{away_team} strong in H2H"),
+            (sig["h2h_any"][row, 2], "H2H suggests Draw"),
+            (sig["top_home"][row], f"Top ({home_team}) vs Bottom ({away_team})"),
+            (sig["top_away"][row], f"Top ({away_team}) vs Bottom ({home_team})"),
+            (st["home_gd_strong"][row], f"{home_team} has strong GD"),
+            (st["away_gd_strong"][row], f"{away_team} has strong GD"),
+            (st["home_gd_weak"][row], f"{home_team} has weak GD"),
+            (st["away_gd_weak"][row], f"{away_team} has weak GD"),
+            (hf[k('S2+')], f"{home_team} scores 2+ often"),
+            (af[k('S2+')], f"{away_team} scores 2+ often"),
+            (af[k('C2+')], f"{away_team} concedes 2+ often"),
+            (hf[k('C2+')], f"{home_team} concedes 2+ often"),
+            (hf[k('SNG')], f"{home_team} fails to score"),
+            (af[k('SNG')], f"{away_team} fails to score"),
+            (hf[k('CS')], f"{home_team} has strong defense"),
+            (af[k('CS')], f"{away_team} has strong defense"),
+        ]
+        return [msg for cond, msg in checks if cond]
+
+    @staticmethod
+    def _batch_form_tags(slug: str, form: Dict[str, np.ndarray], row: int) -> List[str]:
+        if not form["enough"][row]:
+            return []
+        tags = [f"{slug}_FORM_{key}" for key, on in zip(FORM_KEYS, form["base"][row]) if on]
+        for s, strength in enumerate(STRENGTHS):
+            if form["strength_n"][row, s] < 2:
+                continue
+            tags.extend(f"{slug}_FORM_{key}_vs_{strength.upper()}"
+                        for key, on in zip(FORM_KEYS, form["strength"][row, s]) if on)
+        return list(set(tags))
+
+    @staticmethod
+    def _batch_h2h_tags(frame: FeatureFrame, sig: Dict[str, Any], row: int) -> List[str]:
+        keys = [f"{frame.home_slug[row]}_WINS_H2H", f"{frame.away_slug[row]}_WINS_H2H",
+                'H2H_D', 'H2H_O25', 'H2H_U25', 'H2H_BTTS']
+        tags = []
+        for c, key in enumerate(keys):
+            if sig["h2h_major"][row, c]:
+                tags.append(key)
+            elif sig["h2h_third"][row, c]:
+                tags.append(f"{key}_third")
+        return list(set(tags))
+
+    @staticmethod
+    def _batch_standings_tags(frame: FeatureFrame, sig: Dict[str, Any], row: int) -> List[str]:
+        if not frame.has_standings[row]:
+            return []
+        st = sig["standings"]
+        home_slug, away_slug = frame.home_slug[row], frame.away_slug[row]
+        ordered = [
+            ("home_top3", f"{home_slug}_TOP3"), ("home_bottom5", f"{home_slug}_BOTTOM5"),
+            ("away_top3", f"{away_slug}_TOP3"), ("away_bottom5", f"{away_slug}_BOTTOM5"),
+            ("home_gd_pos", f"{home_slug}_GD_POS"), ("home_gd_neg", f"{home_slug}_GD_NEG"),
+            ("away_gd_pos", f"{away_slug}_GD_POS"), ("away_gd_neg", f"{away_slug}_GD_NEG"),
+            ("home_adv8", f"{home_slug}_TABLE_ADV8+"), ("away_adv8", f"{away_slug}_TABLE_ADV8+"),
+            ("home_gd_strong", f"{home_slug}_GD_POS_STRONG"), ("home_gd_weak", f"{home_slug}_GD_NEG_WEAK"),
+            ("away_gd_strong", f"{away_slug}_GD_POS_STRONG"), ("away_gd_weak", f"{away_slug}_GD_NEG_WEAK"),
+        ]
+        return list(set(tag for flag, tag in ordered if st[flag][row]))
+
+    @staticmethod
+    def _finalize(
+        home_team: str, away_team: str, home_score: float, away_score: float, draw_score: float,
+        btts_prob: float, over25_prob: float, scores: List[Dict], home_xg: float, away_xg: float,
+        reasoning: List[str], weights: Dict[str, Any], ml_confidence: float,
+        home_tags: List[str], away_tags: List[str], h2h_tags: List[str], standings_tags: List[str],
+        h2h_n: int, home_form_n: int, away_form_n: int
+    ) -> Dict[str, Any]:
+        """Market selection, confidence calibration and sanity checks (shared by analyze and analyze_batch)."""
         # Generate comprehensive betting market predictions
         betting_markets = BettingMarkets.generate_betting_market_predictions(
             home_team, away_team, home_score, away_score, draw_score, btts_prob, over25_prob,
@@ -246,10 +614,10 @@ class RuleEngine:
             "away_tags": away_tags,
             "h2h_tags": h2h_tags,
             "standings_tags": standings_tags,
-            "ml_confidence": ml_prediction.get("confidence", 0.5),
+            "ml_confidence": ml_confidence,
             "betting_markets": betting_markets, 
-            "h2h_n": len(h2h),
-            "home_form_n": len(home_form),
-            "away_form_n": len(away_form),
+            "h2h_n": h2h_n,
+            "home_form_n": home_form_n,
+            "away_form_n": away_form_n,
             "total_xg": round(home_xg + away_xg, 2),
         }
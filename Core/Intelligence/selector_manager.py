@@ -14,15 +14,30 @@ AUTO-HEALING PHILOSOPHY:
 
 USAGE PATTERNS:
 1. get_selector_auto() - Simple DB lookup (no healing)
+   get_selectors_auto() - Same for several keys: one page.evaluate, at most one heal
 2. get_selector_with_fallback() - DB lookup + on-demand healing if selector fails
 3. heal_selector_on_failure() - Direct healing when you know a selector failed
 """
 
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from .selector_db import load_knowledge, save_knowledge, knowledge_db
 
+# Per selector: true (visible), false (absent/hidden) or null (not plain CSS,
+# e.g. Playwright's :has-text). Images count when attached: their src is what
+# callers read, and resource blocking may leave them unrendered.
+_CHECK_SELECTORS_JS = """(selectors) => selectors.map(sel => {
+    let el;
+    try { el = document.querySelector(sel); } catch (e) { return null; }
+    if (!el) return false;
+    if (el.tagName === 'IMG') return true;
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+})"""
+
+_ALL_VISIBLE_JS = "(selectors) => (" + _CHECK_SELECTORS_JS + ")(selectors).every(v => v !== false)"
+
 
 class SelectorManager:
     """Manages CSS selectors for web automation with auto-healing capabilities"""
@@ -86,8 +101,8 @@ class SelectorManager:
             # A. Capture NEW Snapshot (Crucial for fresh analysis)
             # Note: analyze_page_and_update_selectors handles the snapshot capturing
             
-            # B. Run AI Analysis (Forces update of DB)
-            await analyze_page_and_update_selectors(page, context_key, force_refresh=True, info=info)
+            # B. Run AI Analysis (served from the heal cache if this layout was healed before)
+            await analyze_page_and_update_selectors(page, context_key, info=info)
 
             # C. Re-fetch
             selector = knowledge_db.get(context_key, {}).get(element_key)
@@ -99,6 +114,72 @@ class SelectorManager:
 
         return str(selector) if selector else ""
 
+    @staticmethod
+    async def _check_selectors(page, selectors: List[str]) -> List[bool]:
+        """Visibility of each selector in one round-trip; non-CSS selectors are checked via Playwright."""
+        try:
+            states = await page.evaluate(_CHECK_SELECTORS_JS, selectors)
+        except Exception:
+            states = [None] * len(selectors)
+        results = []
+        for selector, state in zip(selectors, states):
+            if state is None:
+                try:
+                    state = await page.locator(selector).first.is_visible()
+                except Exception:
+                    state = False
+            results.append(bool(state))
+        return results
+
+    @staticmethod
+    async def get_selectors_auto(page, context_key: str, element_keys: List[str], timeout: int = 5000) -> Dict[str, str]:
+        """
+        BATCHED SMART ACCESSOR:
+        Validates all keys with one page.evaluate, waits once (up to `timeout` ms)
+        for any that are not visible yet, and runs a single AI heal for the keys
+        still missing. Returns only the keys that resolved to a selector.
+        """
+        known = knowledge_db.get(context_key, {})
+        selectors = {key: known.get(key) for key in element_keys}
+        candidates = [key for key in element_keys if selectors[key]]
+
+        resolved: Dict[str, str] = {}
+        if candidates:
+            visible = await SelectorManager._check_selectors(page, [selectors[k] for k in candidates])
+            pending = [k for k, ok in zip(candidates, visible) if not ok]
+            resolved.update({k: str(selectors[k]) for k, ok in zip(candidates, visible) if ok})
+
+            if pending:
+                # One bounded wait for late-rendering elements instead of one per key
+                try:
+                    await page.wait_for_function(_ALL_VISIBLE_JS, arg=[selectors[k] for k in pending], timeout=timeout)
+                except Exception:
+                    pass
+                visible = await SelectorManager._check_selectors(page, [selectors[k] for k in pending])
+                resolved.update({k: str(selectors[k]) for k, ok in zip(pending, visible) if ok})
+
+        missing = [key for key in element_keys if key not in resolved]
+        if missing:
+            print(
+                f"    [Auto-Heal] {len(missing)} selector(s) in '{context_key}' invalid/missing: {', '.join(missing)}. Initiating AI repair..."
+            )
+            # Import here to avoid circular imports
+            from .intelligence import analyze_page_and_update_selectors
+
+            info = f"Selectors {', '.join(repr(k) for k in missing)} in '{context_key}' invalid/missing."
+            await analyze_page_and_update_selectors(page, context_key, info=info)
+
+            known = knowledge_db.get(context_key, {})
+            for key in missing:
+                selector = known.get(key)
+                if selector:
+                    resolved[key] = str(selector)
+                    print(f"    [Auto-Heal Success] New selector for '{key}': {selector}")
+                else:
+                    print(f"    [Auto-Heal Failed] AI could not find '{key}' even after refresh.")
+
+        return resolved
+
     @staticmethod
     async def heal_selector_on_failure(page, context_key: str, element_key: str, failure_reason: str = "") -> str:
         """
@@ -123,7 +204,7 @@ class SelectorManager:
 
             # Attempt AI-powered healing
             info = f"Selector '{element_key}' failed during use in '{context_key}'. {failure_reason}"
-            await analyze_page_and_update_selectors(page, context_key, force_refresh=True, info=info)
+            await analyze_page_and_update_selectors(page, context_key, info=info)
 
             # Return the healed selector
             healed_selector = knowledge_db.get(context_key, {}).get(element_key, "")
@@ -11,11 +11,14 @@ Orchestrates sub-modules for visual analysis, selector mapping, and recovery.
 import os
 import re
 import json
-from typing import Dict, Any, List, Optional
+import asyncio
+import hashlib
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 from .selector_db import knowledge_db, save_knowledge
 from ..Browser.page_logger import log_page_html
+from ..Browser.resource_blocker import vision_profile
 from ..Utils.utils import LOG_DIR
 
 
@@ -24,6 +27,72 @@ from .html_utils import clean_html_content
 from .selector_mapping import map_visuals_to_selectors
 from .selector_utils import simplify_selectors
 
+# --- Heal coordination ---
+# One heal per (context, structural DOM fingerprint): concurrent callers await
+# the in-flight heal, and healed selectors that match the page are cached so an
+# identical layout is not sent to the LLM again while they keep matching. A heal
+# that matched nothing is cached as an empty entry, so a key that stays missing
+# on a layout (e.g. an optional element) does not trigger a call per match.
+HEAL_CACHE_FILE = Path("Config/heal_cache.json")
+HEAL_CACHE_MAX = 200
+_inflight_heals: Dict[Tuple[str, str], asyncio.Future] = {}
+_heal_cache: Dict[str, Dict[str, str]] = {}
+
+# Distinct tag/class signatures of the body: ignores text, ids and row counts,
+# so pages built from the same template share a fingerprint.
+_DOM_SIGNATURE_JS = """() => {
+    const sigs = new Set();
+    for (const el of document.body ? document.body.querySelectorAll('*') : []) {
+        sigs.add(el.tagName + '.' + [...el.classList].sort().join('.'));
+    }
+    return [...sigs].sort().join('|');
+}"""
+
+
+def _load_heal_cache():
+    global _heal_cache
+    if HEAL_CACHE_FILE.exists():
+        try:
+            with open(HEAL_CACHE_FILE, "r", encoding="utf-8") as f:
+                _heal_cache = json.load(f)
+        except Exception:
+            _heal_cache = {}
+
+
+def _save_heal_cache():
+    try:
+        HEAL_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        while len(_heal_cache) > HEAL_CACHE_MAX:
+            _heal_cache.pop(next(iter(_heal_cache)))
+        with open(HEAL_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(_heal_cache, f, indent=2)
+    except Exception as e:
+        print(f"    [AI INTEL] Could not save heal cache: {e}")
+
+
+async def dom_fingerprint(page) -> str:
+    """Structural fingerprint of the current page (empty if it cannot be read)."""
+    try:
+        signature = await page.evaluate(_DOM_SIGNATURE_JS)
+        return hashlib.md5(signature.encode("utf-8")).hexdigest()
+    except Exception:
+        return ""
+
+
+async def _matching_selectors(page, selectors: Dict[str, str]) -> Dict[str, str]:
+    """The subset of `selectors` that match at least one element on the page."""
+    matched = {}
+    for key, selector in selectors.items():
+        try:
+            if selector and await page.locator(selector).count() > 0:
+                matched[key] = selector
+        except Exception:
+            continue
+    return matched
+
+
+_load_heal_cache()
+
 # --- Vision Integration ---
 
 async def get_visual_ui_analysis(page: Any, context_key: str = "unknown") -> str:
@@ -114,10 +183,64 @@ class VisualAnalyzer:
         info: Optional[str] = None,
     ):
         """
-        1. Checks if selectors exist. If they do and not force_refresh, skips.
-        2. Captures Visual UI Inventory (The What).
-        3. Captures HTML (The How).
-        4. Maps Visuals to HTML Selectors with STANDARDIZED KEYS for critical items.
+        Single-flight entry point for selector healing.
+        Keyed by (context, DOM fingerprint): a layout healed before is served from
+        the heal cache while its selectors still match, and concurrent callers for
+        the same layout await the one running heal instead of starting their own.
+        Only healed selectors that match the page are cached (an empty entry when
+        none did). force_refresh is for explicit operator refreshes: it bypasses
+        and drops the cached entry.
+        """
+        fingerprint = await dom_fingerprint(page)
+        if not fingerprint:
+            async with vision_profile(page):
+                await VisualAnalyzer._heal_selectors(page, context_key, info)
+            return
+
+        key = (context_key, fingerprint)
+        cache_key = f"{context_key}|{fingerprint}"
+        if force_refresh:
+            if _heal_cache.pop(cache_key, None) is not None:
+                _save_heal_cache()
+        else:
+            cached = _heal_cache.get(cache_key)
+            if cached is not None and len(await _matching_selectors(page, cached)) == len(cached):
+                knowledge_db.setdefault(context_key, {}).update(cached)
+                if cached:
+                    print(f"    [AI INTEL] Layout for '{context_key}' healed before; reused {len(cached)} cached selectors.")
+                else:
+                    print(f"    [AI INTEL] Layout for '{context_key}' healed before without a match; skipping AI call.")
+                return
+            if cached:
+                print(f"    [AI INTEL] Cached heal for '{context_key}' no longer matches; evicting it.")
+                _heal_cache.pop(cache_key, None)
+                _save_heal_cache()
+
+        inflight = _inflight_heals.get(key)
+        if inflight is not None:
+            print(f"    [AI INTEL] Heal for '{context_key}' already running; waiting for its result.")
+            await asyncio.shield(inflight)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        _inflight_heals[key] = future
+        try:
+            async with vision_profile(page):
+                healed = await VisualAnalyzer._heal_selectors(page, context_key, info)
+            if healed is not None:  # A failed heal (API error) is retried next time
+                _heal_cache[cache_key] = await _matching_selectors(page, healed)
+                _save_heal_cache()
+        finally:
+            _inflight_heals.pop(key, None)
+            future.set_result(None)
+
+    @staticmethod
+    async def _heal_selectors(page, context_key: str, info: Optional[str] = None) -> Optional[Dict[str, str]]:
+        """
+        1. Captures Visual UI Inventory (The What).
+        2. Captures HTML (The How).
+        3. Maps Visuals to HTML Selectors with STANDARDIZED KEYS for critical items.
+        Returns the upserted selectors, or None if the heal failed.
         """
         Focus = info
 
@@ -209,16 +332,17 @@ class VisualAnalyzer:
             new_selectors = json.loads(cleaned_json)
 
             # 4. Strict Upsert: Only update existing keys
-            updated_count = 0
+            upserted = {}
             for key, selector in new_selectors.items():
                 if key in existing_selectors:
                     knowledge_db[context_key][key] = selector
-                    updated_count += 1
+                    upserted[key] = selector
                 else:
                     print(f"    [AI INTEL WARNING] AI hallucinated new key '{key}'. Ignored (Strict Upsert Mode).")
 
             save_knowledge()
-            print(f"    [AI INTEL] Successfully upserted {updated_count} elements in context '{context_key}'.")
+            print(f"    [AI INTEL] Successfully upserted {len(upserted)} elements in context '{context_key}'.")
+            return upserted
         except Exception as e:
             print(f"    [AI INTEL ERROR] Failed to generate selectors map: {e}")
             return
@@ -7,7 +7,7 @@ import sys
 import argparse
 import uuid
 from datetime import datetime as dt
-from Data.Access.db_helpers import init_csvs
+from Data.Access.db_helpers import init_csvs, flush_tables
 from Core.Utils.utils import Tee, LOG_DIR
 
 state = {
@@ -31,7 +31,10 @@ state = {
 def log_state(chapter=None, action=None, next_step=None, why=None, expect=None):
     """Updates and prints the current system state."""
     global state
-    if chapter: state["current_chapter"] = chapter
+    if chapter:
+        # Chapter boundary: persist tables buffered by the table engine.
+        flush_tables()
+        state["current_chapter"] = chapter
     if action: state["last_action"] = action
     if next_step: state["next_expected"] = next_step
     if why: state["why_this_step"] = why
@@ -6,7 +6,7 @@ import csv
 from datetime import datetime as dt
 from pathlib import Path
 from Core.System.lifecycle import state
-from Data.Access.db_helpers import log_audit_event
+from Data.Access.db_helpers import PREDICTIONS_CSV, log_audit_event, _read_csv
 
 async def run_chapter_3_oversight():
     """
@@ -68,13 +68,8 @@ def perform_health_check():
 
 def _count_predictions_for_date(date_str: str) -> int:
     """Count predictions for a given date from predictions.csv."""
-    pred_file = Path("Data/Store/predictions.csv")
-    if not pred_file.exists():
-        return 0
     try:
-        with open(pred_file, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            return sum(1 for row in reader if row.get("date", "").startswith(date_str))
+        return sum(1 for row in _read_csv(PREDICTIONS_CSV) if row.get("date", "").startswith(date_str))
     except Exception:
         return 0
 
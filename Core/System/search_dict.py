@@ -1,6 +1,6 @@
 from supabase import create_client
 from Levenshtein import distance, ratio
-import os, re, csv
+import os, re, json
 from collections import defaultdict
 from dotenv import load_dotenv
 
@@ -44,23 +44,18 @@ def build_search_dict(force=False):
             offset += page_size
     except Exception as e:
         print(f"Supabase connection failed ({e}), attempting local CSV fallback...")
-        # Fallback to local Data/Store CSVs
-        teams_csv = os.path.join("Data", "Store", "teams.csv")
-        leagues_csv = os.path.join("Data", "Store", "region_league.csv")
-        
-        if os.path.exists(teams_csv):
-            with open(teams_csv, mode='r', encoding='utf-8') as f:
-                for row in csv.DictReader(f):
-                    terms = json.loads(row.get("search_terms", "[]"))
-                    for term in terms:
-                        cache[term.lower()].append({"id": row["team_id"], "type": "team", "name": row["team_name"]})
-        
-        if os.path.exists(leagues_csv):
-            with open(leagues_csv, mode='r', encoding='utf-8') as f:
-                for row in csv.DictReader(f):
-                    terms = json.loads(row.get("search_terms", "[]"))
-                    for term in terms:
-                        cache[term.lower()].append({"id": row["rl_id"], "type": "league", "name": row["league"]})
+        # Fallback to local Data/Store tables (read through the table store, buffered writes included)
+        from Data.Access.db_helpers import TEAMS_CSV, REGION_LEAGUE_CSV, _read_csv
+
+        for row in _read_csv(TEAMS_CSV):
+            terms = json.loads(row.get("search_terms") or "[]")
+            for term in terms:
+                cache[term.lower()].append({"id": row["team_id"], "type": "team", "name": row["team_name"]})
+
+        for row in _read_csv(REGION_LEAGUE_CSV):
+            terms = json.loads(row.get("search_terms") or "[]")
+            for term in terms:
+                cache[term.lower()].append({"id": row["rl_id"], "type": "league", "name": row["league"]})
                         
     _search_cache = cache
     return cache
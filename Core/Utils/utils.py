@@ -9,11 +9,15 @@ Responsible for error logging, batch processing, and system utilities.
 """
 
 import asyncio
+import os
 import sys
+import time
 import traceback
+from collections import deque
+from contextvars import ContextVar
 from datetime import datetime as dt
 from pathlib import Path
-from typing import Callable, List, TypeVar
+from typing import Callable, Deque, List, Optional, TypeVar
 
 from playwright.async_api import Page
 
@@ -82,13 +86,146 @@ async def capture_debug_snapshot(page: Page, label: str, info_text: str = ""):
     except Exception as e:
         print(f"    [Debug Failure] Could not write debug snapshot: {e}") 
 
+# --- Adaptive concurrency (AIMD) ---
+BATCH_MAX_CONCURRENCY = int(os.getenv('LEO_MAX_CONCURRENCY', 10))
+BATCH_MIN_FREE_MEM_PCT = float(os.getenv('LEO_MIN_FREE_MEM_PCT', 10))
+P95_BASELINE_WINDOWS = 8  # p95 baseline = best of the last N windows
+_task_errors: ContextVar[Optional[List[str]]] = ContextVar('batch_task_errors', default=None)
+
+# Latest limit of the most recently adjusted BatchProcessor (exported for monitoring)
+CONCURRENCY_STATE = {'limit': None, 'updated_at': None, 'reason': ''}
+
+
+def report_task_error(error: Exception):
+    """
+    Lets a batch task that handles its own exceptions still signal failure to
+    the BatchProcessor running it. Timeouts and navigation errors shrink the
+    concurrency limit. Outside a batch this is a no-op.
+    """
+    errors = _task_errors.get()
+    if errors is not None:
+        errors.append(_classify_error(error))
+
+
+def _classify_error(error: Exception) -> str:
+    text = f"{type(error).__name__} {error}"
+    if "Timeout" in text or "timeout" in text:
+        return "timeout"
+    if "net::ERR" in text or "Navigation" in text or "navigat" in text:
+        return "navigation"
+    return "error"
+
+
+def _free_memory_pct() -> Optional[float]:
+    """Host free memory in percent (psutil if available, else /proc/meminfo)."""
+    try:
+        import psutil
+        memory = psutil.virtual_memory()
+        return memory.available * 100 / memory.total
+    except Exception:
+        pass
+    try:
+        info = {}
+        with open("/proc/meminfo") as f:
+            for line in f:
+                key, value = line.split(":", 1)
+                info[key] = int(value.split()[0])
+        return info["MemAvailable"] * 100 / info["MemTotal"]
+    except Exception:
+        return None
+
+
 class BatchProcessor:
-    def __init__(self, max_concurrent: int = 4):
-        self.semaphore = asyncio.Semaphore(max_concurrent)
+    """
+    Runs async tasks under an adaptive concurrency limit (AIMD).
+    After each window of `limit` completions the limit grows by one while p95
+    latency stays within 1.5x of the best of the last P95_BASELINE_WINDOWS
+    windows (so one unusually fast window ages out) and errors stay under 5%;
+    it halves on timeouts, navigation errors, >20% errors or host memory
+    pressure (free memory under LEO_MIN_FREE_MEM_PCT). The limit stays within
+    [min_concurrent, LEO_MAX_CONCURRENCY] and is exported via CONCURRENCY_STATE.
+    """
+
+    def __init__(self, max_concurrent: int = 4, min_concurrent: int = 1, ceiling: Optional[int] = None, adaptive: bool = True):
+        self.max_concurrent = max_concurrent  # initial limit
+        self.min_concurrent = max(1, min_concurrent)
+        self.ceiling = max(max_concurrent, ceiling or BATCH_MAX_CONCURRENCY)
+        self.adaptive = adaptive
+        self.limit = max_concurrent
+        self.active = 0
+        self._cond: Optional[asyncio.Condition] = None
+
+        self._window_latencies: List[float] = []
+        self._window_errors: List[str] = []
+        self._recent_p95: Deque[float] = deque(maxlen=P95_BASELINE_WINDOWS)
+        self.history: List[tuple] = []  # (limit, reason) per adjustment
+
+    @property
+    def current_limit(self) -> int:
+        return self.limit
+
+    def _get_cond(self) -> asyncio.Condition:
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
 
     async def _worker(self, func: Callable, item: T, *args, **kwargs): # type: ignore
-        async with self.semaphore:
+        cond = self._get_cond()
+        async with cond:
+            await cond.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+
+        errors: List[str] = []
+        token = _task_errors.set(errors)
+        started = time.perf_counter()
+        try:
             return await func(item, *args, **kwargs)
+        except Exception as e:
+            errors.append(_classify_error(e))
+            raise
+        finally:
+            _task_errors.reset(token)
+            elapsed = time.perf_counter() - started
+            async with cond:
+                self.active -= 1
+                self._record(elapsed, errors)
+                cond.notify_all()
+
+    def _record(self, elapsed: float, errors: List[str]):
+        if not self.adaptive:
+            return
+        self._window_latencies.append(elapsed)
+        self._window_errors.extend(errors[:1])
+        if len(self._window_latencies) >= self.limit:
+            self._adjust()
+
+    def _adjust(self):
+        latencies = sorted(self._window_latencies)
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        error_rate = len(self._window_errors) / len(latencies)
+        hard_failures = sum(1 for e in self._window_errors if e in ("timeout", "navigation"))
+        free_mem = _free_memory_pct()
+        self._window_latencies, self._window_errors = [], []
+
+        old = self.limit
+        if hard_failures or error_rate > 0.2 or (free_mem is not None and free_mem < BATCH_MIN_FREE_MEM_PCT):
+            self.limit = max(self.min_concurrent, self.limit // 2)
+            reason = f"decrease: {hard_failures} timeout/nav, errors {error_rate:.0%}, free mem {free_mem if free_mem is None else round(free_mem)}%"
+        elif error_rate < 0.05 and (not self._recent_p95 or p95 <= min(self._recent_p95) * 1.5):
+            self.limit = min(self.ceiling, self.limit + 1)
+            reason = f"increase: p95 {p95:.1f}s, errors {error_rate:.0%}"
+        else:
+            reason = f"hold: p95 {p95:.1f}s, errors {error_rate:.0%}"
+        self._recent_p95.append(p95)
+
+        if self.limit != old:
+            print(f"    [AIMD] Concurrency {old} -> {self.limit} ({reason})")
+            self.history.append((self.limit, reason))
+        CONCURRENCY_STATE.update(limit=self.limit, updated_at=dt.now().isoformat(), reason=reason)
+
+    async def run(self, func: Callable, item: T, *args, **kwargs):
+        """Runs one task under the adaptive limit (for queue-driven workers)."""
+        return await self._worker(func, item, *args, **kwargs)
 
     async def run_batch(self, items: List[T], func: Callable, *args, **kwargs):
         tasks = [self._worker(func, item, *args, **kwargs) for item in items]
@@ -6,69 +6,76 @@
 CSV Operations Module
 Low-level CSV file manipulation utilities and database operations.
 Responsible for reading, writing, appending, and upserting CSV data safely.
+
+Storage backend (LEO_STORAGE_BACKEND):
+- 'csv' (default): in-memory table engine flushed to the CSV files.
+- 'sqlite': SQLite WAL database with the CSV files kept as export mirrors.
 """
 
 import os
-import csv
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+STORAGE_BACKEND = os.getenv('LEO_STORAGE_BACKEND', 'csv').strip().lower()
+
+if STORAGE_BACKEND == 'sqlite':
+    from .sqlite_store import sqlite_store as _store
+else:
+    from .table_engine import table_engine as _store
 
 # --- CSV File Paths ---
 DB_DIR = "Data/Store"
 
 def _read_csv(filepath: str) -> List[Dict[str, str]]:
-    """Safely reads a CSV file into a list of dictionaries."""
-    if not os.path.exists(filepath) or os.path.getsize(filepath) == 0:
-        return []
-    try:
-        with open(filepath, 'r', newline='', encoding='utf-8') as f:
-            return list(csv.DictReader(f))
-    except Exception as e:
-        print(f"    [File Error] Could not read {filepath}: {e}")
-        return []
+    """Safely reads a CSV file into a list of dictionaries (served from the storage backend)."""
+    return _store.read(filepath)
 
 def _append_to_csv(filepath: str, data_row: Dict, fieldnames: List[str]):
     """Safely appends a single dictionary row to a CSV file."""
-    file_exists = os.path.exists(filepath) and os.path.getsize(filepath) > 0
-    try:
-        with open(filepath, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            if not file_exists:
-                writer.writeheader()
-            writer.writerow(data_row)
-    except Exception as e:
-        print(f"    [File Error] Failed to write to {filepath}: {e}")
+    _store.append(filepath, data_row, fieldnames)
 
 def _write_csv(filepath: str, data: List[Dict], fieldnames: List[str]):
     """Safely writes a list of dictionaries to a CSV file, overwriting it."""
     # This function is kept for operations that require a full rewrite, like updating statuses.
-    try:
-        with open(filepath, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(data)
-    except Exception as e:
-        print(f"    [File Error] Failed to write to {filepath}: {e}")
+    _store.replace(filepath, data, fieldnames)
+
+def get_entry(filepath: str, unique_key: str, unique_id: str) -> Optional[Dict[str, str]]:
+    """Returns the row whose unique_key equals unique_id, or None (indexed lookup)."""
+    if not unique_id:
+        return None
+    return _store.get(filepath, unique_key, unique_id)
+
+def query_rows(filepath: str, **filters) -> List[Dict[str, str]]:
+    """Returns rows matching every column=value filter (index lookup on the SQLite backend)."""
+    return _store.query(filepath, filters)
+
+def flush_tables(filepath: Optional[str] = None):
+    """Writes buffered table changes to disk (all tables when filepath is None)."""
+    _store.flush(filepath)
 
 def upsert_entry(filepath: str, data_row: Dict, fieldnames: List[str], unique_key: str):
     """
     Performs a robust UPSERT (Update or Insert) operation on a CSV file.
-    It reads the file, updates the row if it exists, or appends it if it's new.
+    The row is merged via the backend's primary-key index;
+    the CSV file itself is rewritten on the next flush.
     """
     unique_id = data_row.get(unique_key)
     if not unique_id:
         print(f"    [DB UPSERT Warning] Skipping entry due to missing unique key '{unique_key}'.")
         return
 
-    all_rows = _read_csv(filepath)
+    _store.upsert(filepath, data_row, fieldnames, unique_key)
 
-    updated = False
-    for row in all_rows:
-        if row.get(unique_key) == unique_id:
-            row.update(data_row)
-            updated = True
-            break
+def upsert_many(filepath: str, data_rows: List[Dict], fieldnames: List[str], unique_key: str) -> int:
+    """
+    Bulk UPSERT: merges a whole batch in a single read-merge-write pass.
+    Conflicting rows resolve by last-write-wins on 'last_updated'.
+    Returns the number of rows applied.
+    """
+    if not data_rows:
+        return 0
 
-    if not updated:
-        all_rows.append(data_row)
+    missing = sum(1 for row in data_rows if not row.get(unique_key))
+    if missing:
+        print(f"    [DB UPSERT Warning] Skipping {missing} entries due to missing unique key '{unique_key}'.")
 
-    _write_csv(filepath, all_rows, fieldnames)
+    return _store.upsert_many(filepath, data_rows, fieldnames, unique_key)
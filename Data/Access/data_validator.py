@@ -163,13 +163,9 @@ class DataValidator:
         }
 
         # Predictions quality
-        predictions_file = "Data/Store/predictions.csv"
-        if os.path.exists(predictions_file):
-            with open(predictions_file, 'r', encoding='utf-8') as f:
-                import csv
-                reader = csv.DictReader(f)
-                predictions = list(reader)
-
+        from .db_helpers import PREDICTIONS_CSV, _read_csv
+        predictions = _read_csv(PREDICTIONS_CSV)
+        if predictions:
             total = len(predictions)
             reviewed = sum(1 for p in predictions if p.get('status') == 'reviewed')
             correct = sum(1 for p in predictions if p.get('outcome_correct') == 'True')
@@ -10,11 +10,12 @@ Responsible for saving predictions, schedules, standings, teams, and region-leag
 
 import os
 import csv
+import json
 from datetime import datetime as dt
 from typing import Dict, Any, List, Optional
 import uuid
 
-from .csv_operations import _read_csv, _append_to_csv, _write_csv, upsert_entry
+from .csv_operations import _read_csv, _append_to_csv, _write_csv, upsert_entry, upsert_many, get_entry, query_rows, flush_tables
 append_to_csv = _append_to_csv # Alias for external use
 
 # --- Data Store Paths ---
@@ -63,8 +64,8 @@ def log_audit_event(event_type: str, description: str, balance_before: Optional[
     }
     _append_to_csv(AUDIT_LOG_CSV, row, ['id', 'timestamp', 'event_type', 'description', 'balance_before', 'balance_after', 'stake', 'status'])
 
-def save_prediction(match_data: Dict[str, Any], prediction_result: Dict[str, Any]):
-    """UPSERTs a prediction into the predictions.csv file."""
+def _build_prediction_row(match_data: Dict[str, Any], prediction_result: Dict[str, Any]) -> Dict[str, Any]:
+    """Maps a match and its RuleEngine result onto a predictions.csv row."""
     fixture_id = match_data.get('id', 'unknown')
     date = match_data.get('date', dt.now().strftime("%d.%m.%Y"))
 
@@ -106,34 +107,32 @@ def save_prediction(match_data: Dict[str, Any], prediction_result: Dict[str, Any
         'league_id': match_data.get('league_id', ''),
         'last_updated': dt.now().isoformat()
     }
+    return new_row_data
+
+def save_prediction(match_data: Dict[str, Any], prediction_result: Dict[str, Any]):
+    """UPSERTs a prediction into the predictions.csv file."""
+    upsert_entry(PREDICTIONS_CSV, _build_prediction_row(match_data, prediction_result), files_and_headers[PREDICTIONS_CSV], 'fixture_id')
 
-    upsert_entry(PREDICTIONS_CSV, new_row_data, files_and_headers[PREDICTIONS_CSV], 'fixture_id')
+def save_predictions(items: List[tuple]) -> int:
+    """Bulk variant of save_prediction for (match_data, prediction_result) pairs: one merge pass."""
+    if not items: return 0
+    rows = [_build_prediction_row(match_data, prediction_result) for match_data, prediction_result in items]
+    return upsert_many(PREDICTIONS_CSV, rows, files_and_headers[PREDICTIONS_CSV], 'fixture_id')
 
 def update_prediction_status(match_id: str, date: str, new_status: str, **kwargs):
     """
     Updates the status and optional fields (like odds or booking_code) in predictions.csv.
     """
-    if not os.path.exists(PREDICTIONS_CSV):
-        return
-
-    rows = []
-    updated = False
     try:
-        with open(PREDICTIONS_CSV, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            fieldnames = reader.fieldnames
-            for row in reader:
-                if row.get('fixture_id') == match_id and row.get('date') == date:
-                    row['status'] = new_status
-                    row['last_updated'] = dt.now().isoformat()
-                    for key, value in kwargs.items():
-                        if key in row:
-                            row[key] = value
-                    updated = True
-                rows.append(row)
-
-        if updated and fieldnames is not None:
-            _write_csv(PREDICTIONS_CSV, rows, list(fieldnames))
+        row = get_entry(PREDICTIONS_CSV, 'fixture_id', match_id)
+        if not row or row.get('date') != date:
+            return
+
+        updates = {'fixture_id': match_id, 'status': new_status, 'last_updated': dt.now().isoformat()}
+        for key, value in kwargs.items():
+            if key in row:
+                updates[key] = value
+        upsert_entry(PREDICTIONS_CSV, updates, files_and_headers[PREDICTIONS_CSV], 'fixture_id')
     except Exception as e:
         print(f"    [Warning] Failed to update status for {match_id}: {e}")
 
@@ -145,30 +144,24 @@ def backfill_prediction_entry(fixture_id: str, updates: Dict[str, str]):
     if not fixture_id or not updates:
         return False
 
-    if not os.path.exists(PREDICTIONS_CSV):
-        return False
-
-    rows = []
     updated = False
     try:
-        with open(PREDICTIONS_CSV, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            fieldnames = reader.fieldnames
-            for row in reader:
-                if row.get('fixture_id') == fixture_id:
-                    for key, value in updates.items():
-                        if key in row and value:
-                            current = row[key].strip() if row[key] else ''
-                            if not current or current in ('Unknown', 'N/A', 'unknown'):
-                                row[key] = value
-                                row['last_updated'] = dt.now().isoformat()
-                                updated = True
-                    rows.append(row)
-                else:
-                    rows.append(row)
-
-        if updated and fieldnames is not None:
-            _write_csv(PREDICTIONS_CSV, rows, list(fieldnames))
+        row = get_entry(PREDICTIONS_CSV, 'fixture_id', fixture_id)
+        if not row:
+            return False
+
+        changes = {}
+        for key, value in updates.items():
+            if key in row and value:
+                current = row[key].strip() if row[key] else ''
+                if not current or current in ('Unknown', 'N/A', 'unknown'):
+                    changes[key] = value
+
+        if changes:
+            changes['fixture_id'] = fixture_id
+            changes['last_updated'] = dt.now().isoformat()
+            upsert_entry(PREDICTIONS_CSV, changes, files_and_headers[PREDICTIONS_CSV], 'fixture_id')
+            updated = True
     except Exception as e:
         print(f"    [Warning] Failed to backfill prediction {fixture_id}: {e}")
 
@@ -184,6 +177,18 @@ def save_schedule_entry(match_info: Dict[str, Any]):
 
     upsert_entry(SCHEDULES_CSV, match_info, files_and_headers[SCHEDULES_CSV], 'fixture_id')
 
+def save_schedule_entries(match_infos: List[Dict[str, Any]]) -> int:
+    """Bulk variant of save_schedule_entry: one merge pass for the whole batch."""
+    if not match_infos: return 0
+
+    last_updated = dt.now().isoformat()
+    for match_info in match_infos:
+        if 'league_id' not in match_info:
+            match_info['league_id'] = ''
+        match_info['last_updated'] = last_updated
+
+    return upsert_many(SCHEDULES_CSV, match_infos, files_and_headers[SCHEDULES_CSV], 'fixture_id')
+
 def save_live_score_entry(match_info: Dict[str, Any]):
     """Saves or updates a live score entry in live_scores.csv."""
     match_info['last_updated'] = dt.now().isoformat()
@@ -194,7 +199,7 @@ def save_standings(standings_data: List[Dict[str, Any]], region_league: str, lea
     if not standings_data: return
 
     last_updated = dt.now().isoformat()
-    updated_count = 0
+    rows_to_save = []
 
     for row in standings_data:
         row['region_league'] = region_league or row.get('region_league', 'Unknown')
@@ -213,9 +218,9 @@ def save_standings(standings_data: List[Dict[str, Any]], region_league: str, lea
         # Unique key is now team_id + league_id
         if t_id and l_id:
             row['standings_key'] = f"{l_id}_{t_id}".upper()
-            upsert_entry(STANDINGS_CSV, row, files_and_headers[STANDINGS_CSV], 'standings_key')
-            updated_count += 1
+            rows_to_save.append(row)
 
+    updated_count = upsert_many(STANDINGS_CSV, rows_to_save, files_and_headers[STANDINGS_CSV], 'standings_key')
     if updated_count > 0:
         print(f"      [DB] UPSERTed {updated_count} standings entries for {region_league or league_id}")
 
@@ -267,26 +272,19 @@ def save_region_league_entry(info: Dict[str, Any]):
     upsert_entry(REGION_LEAGUE_CSV, entry, files_and_headers[REGION_LEAGUE_CSV], 'rl_id')
 
 
-def save_team_entry(team_info: Dict[str, Any]):
-    """Saves or updates a single team entry in teams.csv with multi-league support."""
-    team_id = team_info.get('team_id')
-    if not team_id or team_id == 'unknown': return
-
-    # Check for existing entry to merge rl_ids
-    existing_rows = _read_csv(TEAMS_CSV)
+def _build_team_entry(team_info: Dict[str, Any], existing: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Builds a teams.csv row, merging rl_ids with the existing entry if any."""
     new_rl_id = team_info.get('rl_ids', team_info.get('region_league', ''))
-    
-    merged_rl_ids = new_rl_id
-    for row in existing_rows:
-        if row.get('team_id') == team_id:
-            existing_rl_ids = row.get('rl_ids', '').split(';')
-            if new_rl_id and new_rl_id not in existing_rl_ids:
-                existing_rl_ids.append(new_rl_id)
-            merged_rl_ids = ';'.join(filter(None, existing_rl_ids))
-            break
 
-    entry = {
-        'team_id': team_id,
+    merged_rl_ids = new_rl_id
+    if existing:
+        existing_rl_ids = existing.get('rl_ids', '').split(';')
+        if new_rl_id and new_rl_id not in existing_rl_ids:
+            existing_rl_ids.append(new_rl_id)
+        merged_rl_ids = ';'.join(filter(None, existing_rl_ids))
+
+    return {
+        'team_id': team_info.get('team_id'),
         'team_name': team_info.get('team_name', 'Unknown'),
         'rl_ids': merged_rl_ids,
         'team_crest': _standardize_url(team_info.get('team_crest', '')),
@@ -294,13 +292,36 @@ def save_team_entry(team_info: Dict[str, Any]):
         'last_updated': dt.now().isoformat()
     }
 
+def save_team_entry(team_info: Dict[str, Any]):
+    """Saves or updates a single team entry in teams.csv with multi-league support."""
+    team_id = team_info.get('team_id')
+    if not team_id or team_id == 'unknown': return
+
+    entry = _build_team_entry(team_info, get_entry(TEAMS_CSV, 'team_id', team_id))
     upsert_entry(TEAMS_CSV, entry, files_and_headers[TEAMS_CSV], 'team_id')
 
+def save_team_entries(team_infos: List[Dict[str, Any]]) -> int:
+    """Bulk variant of save_team_entry: rl_ids are merged across the batch, then written once."""
+    entries: Dict[str, Dict[str, Any]] = {}
+    for team_info in team_infos:
+        team_id = team_info.get('team_id')
+        if not team_id or team_id == 'unknown': continue
+        existing = entries.get(team_id) or get_entry(TEAMS_CSV, 'team_id', team_id)
+        entries[team_id] = _build_team_entry(team_info, existing)
+
+    return upsert_many(TEAMS_CSV, list(entries.values()), files_and_headers[TEAMS_CSV], 'team_id')
+
 def get_team_crest(team_id: str, team_name: str = "") -> str:
     """Retrieves the crest URL for a team from teams.csv."""
     if not os.path.exists(TEAMS_CSV):
         return ""
     
+    row = get_entry(TEAMS_CSV, 'team_id', str(team_id)) if team_id else None
+    if row:
+        return row.get('team_crest', '')
+    if not team_name:
+        return ""
+
     rows = _read_csv(TEAMS_CSV)
     for row in rows:
         if str(row.get('team_id')) == str(team_id) or (team_name and row.get('team_name') == team_name):
@@ -322,6 +343,7 @@ def save_site_matches(matches: List[Dict[str, Any]]):
     headers = files_and_headers[FB_MATCHES_CSV]
     last_extracted = dt.now().isoformat()
     
+    rows = []
     for match in matches:
         site_id = get_site_match_id(match.get('date', ''), match.get('home', ''), match.get('away', ''))
         row = {
@@ -342,7 +364,9 @@ def save_site_matches(matches: List[Dict[str, Any]]):
             'status': match.get('status', ''),
             'last_updated': dt.now().isoformat()
         }
-        upsert_entry(FB_MATCHES_CSV, row, headers, 'site_match_id')
+        rows.append(row)
+
+    upsert_many(FB_MATCHES_CSV, rows, headers, 'site_match_id')
 
 def load_site_matches(target_date: str) -> List[Dict[str, Any]]:
     """Loads all extracted site matches for a specific date."""
@@ -362,30 +386,19 @@ def load_harvested_site_matches(target_date: str) -> List[Dict[str, Any]]:
 
 def update_site_match_status(site_match_id: str, status: str, fixture_id: Optional[str] = None, details: Optional[str] = None, booking_code: Optional[str] = None, booking_url: Optional[str] = None, matched: Optional[str] = None, **kwargs):
     """Updates the booking status, fixture_id, or booking details for a site match."""
-    if not os.path.exists(FB_MATCHES_CSV):
-        return
-
-    rows = []
-    updated = False
     try:
-        with open(FB_MATCHES_CSV, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            fieldnames = reader.fieldnames
-            for row in reader:
-                if row.get('site_match_id') == site_match_id:
-                    row['booking_status'] = status
-                    if fixture_id: row['fixture_id'] = fixture_id
-                    if details: row['booking_details'] = details
-                    if booking_code: row['booking_code'] = booking_code
-                    if booking_url: row['booking_url'] = booking_url
-                    if status: row['status'] = status
-                    if matched: row['matched'] = matched
-                    if 'odds' in kwargs: row['odds'] = kwargs['odds']
-                    updated = True
-                rows.append(row)
-
-        if updated and fieldnames is not None:
-            _write_csv(FB_MATCHES_CSV, rows, list(fieldnames))
+        if not get_entry(FB_MATCHES_CSV, 'site_match_id', site_match_id):
+            return
+
+        updates = {'site_match_id': site_match_id, 'booking_status': status}
+        if fixture_id: updates['fixture_id'] = fixture_id
+        if details: updates['booking_details'] = details
+        if booking_code: updates['booking_code'] = booking_code
+        if booking_url: updates['booking_url'] = booking_url
+        if status: updates['status'] = status
+        if matched: updates['matched'] = matched
+        if 'odds' in kwargs: updates['odds'] = kwargs['odds']
+        upsert_entry(FB_MATCHES_CSV, updates, files_and_headers[FB_MATCHES_CSV], 'site_match_id')
     except Exception as e:
         print(f"    [DB Error] Failed to update site match status: {e}")
 
@@ -415,8 +428,7 @@ def get_all_schedules() -> List[Dict[str, Any]]:
 
 def get_standings(region_league: str) -> List[Dict[str, Any]]:
     """Loads standings for a specific league from standings.csv."""
-    all_standings = _read_csv(STANDINGS_CSV)
-    return [s for s in all_standings if s.get('region_league') == region_league]
+    return query_rows(STANDINGS_CSV, region_league=region_league)
 
 # To be accessible from other modules, we need to define the headers dict here
 files_and_headers = {
@@ -70,11 +70,9 @@ class HealthMonitor:
 
         # Check prediction data quality
         try:
-            if os.path.exists("Data/Store/predictions.csv"):
-                with open("Data/Store/predictions.csv", 'r', encoding='utf-8') as f:
-                    import csv
-                    reader = csv.DictReader(f)
-                    predictions = list(reader)
+            from .db_helpers import PREDICTIONS_CSV, _read_csv
+            if os.path.exists(PREDICTIONS_CSV):
+                predictions = _read_csv(PREDICTIONS_CSV)
 
                 reviewed = sum(1 for p in predictions if p.get('status') == 'reviewed')
                 failed = sum(1 for p in predictions if p.get('status') == 'review_failed')
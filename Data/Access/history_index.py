@@ -0,0 +1,130 @@
+# history_index.py: Per-team chronological index over finished schedules.
+# Refactored for Clean Architecture (v2.7)
+# This script answers "last N results before date D" with a bisect and a slice.
+
+"""
+History Index Module
+Built once from schedules.csv rows, the index holds every finished match
+(newest first) per team and per team pair, each with a parallel ascending
+key list so as-of-date lookups are a bisect plus a slice instead of a scan
+over the whole schedule table.
+
+Rows are mapped once into the form/H2H dict shape consumed by RuleEngine
+({"date", "home", "away", "score", "winner"}). Teams are keyed by name,
+which is what the rule engine matches form rows on.
+"""
+
+from bisect import bisect_right
+from datetime import datetime as dt
+from typing import Dict, Any, List, Optional, Tuple
+
+
+def _parse_date(d_str: str) -> dt:
+    for fmt in ("%d.%m.%Y", "%Y-%m-%d"):
+        try:
+            return dt.strptime(d_str, fmt)
+        except (ValueError, TypeError):
+            continue
+    return dt.min
+
+
+def _is_finished(row: Dict[str, Any]) -> bool:
+    return (row.get('match_status') not in ('scheduled', 'live')
+            and row.get('home_score') not in ('', 'N/A', None)
+            and row.get('away_score') not in ('', 'N/A', None))
+
+
+def _map_result(row: Dict[str, Any]) -> Dict[str, Any]:
+    hs = row.get('home_score', '0')
+    ascore = row.get('away_score', '0')
+    try:
+        hsi = int(hs)
+        asi = int(ascore)
+        winner = "Home" if hsi > asi else "Away" if asi > hsi else "Draw"
+    except (ValueError, TypeError):
+        winner = "Draw"
+    return {
+        "fixture_id": row.get("fixture_id"),
+        "date": row.get("date"),
+        "home": row.get('home_team'),
+        "away": row.get('away_team'),
+        "score": f"{hs}-{ascore}",
+        "winner": winner
+    }
+
+
+class _Timeline:
+    """Results newest first, with ascending keys (-ordinal) for bisect."""
+    __slots__ = ('keys', 'results')
+
+    def __init__(self):
+        self.keys: List[int] = []
+        self.results: List[Dict[str, Any]] = []
+
+    def before(self, as_of: Optional[dt], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        start = 0 if as_of is None else bisect_right(self.keys, -as_of.toordinal())
+        end = None if limit is None else start + limit
+        return self.results[start:end]
+
+
+class HistoryIndex:
+    """Team and team-pair timelines over finished schedule rows."""
+
+    def __init__(self, schedules: List[Dict[str, Any]]):
+        finished = [m for m in schedules if _is_finished(m)]
+        dated = [(_parse_date(m.get('date', '')), m) for m in finished]
+        # Stable sort: same-day matches keep their table order
+        dated.sort(key=lambda x: x[0], reverse=True)
+
+        self.teams: Dict[str, _Timeline] = {}
+        self.pairs: Dict[Tuple[str, str], _Timeline] = {}
+        self.fixture_ids = set()
+        self.size = len(dated)
+
+        for date, row in dated:
+            key = -date.toordinal()
+            mapped = _map_result(row)
+            if mapped["fixture_id"]:
+                self.fixture_ids.add(mapped["fixture_id"])
+            home, away = mapped["home"], mapped["away"]
+            for team in {home, away}:
+                timeline = self.teams.setdefault(team, _Timeline())
+                timeline.keys.append(key)
+                timeline.results.append(mapped)
+            timeline = self.pairs.setdefault(HistoryIndex.pair_key(home, away), _Timeline())
+            timeline.keys.append(key)
+            timeline.results.append(mapped)
+
+    def add(self, row: Dict[str, Any]) -> bool:
+        """Inserts one schedule row in date order. Returns False if unfinished or already indexed."""
+        fixture_id = row.get('fixture_id')
+        if not _is_finished(row) or (fixture_id and fixture_id in self.fixture_ids):
+            return False
+        if fixture_id:
+            self.fixture_ids.add(fixture_id)
+        key = -_parse_date(row.get('date', '')).toordinal()
+        mapped = _map_result(row)
+        home, away = mapped["home"], mapped["away"]
+        timelines = [self.teams.setdefault(team, _Timeline()) for team in {home, away}]
+        timelines.append(self.pairs.setdefault(HistoryIndex.pair_key(home, away), _Timeline()))
+        for timeline in timelines:
+            # After existing same-day rows, matching the stable sort of the constructor
+            pos = bisect_right(timeline.keys, key)
+            timeline.keys.insert(pos, key)
+            timeline.results.insert(pos, mapped)
+        self.size += 1
+        return True
+
+    @staticmethod
+    def pair_key(team_a: str, team_b: str) -> Tuple[str, str]:
+        return (team_a, team_b) if (team_a or "") <= (team_b or "") else (team_b, team_a)
+
+    def team_form(self, team: str, as_of: Optional[dt] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Latest `limit` results for a team played before `as_of` (all history if None)."""
+        timeline = self.teams.get(team)
+        return timeline.before(as_of, limit) if timeline else []
+
+    def head_to_head(self, team_a: str, team_b: str, as_of: Optional[dt] = None) -> List[Dict[str, Any]]:
+        """All meetings between two teams played before `as_of`, newest first."""
+        timeline = self.pairs.get(HistoryIndex.pair_key(team_a, team_b))
+        return timeline.before(as_of) if timeline else []
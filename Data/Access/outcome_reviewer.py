@@ -9,7 +9,6 @@ Responsible for managing the review workflow, CSV operations, and outcome tracki
 """
 
 import asyncio
-import csv
 import os
 import pandas as pd
 import pytz
@@ -24,6 +23,7 @@ from playwright.async_api import Playwright
 BATCH_SIZE = 10      # How many matches to review at the same time
 LOOKBACK_LIMIT = 5000 # Only check the last 500 eligible matches to prevent infinite backlogs
 ENRICHMENT_CONCURRENCY = 10 # Concurrency for enriching past H2H matches
+OUTCOME_COMMIT_BATCH = int(os.getenv('LEO_OUTCOME_COMMIT_BATCH', 100))  # Outcomes written per batch
 
 # --- PRODUCTION CONFIGURATION ---
 PRODUCTION_MODE = True  # Set to True in production environment
@@ -40,28 +40,18 @@ from .db_helpers import (
     PREDICTIONS_CSV, SCHEDULES_CSV, TEAMS_CSV, REGION_LEAGUE_CSV, 
     FB_MATCHES_CSV, files_and_headers, save_team_entry, save_region_league_entry
 )
-from .csv_operations import upsert_entry, _read_csv, _write_csv
+from .csv_operations import upsert_entry, upsert_many, get_entry, query_rows, _read_csv, flush_tables
+from .prediction_evaluator import evaluate_prediction
 from .sync_manager import SyncManager
+from .standings_cache import standings_cache
 from Core.Intelligence.intelligence import get_selector_auto, get_selector
+from Core.Browser.resource_blocker import apply_resource_profile
 from Core.Utils.constants import NAVIGATION_TIMEOUT
 
 
-def _load_schedule_db() -> Dict[str, Dict]:
-    """Loads the schedules.csv into a dictionary for quick lookups."""
-    schedule_db = {}
-    if not os.path.exists(SCHEDULES_CSV):
-        return {}
-    with open(SCHEDULES_CSV, 'r', encoding='utf-8', newline='') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if row.get('fixture_id'):
-                schedule_db[row['fixture_id']] = row
-    return schedule_db
-
-
 def get_predictions_to_review() -> List[Dict]:
     """
-    Reads the predictions CSV using pandas and returns a list of matches that 
+    Loads pending predictions into pandas and returns a list of matches that 
     are in the past (Africa/Lagos timezone) and still have a 'pending' status.
     """
     if not os.path.exists(PREDICTIONS_CSV):
@@ -69,14 +59,8 @@ def get_predictions_to_review() -> List[Dict]:
         return []
 
     try:
-        # 1. Load predictions with pandas
-        df = pd.read_csv(PREDICTIONS_CSV, dtype=str).fillna('')
-        
-        if df.empty:
-            return []
-
-        # 2. Filter for 'pending' status
-        df = df[df['status'] == 'pending']
+        # 1-2. Load only 'pending' predictions (index lookup on the SQLite backend)
+        df = pd.DataFrame(query_rows(PREDICTIONS_CSV, status='pending'), dtype=str).fillna('')
         if df.empty:
             return []
 
@@ -151,68 +135,114 @@ def smart_parse_datetime(dt_str: str):
     return None, None
 
 
-def save_single_outcome(match_data: Dict, new_status: str):
+def _apply_outcome(row: Dict, match_data: Dict, new_status: str) -> Dict:
+    """The prediction row with the reviewed status, final score and outcome_correct applied."""
+    row = dict(row)
+    row['status'] = new_status
+    row['actual_score'] = match_data.get('actual_score', row.get('actual_score', 'N/A'))
+
+    # Update scores if available in match_data (from schedules)
+    if 'home_score' in match_data and 'away_score' in match_data:
+        row['actual_score'] = f"{match_data['home_score']}-{match_data['away_score']}"
+
+    if new_status in ['reviewed', 'finished']:
+        from .review_outcomes import evaluate_prediction as final_eval
+        try:
+            h_core, a_core = row.get('actual_score', '').split('-')
+            row['outcome_correct'] = str(final_eval(row.get('prediction', ''), h_core, a_core))
+        except Exception as eval_err:
+            print(f"      [Eval Error] {eval_err}")
+    return row
+
+
+class OutcomeCommitter:
     """
-    Atomic Upsert to save the review result.
+    Write-behind buffer for review results. Outcomes are collected per
+    fixture and committed every OUTCOME_COMMIT_BATCH (LEO_OUTCOME_COMMIT_BATCH,
+    default 100) outcomes or on close():
+    - predictions.csv: keyed lookups and one bulk UPSERT per batch,
+    - fb_matches.csv: one WON/LOST pass per batch,
+    - Supabase: one predictions upsert per batch (awaited in close()).
+    close() also writes both tables to disk for readers of the CSV files.
     """
-    temp_file = PREDICTIONS_CSV + '.tmp'
-    updated = False
-    row_id_key = 'ID' if 'ID' in match_data else 'fixture_id'
-    target_id = match_data.get(row_id_key)
 
-    try:
-        with open(PREDICTIONS_CSV, 'r', encoding='utf-8', newline='') as infile, \
-             open(temp_file, 'w', encoding='utf-8', newline='') as outfile:
-
-            reader = csv.DictReader(infile)
-            fieldnames = reader.fieldnames
-            if fieldnames is None: 
-                fieldnames = files_and_headers[PREDICTIONS_CSV]
-
-            writer = csv.DictWriter(outfile, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for row in reader:
-                current_id = row.get('ID') or row.get('fixture_id')
-
-                if current_id == target_id:
-                    row['status'] = new_status
-                    row['actual_score'] = match_data.get('actual_score', row.get('actual_score', 'N/A'))
-                    
-                    # Update scores if available in match_data (from schedules)
-                    if 'home_score' in match_data and 'away_score' in match_data:
-                        row['actual_score'] = f"{match_data['home_score']}-{match_data['away_score']}"
-
-                    if new_status in ['reviewed', 'finished']:
-                        from .review_outcomes import evaluate_prediction as final_eval
-                        prediction = row.get('prediction', '')
-                        actual_score = row.get('actual_score', '')
-                        
-                        try:
-                            h_core, a_core = actual_score.split('-')
-                            is_correct = final_eval(prediction, h_core, a_core)
-                            row['outcome_correct'] = str(is_correct)
-                            
-                            # Immediate Sync (Real-time update)
-                            print(f"      [Cloud] Immediate sync for {target_id}...")
-                            asyncio.create_task(SyncManager().batch_upsert('predictions', [row]))
-                        except Exception as eval_err:
-                            print(f"      [Eval Error] {eval_err}")
-
-                    updated = True
-
-                writer.writerow(row)
+    def __init__(self, batch_size: int = OUTCOME_COMMIT_BATCH):
+        self.batch_size = max(1, batch_size)
+        self._pending: Dict[str, tuple] = {}  # fixture_id -> (match_data, new_status)
+        self._uploads: List[asyncio.Task] = []
+        self.stats = {'outcomes': 0, 'batches': 0}
+
+    def add(self, match_data: Dict, new_status: str):
+        target_id = match_data.get('fixture_id') or match_data.get('ID')
+        if not target_id:
+            return
+        self._pending[target_id] = (match_data, new_status)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> List[Dict]:
+        """Commits the buffered outcomes locally and schedules their cloud upsert. Returns the updated rows."""
+        if not self._pending:
+            return []
+        pending, self._pending = self._pending, {}
+        try:
+            updated, settled = [], {}
+            for target_id, (match_data, new_status) in pending.items():
+                row = get_entry(PREDICTIONS_CSV, 'fixture_id', target_id)
+                if row is None:
+                    continue
+                row = _apply_outcome(row, match_data, new_status)
+                updated.append(row)
+                if new_status in ['reviewed', 'finished']:
+                    standings_cache.invalidate(match_data.get('region_league'))
+                    settled[target_id] = dict(match_data, **row)
+
+            upsert_many(PREDICTIONS_CSV, updated, files_and_headers[PREDICTIONS_CSV], 'fixture_id')
+            _sync_outcome_to_site_registry(settled)
+            self.stats['outcomes'] += len(updated)
+            self.stats['batches'] += 1
+        except Exception as e:
+            HealthMonitor.log_error("csv_save_error", f"Failed to save outcomes: {e}", "high")
+            print(f"    [File Error] Failed to commit {len(pending)} outcomes: {e}")
+            return []
 
         if updated:
-            os.replace(temp_file, PREDICTIONS_CSV)
-            if new_status == 'reviewed' and target_id:
-                _sync_outcome_to_site_registry(target_id, match_data)
-        else:
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
-    except Exception as e:
-        HealthMonitor.log_error("csv_save_error", f"Failed to save CSV: {e}", "high")
-        print(f"    [File Error] Failed to write CSV: {e}")
+            self._schedule_upload(updated)
+        return updated
+
+    def _schedule_upload(self, rows: List[Dict]):
+        print(f"      [Cloud] Syncing {len(rows)} reviewed outcomes...")
+        try:
+            self._uploads.append(asyncio.get_running_loop().create_task(SyncManager().batch_upsert('predictions', rows)))
+        except RuntimeError:
+            # No running loop (synchronous caller): push inline
+            asyncio.run(SyncManager().batch_upsert('predictions', rows))
+
+    async def close(self):
+        """Commits what is left, flushes the tables to disk and waits for the cloud upserts."""
+        self.flush()
+        flush_tables(PREDICTIONS_CSV)
+        flush_tables(FB_MATCHES_CSV)
+        uploads, self._uploads = self._uploads, []
+        for result in await asyncio.gather(*uploads, return_exceptions=True):
+            if isinstance(result, Exception):
+                print(f"      [Cloud] Outcome sync failed: {result}")
+        if self.stats['outcomes']:
+            print(f"   [Review] Committed {self.stats['outcomes']} outcomes in {self.stats['batches']} batches.")
+        self.stats = dict.fromkeys(self.stats, 0)
+
+
+outcome_committer = OutcomeCommitter()
+
+
+def save_single_outcome(match_data: Dict, new_status: str):
+    """
+    Saves one review result immediately (committing anything else buffered
+    with it). Inside an event loop the cloud upsert is kept on
+    outcome_committer and awaited by its next close().
+    """
+    outcome_committer.add(match_data, new_status)
+    outcome_committer.flush()
 
 def sync_schedules_to_predictions():
     """
@@ -225,7 +255,7 @@ def sync_schedules_to_predictions():
     predictions = _read_csv(PREDICTIONS_CSV)
     pred_ids = {p.get('fixture_id') for p in predictions if p.get('fixture_id')}
 
-    added_count = 0
+    new_preds = []
     for s in schedules:
         fid = s.get('fixture_id')
         if fid and fid not in pred_ids:
@@ -245,42 +275,42 @@ def sync_schedules_to_predictions():
                 'match_link': s.get('match_link'),
                 'actual_score': f"{s.get('home_score', '')}-{s.get('away_score', '')}" if s.get('home_score') else 'N/A'
             }
-            upsert_entry(PREDICTIONS_CSV, new_pred, files_and_headers[PREDICTIONS_CSV], 'fixture_id')
-            added_count += 1
-    
+            new_preds.append(new_pred)
+            pred_ids.add(fid)
+
+    added_count = upsert_many(PREDICTIONS_CSV, new_preds, files_and_headers[PREDICTIONS_CSV], 'fixture_id')
     if added_count > 0:
         print(f"  [Sync] Added {added_count} missing entries from schedules to predictions.")
 
 
-def _sync_outcome_to_site_registry(fixture_id: str, match_data: Dict):
-    """v2.7 Sync: Updates fb_matches.csv when a prediction is reviewed."""
-    if not os.path.exists(FB_MATCHES_CSV):
+def _sync_outcome_to_site_registry(outcomes: Dict[str, Dict]):
+    """v2.7 Sync: Marks fb_matches.csv rows WON/LOST for a batch of settled predictions (fixture_id -> row)."""
+    if not outcomes or not os.path.exists(FB_MATCHES_CSV):
         return
 
     try:
         # 1. Determine WON/LOST
-        actual_score = match_data.get('actual_score', '')
-        prediction = match_data.get('prediction', '')
-        home_team = match_data.get('home_team', '')
-        away_team = match_data.get('away_team', '')
-        
-        is_correct = evaluate_prediction(prediction, actual_score, home_team, away_team)
-        if is_correct is None: return
-        
-        outcome_status = "WON" if is_correct else "LOST"
-        
-        # 2. Update site registry
-        rows = _read_csv(FB_MATCHES_CSV)
-        sync_count = 0
-        for row in rows:
-            if str(row.get('fixture_id')) == str(fixture_id):
-                row['status'] = outcome_status
-                sync_count += 1
-        
-        if sync_count > 0:
-            _write_csv(FB_MATCHES_CSV, rows, files_and_headers[FB_MATCHES_CSV])
-            print(f"    [Sync] Updated {sync_count} records in fb_matches.csv to {outcome_status}")
-            
+        statuses = {}
+        for fixture_id, match_data in outcomes.items():
+            is_correct = evaluate_prediction(match_data.get('prediction', ''), match_data.get('actual_score', ''),
+                                             match_data.get('home_team', ''), match_data.get('away_team', ''))
+            if is_correct is not None:
+                statuses[str(fixture_id)] = "WON" if is_correct else "LOST"
+        if not statuses:
+            return
+
+        # 2. Update site registry (one keyed upsert for the batch)
+        changed = []
+        for row in _read_csv(FB_MATCHES_CSV):
+            status = statuses.get(str(row.get('fixture_id')))
+            if status and row.get('status') != status:
+                row['status'] = status
+                changed.append(row)
+
+        if changed:
+            upsert_many(FB_MATCHES_CSV, changed, files_and_headers[FB_MATCHES_CSV], 'site_match_id')
+            print(f"    [Sync] Updated {len(changed)} records in fb_matches.csv to WON/LOST")
+
     except Exception as e:
         print(f"    [Sync Error] Failed to sync outcome: {e}")
 
@@ -289,9 +319,7 @@ def _sync_outcome_to_site_registry(fixture_id: str, match_data: Dict):
 
 def process_review_task_offline(match: Dict) -> Optional[Dict]:
     """Review a prediction by reading its result from schedules.csv (no browser)."""
-    schedule_db = _load_schedule_db()
-    fixture_id = match.get('fixture_id')
-    schedule = schedule_db.get(fixture_id, {})
+    schedule = get_entry(SCHEDULES_CSV, 'fixture_id', match.get('fixture_id')) or {}
 
     match_status = schedule.get('match_status', '').upper()
     home_score = schedule.get('home_score', '')
@@ -301,14 +329,14 @@ def process_review_task_offline(match: Dict) -> Optional[Dict]:
         match['home_score'] = home_score
         match['away_score'] = away_score
         match['actual_score'] = f"{home_score}-{away_score}"
-        save_single_outcome(match, 'finished')
+        outcome_committer.add(match, 'finished')
         print(f"    [Result] {match.get('home_team')} {match['actual_score']} {match.get('away_team')}")
         return match
     elif match_status == 'POSTPONED':
-        save_single_outcome(match, 'match_postponed')
+        outcome_committer.add(match, 'match_postponed')
         return None
     elif match_status == 'CANCELED':
-        save_single_outcome(match, 'canceled')
+        outcome_committer.add(match, 'canceled')
         return None
     # Not yet finished — skip
     return None
@@ -330,14 +358,14 @@ async def process_review_task_browser(page, match: Dict) -> Optional[Dict]:
             h_score, a_score = final_score.split('-')
             match['home_score'] = h_score
             match['away_score'] = a_score
-            save_single_outcome(match, 'finished')
+            outcome_committer.add(match, 'finished')
             print(f"    [Result-B] {match.get('home_team')} {final_score} {match.get('away_team')}")
             return match
         elif final_score == "Match_POSTPONED":
-            save_single_outcome(match, 'match_postponed')
+            outcome_committer.add(match, 'match_postponed')
         elif final_score == "ARCHIVED":
             print(f"      [!] Match {match.get('fixture_id')} appears deleted or archived. Flagging.")
-            save_single_outcome(match, 'manual_review_needed')
+            outcome_committer.add(match, 'manual_review_needed')
     except Exception as e:
         print(f"      [Fallback Error] {e}")
     
@@ -501,6 +529,7 @@ async def run_review_process(p: Optional[Playwright] = None):
             print(f"   [Info] Triggering Browser Fallback for {len(needs_browser)} unresolved reviews...")
             browser = await p.chromium.launch(headless=True)
             context = await browser.new_context()
+            await apply_resource_profile(context, "outcome_review")
             page = await context.new_page()
             
             for m in needs_browser:
@@ -509,7 +538,7 @@ async def run_review_process(p: Optional[Playwright] = None):
                     processed_matches.append(result)
             
             await browser.close()
-        
+
         if processed_matches:
             print(f"\n   [SUCCESS] Reviewed {len(processed_matches)} match outcomes.")
         else:
@@ -517,5 +546,6 @@ async def run_review_process(p: Optional[Playwright] = None):
 
     except Exception as e:
         print(f"   [CRITICAL] Outcome review failed: {e}")
-
-
+    finally:
+        # Commits the last batch, including outcomes buffered before a failure
+        await outcome_committer.close()
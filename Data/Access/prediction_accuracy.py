@@ -7,14 +7,13 @@ Prediction Accuracy Analysis Module
 Analyzes prediction accuracy and generates reports for the LeoBook system.
 """
 
-import csv
 import re
 import os
 from datetime import datetime
 from typing import Dict, List, Tuple
 from pathlib import Path
 
-from .db_helpers import PREDICTIONS_CSV
+from .db_helpers import PREDICTIONS_CSV, _read_csv
 
 
 def get_market_option(prediction: str, home_team: str, away_team: str) -> str:
@@ -322,7 +321,7 @@ def format_date_range(date_range: Dict) -> str:
 def print_accuracy_report():
     """
     Print the prediction accuracy report to console.
-    This function reads predictions from CSV and generates the accuracy report.
+    This function reads predictions from the table store and generates the accuracy report.
     """
     if not os.path.exists(PREDICTIONS_CSV):
         print("  [Accuracy] No predictions CSV found.")
@@ -331,9 +330,7 @@ def print_accuracy_report():
     # Read predictions
     predictions = []
     try:
-        with open(PREDICTIONS_CSV, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            predictions = list(reader)
+        predictions = _read_csv(PREDICTIONS_CSV)
     except Exception as e:
         print(f"  [Accuracy Error] Failed to read predictions: {e}")
         return
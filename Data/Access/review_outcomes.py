@@ -21,7 +21,7 @@ from datetime import datetime, timedelta
 import pytz
 import os
 import uuid
-from .db_helpers import PREDICTIONS_CSV, ACCURACY_REPORTS_CSV, log_audit_event, upsert_entry, files_and_headers
+from .db_helpers import PREDICTIONS_CSV, ACCURACY_REPORTS_CSV, log_audit_event, upsert_entry, files_and_headers, flush_tables
 from .sync_manager import SyncManager
 
 def evaluate_prediction(predicted_type: str, home_score: str, away_score: str) -> int:
@@ -115,6 +115,7 @@ async def run_accuracy_generation():
 
     print("\n   [ACCURACY] Generating performance metrics (Last 24h)...")
     try:
+        flush_tables(PREDICTIONS_CSV)
         df = pd.read_csv(PREDICTIONS_CSV, dtype=str).fillna('')
         if df.empty:
             print("   [ACCURACY] No predictions found.")
@@ -0,0 +1,463 @@
+# sqlite_store.py: SQLite (WAL) storage backend for the Data/Store tables.
+# Refactored for Clean Architecture (v2.7)
+# This script keeps every CSV table in one indexed SQLite database.
+
+"""
+SQLite Store Module
+Drop-in alternative to the in-memory table engine: same read/get/upsert/
+upsert_many/replace/append/flush interface, but every Data/Store table lives
+in a single SQLite database opened in WAL mode. Lookups on fixture_id, date,
+region_league and status (plus any UPSERT key) are served by indexes.
+
+CSV compatibility:
+- A table is imported from its CSV the first time it is touched, and
+  re-imported whenever a legacy direct writer (pandas to_csv, Supabase pull)
+  changes its content; a rewrite with the same rows only refreshes the file
+  stamp. Buffered UPSERTs (only the fields they set) are re-applied on top
+  unless the re-imported row carries a newer last_updated.
+- Changed tables are exported back to their CSV on flush (interval,
+  chapter boundary, process exit), so pandas readers and sync keep working.
+
+Configuration:
+- LEO_STORAGE_BACKEND=sqlite selects this backend (see csv_operations).
+- LEO_SQLITE_PATH: database file (default Data/Store/leobook.db).
+- LEO_TABLE_FLUSH_INTERVAL: seconds between CSV exports (shared with the table engine).
+"""
+
+import os
+import re
+import csv
+import time
+import hashlib
+import atexit
+import sqlite3
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+from .table_engine import FLUSH_INTERVAL, _is_older
+
+_project_root = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+SQLITE_PATH = os.getenv('LEO_SQLITE_PATH', os.path.join(_project_root, "Data", "Store", "leobook.db"))
+
+# Columns indexed whenever a table carries them
+INDEXED_COLUMNS = ('fixture_id', 'date', 'region_league', 'status')
+
+
+def _q(identifier: str) -> str:
+    """Quotes an SQL identifier (CSV headers such as 'over_2.5' are not bare-safe)."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _cell(value: Any) -> str:
+    """Stores values the way a CSV round-trip would read them back."""
+    return '' if value is None else str(value)
+
+
+def _digest(header: List[str], rows: List[Dict[str, Any]]) -> str:
+    """Hash of a table's parsed CSV content (independent of quoting and line endings)."""
+    h = hashlib.sha1('\x1f'.join(header).encode('utf-8'))
+    for row in rows:
+        h.update(b'\x1e')
+        h.update('\x1f'.join(_cell(row.get(c)) for c in header).encode('utf-8'))
+    return h.hexdigest()
+
+
+class _SQLTable:
+    """Bookkeeping for one CSV-backed SQLite table."""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.name = os.path.splitext(os.path.basename(filepath))[0]
+        self.columns: List[str] = []
+        self.fieldnames: List[str] = []
+        self.indexed: set = set()
+        # (unique_key, id) -> fields upserted since the last export, re-applied on re-import.
+        self.pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.dirty = False
+        self.disk_stat: Optional[Tuple[int, int]] = None
+        self.digest = ''  # _digest of the CSV as last imported or exported
+        self.last_flush = time.monotonic()
+
+
+class SQLiteStore:
+    """Process-wide SQLite backend exposing the table engine interface."""
+
+    def __init__(self, db_path: str = SQLITE_PATH, flush_interval: float = FLUSH_INTERVAL):
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self._tables: Dict[str, _SQLTable] = {}
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # --- Connection ---
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS _csv_mirror ("
+                "name TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, dirty INTEGER DEFAULT 0, digest TEXT DEFAULT '')"
+            )
+            if 'digest' not in self._table_columns('_csv_mirror'):
+                self._conn.execute("ALTER TABLE _csv_mirror ADD COLUMN digest TEXT DEFAULT ''")
+        return self._conn
+
+    @staticmethod
+    def _stat(filepath: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(filepath)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _table_columns(self, name: str) -> List[str]:
+        return [r[1] for r in self.conn.execute(f"PRAGMA table_info({_q(name)})")]
+
+    def _mirror_state(self, name: str) -> Optional[Tuple[Tuple[int, int], bool, str]]:
+        row = self.conn.execute(
+            "SELECT mtime_ns, size, dirty, digest FROM _csv_mirror WHERE name = ?", (name,)
+        ).fetchone()
+        if row is None:
+            return None
+        return ((row[0], row[1]), bool(row[2]), row[3] or '')
+
+    def _set_mirror(self, table: _SQLTable):
+        stat = table.disk_stat or (0, 0)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO _csv_mirror (name, mtime_ns, size, dirty, digest) VALUES (?, ?, ?, ?, ?)",
+            (table.name, stat[0], stat[1], int(table.dirty), table.digest)
+        )
+
+    # --- Schema ---
+
+    def _create(self, table: _SQLTable, columns: List[str]):
+        cols = ', '.join(f"{_q(c)} TEXT" for c in columns)
+        self.conn.execute(f"CREATE TABLE {_q(table.name)} ({cols})")
+        table.columns = list(columns)
+        table.indexed = set()
+        for col in INDEXED_COLUMNS:
+            self._ensure_index(table, col)
+
+    def _ensure_columns(self, table: _SQLTable, fieldnames: List[str]):
+        if not table.columns:
+            self._create(table, fieldnames)
+            return
+        for col in fieldnames:
+            if col not in table.columns:
+                self.conn.execute(f"ALTER TABLE {_q(table.name)} ADD COLUMN {_q(col)} TEXT")
+                table.columns.append(col)
+                if col in INDEXED_COLUMNS:
+                    self._ensure_index(table, col)
+
+    def _ensure_index(self, table: _SQLTable, column: str):
+        if column in table.indexed or column not in table.columns:
+            return
+        idx_name = f"idx_{table.name}_{re.sub(r'[^0-9A-Za-z_]', '_', column)}"
+        self.conn.execute(f"CREATE INDEX IF NOT EXISTS {_q(idx_name)} ON {_q(table.name)}({_q(column)})")
+        table.indexed.add(column)
+
+    # --- CSV import / export ---
+
+    def _read_file(self, table: _SQLTable) -> Tuple[Optional[Tuple[int, int]], List[str], List[Dict[str, Any]]]:
+        """(file stat, header, rows) of the CSV; empty when it is missing or unreadable."""
+        stat = self._stat(table.filepath)
+        if stat and stat[1] > 0:
+            try:
+                with open(table.filepath, 'r', newline='', encoding='utf-8') as f:
+                    reader = csv.DictReader(f)
+                    rows = list(reader)
+                    return stat, list(reader.fieldnames or []), rows
+            except Exception as e:
+                print(f"    [File Error] Could not read {table.filepath}: {e}")
+        return stat, [], []
+
+    def _import(self, table: _SQLTable, fieldnames: Optional[List[str]] = None, content=None):
+        """(Re)builds the SQLite table from its CSV file (or from `content` already read by _read_file)."""
+        table.disk_stat, header, rows = content or self._read_file(table)
+        table.digest = _digest(header, rows)
+
+        columns = header or list(fieldnames or table.fieldnames or [])
+        with self.conn:
+            self.conn.execute(f"DROP TABLE IF EXISTS {_q(table.name)}")
+            table.columns = []
+            if columns:
+                self._create(table, columns)
+                if rows:
+                    self._insert_many(table, rows)
+            table.dirty = False
+            self._set_mirror(table)
+        if header and not table.fieldnames:
+            table.fieldnames = header
+
+    def _export(self, table: _SQLTable):
+        fieldnames = table.fieldnames or table.columns
+        temp_file = table.filepath + '.tmp'
+        try:
+            rows = self._select(table)
+            with open(temp_file, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(rows)
+            os.replace(temp_file, table.filepath)
+        except Exception as e:
+            print(f"    [File Error] Failed to write to {table.filepath}: {e}")
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            return
+
+        table.disk_stat = self._stat(table.filepath)
+        table.digest = _digest(list(fieldnames), rows)
+        table.pending = {}
+        table.dirty = False
+        table.last_flush = time.monotonic()
+        self._set_mirror(table)
+
+    def import_csv(self, filepath: str):
+        """Forces a full re-import of one CSV file into the database."""
+        with self._lock:
+            table = self._tables.get(os.path.abspath(filepath)) or _SQLTable(os.path.abspath(filepath))
+            self._import(table)
+            self._tables[table.filepath] = table
+
+    def export_csv(self, filepath: str):
+        """Forces the CSV mirror of one table to be rewritten from the database."""
+        with self._lock:
+            table = self._get(filepath)
+            if table.columns:
+                with self.conn:
+                    self._export(table)
+
+    # --- Table access ---
+
+    def _get(self, filepath: str, fieldnames: Optional[List[str]] = None) -> _SQLTable:
+        """Returns the table, importing or re-importing the CSV when needed."""
+        path = os.path.abspath(filepath)
+        table = self._tables.get(path)
+        if table is None:
+            table = _SQLTable(path)
+            self._tables[path] = table
+            table.columns = self._table_columns(table.name)
+            mirror = self._mirror_state(table.name)
+            csv_stat = self._stat(path)
+            if not table.columns or mirror is None:
+                self._import(table, fieldnames)
+            elif csv_stat and csv_stat != mirror[0] and mirror[1]:
+                print(f"    [SQLite Warning] {table.name}: CSV and database both changed; keeping database rows.")
+                table.dirty = True
+                table.disk_stat = csv_stat
+                table.digest = mirror[2]
+            elif csv_stat and csv_stat != mirror[0]:
+                table.digest = mirror[2]
+                self._refresh(table, fieldnames)
+            else:
+                table.dirty = mirror[1]
+                table.disk_stat = mirror[0]
+                table.digest = mirror[2]
+                for col in INDEXED_COLUMNS:
+                    self._ensure_index(table, col)
+        elif self._stat(path) != table.disk_stat:
+            # Written by a legacy direct writer.
+            self._refresh(table, fieldnames)
+
+        if fieldnames:
+            table.fieldnames = list(fieldnames)
+            self._ensure_columns(table, fieldnames)
+        return table
+
+    def _refresh(self, table: _SQLTable, fieldnames: Optional[List[str]] = None):
+        """
+        The CSV changed on disk. Same content: only its stamp is recorded.
+        Otherwise the table is re-imported and the buffered upsert deltas are
+        re-applied, except where the re-imported row carries a newer last_updated.
+        """
+        content = self._read_file(table)
+        if _digest(content[1], content[2]) == table.digest:
+            table.disk_stat = content[0]
+            with self.conn:
+                self._set_mirror(table)
+            for col in INDEXED_COLUMNS:
+                self._ensure_index(table, col)
+            return
+
+        pending = table.pending
+        self._import(table, fieldnames, content)
+        table.pending = {}
+        with self.conn:
+            if table.fieldnames:
+                self._ensure_columns(table, table.fieldnames)
+            for (key, uid), delta in pending.items():
+                existing = self._find(table, key, uid)
+                if existing is not None and _is_older(delta, existing):
+                    continue  # The other writer's row is newer
+                self._apply_upsert(table, delta, key)
+                table.pending[(key, uid)] = delta
+            table.dirty = bool(table.pending)
+            self._set_mirror(table)
+
+    def _select(self, table: _SQLTable, where: str = '', params: tuple = (), limit: str = '') -> List[Dict[str, Any]]:
+        if not table.columns:
+            return []
+        cols = ', '.join(_q(c) for c in table.columns)
+        cur = self.conn.execute(f"SELECT {cols} FROM {_q(table.name)} {where} ORDER BY rowid {limit}", params)
+        return [{c: ('' if v is None else v) for c, v in zip(table.columns, r)} for r in cur]
+
+    def _insert_many(self, table: _SQLTable, rows: List[Dict[str, Any]]):
+        cols = ', '.join(_q(c) for c in table.columns)
+        marks = ', '.join('?' for _ in table.columns)
+        self.conn.executemany(
+            f"INSERT INTO {_q(table.name)} ({cols}) VALUES ({marks})",
+            [tuple(_cell(r.get(c)) for c in table.columns) for r in rows]
+        )
+
+    def _find(self, table: _SQLTable, unique_key: str, unique_id: str) -> Optional[Dict[str, Any]]:
+        if unique_key not in table.columns:
+            return None
+        self._ensure_index(table, unique_key)
+        rows = self._select(table, f"WHERE {_q(unique_key)} = ?", (_cell(unique_id),), "LIMIT 1")
+        return rows[0] if rows else None
+
+    # --- Mutations ---
+
+    def _apply_upsert(self, table: _SQLTable, data_row: Dict[str, Any], unique_key: str):
+        self._ensure_index(table, unique_key)
+        unique_id = _cell(data_row.get(unique_key))
+        cols = [c for c in data_row if c in table.columns]
+        found = self.conn.execute(
+            f"SELECT rowid FROM {_q(table.name)} WHERE {_q(unique_key)} = ? ORDER BY rowid LIMIT 1", (unique_id,)
+        ).fetchone()
+        if found is not None:
+            assignments = ', '.join(f"{_q(c)} = ?" for c in cols)
+            self.conn.execute(
+                f"UPDATE {_q(table.name)} SET {assignments} WHERE rowid = ?",
+                tuple(_cell(data_row[c]) for c in cols) + (found[0],)
+            )
+        else:
+            self._insert_many(table, [data_row])
+
+    @staticmethod
+    def _track(table: _SQLTable, unique_key: str, data_row: Dict[str, Any]):
+        table.pending.setdefault((unique_key, data_row.get(unique_key)), {}).update(data_row)
+
+    def _mark_dirty(self, table: _SQLTable):
+        if not table.dirty:
+            table.dirty = True
+            self._set_mirror(table)
+        self._maybe_flush(table)
+
+    def upsert(self, filepath: str, data_row: Dict[str, Any], fieldnames: List[str], unique_key: str):
+        """UPSERTs one row; the CSV mirror is rewritten on the next flush."""
+        with self._lock:
+            table = self._get(filepath, fieldnames)
+            with self.conn:
+                self._apply_upsert(table, data_row, unique_key)
+                self._track(table, unique_key, data_row)
+                self._mark_dirty(table)
+
+    def upsert_many(self, filepath: str, data_rows: List[Dict[str, Any]], fieldnames: List[str], unique_key: str) -> int:
+        """Batch UPSERT in one transaction with last-write-wins on 'last_updated'."""
+        latest: Dict[str, Dict[str, Any]] = {}
+        for row in data_rows:
+            uid = row.get(unique_key)
+            if not uid:
+                continue
+            current = latest.get(uid)
+            if current is None or not _is_older(row, current):
+                latest[uid] = row
+
+        if not latest:
+            return 0
+
+        with self._lock:
+            table = self._get(filepath, fieldnames)
+            applied = 0
+            with self.conn:
+                for uid, row in latest.items():
+                    existing = self._find(table, unique_key, uid)
+                    if existing is not None and _is_older(row, existing):
+                        continue
+                    self._apply_upsert(table, row, unique_key)
+                    self._track(table, unique_key, row)
+                    applied += 1
+                if applied:
+                    self._mark_dirty(table)
+            return applied
+
+    def replace(self, filepath: str, rows: List[Dict[str, Any]], fieldnames: List[str]):
+        """Replaces the whole table and exports it immediately."""
+        with self._lock:
+            table = self._get(filepath, fieldnames)
+            with self.conn:
+                self.conn.execute(f"DELETE FROM {_q(table.name)}")
+                if rows:
+                    self._insert_many(table, rows)
+                table.pending = {}
+                table.dirty = True
+                self._export(table)
+
+    def append(self, filepath: str, data_row: Dict[str, Any], fieldnames: List[str]):
+        """Appends a row to the table."""
+        with self._lock:
+            table = self._get(filepath, fieldnames)
+            with self.conn:
+                self._insert_many(table, [data_row])
+                self._mark_dirty(table)
+
+    # --- Reads ---
+
+    def read(self, filepath: str) -> List[Dict[str, Any]]:
+        """Returns all rows in insertion order."""
+        with self._lock:
+            return self._select(self._get(filepath))
+
+    def get(self, filepath: str, unique_key: str, unique_id: str) -> Optional[Dict[str, Any]]:
+        """Indexed primary-key lookup. Returns the row or None."""
+        with self._lock:
+            return self._find(self._get(filepath), unique_key, unique_id)
+
+    def query(self, filepath: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Returns rows whose columns equal every filter value (indexed WHERE)."""
+        with self._lock:
+            table = self._get(filepath)
+            if any(col not in table.columns for col in filters):
+                return []
+            for col in filters:
+                self._ensure_index(table, col)
+            where = ' AND '.join(f"{_q(col)} = ?" for col in filters)
+            params = tuple(_cell(v) for v in filters.values())
+            return self._select(table, f"WHERE {where}" if where else '', params)
+
+    # --- Flushing ---
+
+    def _maybe_flush(self, table: _SQLTable):
+        if time.monotonic() - table.last_flush >= self.flush_interval:
+            self._export(table)
+
+    def flush(self, filepath: Optional[str] = None):
+        """Exports changed tables (all when no path is given) to their CSV mirrors."""
+        with self._lock:
+            tables = list(self._tables.values()) if filepath is None \
+                else [t for t in [self._tables.get(os.path.abspath(filepath))] if t]
+            if not tables:
+                return
+            with self.conn:
+                for table in tables:
+                    if table.dirty and table.columns:
+                        self._export(table)
+
+    def evict(self, filepath: Optional[str] = None):
+        """Flushes and forgets table bookkeeping (the database itself is kept)."""
+        with self._lock:
+            self.flush(filepath)
+            if filepath is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(os.path.abspath(filepath), None)
+
+
+# Process-wide singleton (connection opened lazily on first use)
+sqlite_store = SQLiteStore()
+atexit.register(sqlite_store.flush)
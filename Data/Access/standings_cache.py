@@ -0,0 +1,174 @@
+# standings_cache.py: Cycle-scoped per-league standings cache.
+# Refactored for Clean Architecture (v2.7)
+# This script lets fixtures of the same league share one standings scrape.
+
+"""
+Standings Cache Module
+Standings only change when a match of that league finishes, yet the match
+pipeline used to open the standings tab for every fixture. Entries are keyed
+by (league, season) and served:
+1. from memory, if the league was scraped earlier in this cycle,
+2. from standings.csv (get_standings), if the stored snapshot is younger than
+   LEO_STANDINGS_MAX_AGE_HOURS (default 12) and no result of that league has
+   finished since it was written.
+Finished results (live streamer, outcome review) invalidate their league.
+Each (league, season) snapshot is persisted at most once per cycle, unless it
+is invalidated and scraped again.
+"""
+
+import os
+from datetime import datetime as dt, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from .db_helpers import get_standings, save_standings
+from .history_index import _parse_date
+
+STANDINGS_MAX_AGE_HOURS = float(os.getenv('LEO_STANDINGS_MAX_AGE_HOURS', 12))
+SEASON_START_MONTH = 7  # Seasons roll over in July (2025/2026 runs Jul 2025 - Jun 2026)
+REQUIRED_INT_COLUMNS = ('position', 'goal_difference', 'goals_for', 'goals_against')
+OPTIONAL_INT_COLUMNS = ('played', 'wins', 'draws', 'losses', 'points')
+
+
+def league_key(region_league: Optional[str]) -> str:
+    """'ENGLAND - Premier League - Round 25' -> 'ENGLAND - PREMIER LEAGUE' (stage suffix dropped)."""
+    parts = [p.strip() for p in (region_league or '').split(' - ')]
+    return ' - '.join(parts[:2]).upper()
+
+
+def season_of(date_str: Optional[str]) -> str:
+    date = _parse_date(date_str or '')
+    if date == dt.min:
+        date = dt.now()
+    start = date.year if date.month >= SEASON_START_MONTH else date.year - 1
+    return f"{start}/{start + 1}"
+
+
+def _local_naive(ts: Optional[str]) -> Optional[dt]:
+    """ISO timestamp as naive local time; aware values (e.g. pulled from Supabase) are converted. None if unparsable."""
+    try:
+        stamp = dt.fromisoformat((ts or '').strip().replace('Z', '+00:00'))
+    except (ValueError, TypeError):
+        return None
+    return stamp.astimezone().replace(tzinfo=None) if stamp.tzinfo else stamp
+
+
+def numeric_standings(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Stored (CSV string) standings rows in the scraped shape the rule engine
+    expects: rank/goal columns as int, other counters int or None. Rows whose
+    required columns do not parse are dropped.
+    """
+    converted = []
+    for row in rows:
+        try:
+            out = dict(row)
+            for col in REQUIRED_INT_COLUMNS:
+                out[col] = int(row.get(col, 0))
+        except (TypeError, ValueError):
+            continue
+        for col in OPTIONAL_INT_COLUMNS:
+            try:
+                out[col] = int(row[col])
+            except (KeyError, TypeError, ValueError):
+                out[col] = None
+        converted.append(out)
+    return converted
+
+
+class StandingsCache:
+    """(league, season) -> standings rows, shared by all fixtures of a cycle."""
+
+    def __init__(self, max_age_hours: float = STANDINGS_MAX_AGE_HOURS):
+        self.max_age = timedelta(hours=max_age_hours)
+        self._entries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._persisted: set = set()
+        self._invalidated_at: Dict[str, dt] = {}
+        self.stats = {'memory': 0, 'store': 0, 'misses': 0, 'snapshots': 0, 'invalidations': 0}
+
+    def begin_cycle(self):
+        """Drops in-memory entries; stored snapshots stay usable while fresh."""
+        self._entries.clear()
+        self._persisted.clear()
+        self.stats = dict.fromkeys(self.stats, 0)
+
+    def get(self, region_league: str, date_str: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """{'standings', 'region_league'} for a fixture's league, or None if the tab must be scraped."""
+        league = league_key(region_league)
+        if not league or league == 'UNKNOWN':
+            return None
+        key = (league, season_of(date_str))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.stats['memory'] += 1
+            return entry
+
+        rows = self._fresh_stored_rows(region_league, league)
+        if rows:
+            self.stats['store'] += 1
+            entry = {'standings': rows, 'region_league': rows[0].get('region_league') or region_league}
+            self._entries[key] = entry
+            return entry
+
+        self.stats['misses'] += 1
+        return None
+
+    def _fresh_stored_rows(self, region_league: str, league: str) -> List[Dict[str, Any]]:
+        rows = get_standings(region_league)
+        if not rows:
+            return []
+        stamps = [_local_naive(r.get('last_updated')) for r in rows]
+        if None in stamps:
+            return []
+        written = min(stamps)
+        try:
+            if dt.now() - written > self.max_age:
+                return []
+            invalidated = self._invalidated_at.get(league)
+            if invalidated and written <= invalidated:
+                return []
+        except TypeError:
+            return []
+        return numeric_standings(rows)
+
+    def put(self, region_league: str, date_str: Optional[str], standings: List[Dict[str, Any]],
+            standings_league: str, league_url: str = ""):
+        """
+        Caches a scraped table under the fixture's league and persists it once
+        per cycle. Empty tables (cups, draw brackets) are cached but not stored.
+        """
+        league = league_key(region_league) or league_key(standings_league)
+        if not league or league == 'UNKNOWN':
+            return
+        key = (league, season_of(date_str))
+        self._entries[key] = {'standings': standings, 'region_league': standings_league}
+        if standings and standings_league != "Unknown" and key not in self._persisted:
+            for row in standings:
+                row['url'] = league_url
+            save_standings(standings, standings_league)
+            self._persisted.add(key)
+            self.stats['snapshots'] += 1
+
+    def invalidate(self, region_league: Optional[str]):
+        """A result of this league finished: its standings must be scraped again."""
+        league = league_key(region_league)
+        if not league:
+            return
+        self._invalidated_at[league] = dt.now()
+        stale = [key for key in self._entries if key[0] == league]
+        for key in stale:
+            del self._entries[key]
+            self._persisted.discard(key)
+        if stale:
+            self.stats['invalidations'] += 1
+
+    def print_summary(self):
+        s = self.stats
+        lookups = s['memory'] + s['store'] + s['misses']
+        if not lookups:
+            return
+        print(f"    [Standings Cache] {s['memory'] + s['store']}/{lookups} fixtures served without the tab "
+              f"(memory {s['memory']}, store {s['store']}); {s['snapshots']} snapshots saved, "
+              f"{s['invalidations']} invalidations.")
+
+
+standings_cache = StandingsCache()
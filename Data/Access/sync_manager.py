@@ -1,16 +1,21 @@
 import csv
+import json
 import logging
 import asyncio
+import os
 import re
+import time
 import pandas as pd
 import numpy as np
 from tqdm import tqdm
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Set
 
 from Data.Access.supabase_client import get_supabase_client
-from Data.Access.db_helpers import DB_DIR, files_and_headers
+from Data.Access.db_helpers import DB_DIR, files_and_headers, flush_tables, _read_csv
 
 logger = logging.getLogger(__name__)
 
@@ -33,24 +38,85 @@ TABLE_CONFIG = {
     'live_scores': {'csv': 'live_scores.csv', 'table': 'live_scores', 'key': 'fixture_id'},
 }
 
+# supabase-py is synchronous: its calls run on a dedicated pool so the event loop
+# (live streamer, Playwright) keeps running, and at most SYNC_CONCURRENCY tables sync at once.
+SYNC_CONCURRENCY = int(os.getenv('LEO_SYNC_CONCURRENCY', 4))
+_SYNC_EXECUTOR = ThreadPoolExecutor(max_workers=SYNC_CONCURRENCY, thread_name_prefix="supabase-sync")
+
+# Per-table wall time (seconds) of the most recent sync, for per-cycle cost reporting.
+LAST_SYNC_TIMINGS: Dict[str, float] = {}
+
+# Per-table high-watermarks: 'pull' = max remote last_updated seen,
+# 'push' = max local last_updated at the last successful push.
+WATERMARK_FILE = DATA_DIR / "sync_watermarks.json"
+EPOCH_TS = '1970-01-01T00:00:00'
+
+
+@lru_cache(maxsize=200000)
+def _normalize_ts(ts) -> str:
+    """
+    Normalize timestamps so ISO string comparison is a fair 'newer than' test.
+    Local stamps are naive and Supabase stores them as UTC (timestamptz), so an
+    aware remote value maps back to the local format by dropping its UTC offset.
+    """
+    if not ts or ts in ('None', 'nan', ''): return EPOCH_TS
+    try:
+        stamp = pd.to_datetime(ts)
+        if stamp.tzinfo is not None:
+            stamp = stamp.tz_convert('UTC').tz_localize(None)
+        return stamp.isoformat()
+    except:
+        return EPOCH_TS
+
+
+def _max_ts(values) -> Optional[str]:
+    """Returns the raw value with the greatest normalized timestamp, or None."""
+    best, best_norm = None, EPOCH_TS
+    for v in values:
+        norm = _normalize_ts(v)
+        if norm > best_norm:
+            best, best_norm = v, norm
+    return best
+
+
+def _load_watermarks() -> Dict[str, Dict[str, str]]:
+    try:
+        with open(WATERMARK_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_watermarks(marks: Dict[str, Dict[str, str]]):
+    try:
+        temp_file = str(WATERMARK_FILE) + '.tmp'
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(marks, f, indent=2)
+        Path(temp_file).replace(WATERMARK_FILE)
+    except OSError as e:
+        logger.error(f"    [x] Failed to persist sync watermarks: {e}")
+
+
 class SyncManager:
     """
     Manages bi-directional synchronization between local CSVs and Supabase using pandas.
     """
     def __init__(self):
         self.supabase = get_supabase_client()
+        self.watermarks = _load_watermarks()
         if not self.supabase:
             logger.warning("[!] SyncManager initialized without Supabase connection. Sync disabled.")
 
     async def _retry_async(self, func, *args, max_retries: int = 3, initial_delay: float = 1.0, **kwargs):
-        """Helper for exponential backoff retries on async operations."""
+        """Helper for exponential backoff retries. Blocking callables run on the sync executor."""
         retries = 0
         while retries < max_retries:
             try:
                 if asyncio.iscoroutinefunction(func):
                     return await func(*args, **kwargs)
                 else:
-                    return func(*args, **kwargs)
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(_SYNC_EXECUTOR, lambda: func(*args, **kwargs))
             except Exception as e:
                 retries += 1
                 if retries == max_retries:
@@ -66,22 +132,57 @@ class SyncManager:
             return
 
         logger.info("Starting hardened bi-directional sync on startup...")
+        await self.sync_tables()
+
+    async def sync_tables(self, table_keys: Optional[List[str]] = None, full: bool = False) -> Dict[str, Optional[str]]:
+        """
+        Sync tables concurrently (bounded by SYNC_CONCURRENCY).
+        Returns {table_key: error message or None}; timings land in LAST_SYNC_TIMINGS.
+        """
+        semaphore = asyncio.Semaphore(SYNC_CONCURRENCY)
+        keys = table_keys or list(TABLE_CONFIG.keys())
+
+        async def _run(table_key: str):
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    await self._sync_table(table_key, TABLE_CONFIG[table_key], full=full)
+                    return table_key, None
+                except Exception as e:
+                    logger.error(f"    [Sync Fatal] {table_key}: {e}")
+                    return table_key, str(e)
+                finally:
+                    LAST_SYNC_TIMINGS[table_key] = round(time.perf_counter() - start, 2)
+
+        results = dict(await asyncio.gather(*(_run(k) for k in keys)))
+        timings = ", ".join(f"{k}={LAST_SYNC_TIMINGS[k]}s" for k in keys)
+        logger.info(f"  [Sync Timings] {timings}")
+        return results
+
+    async def _sync_table(self, table_key: str, config: Dict, full: bool = False):
+        """
+        Sync a single table. Uses the stored watermarks for an incremental
+        pull/push when available; otherwise (or when full=True) falls back to
+        the complete metadata diff, which then seeds the watermarks.
+        """
+        csv_path = DATA_DIR / config['csv']
+        if not csv_path.exists():
+            logger.warning(f"  [SKIP] {config['csv']} not found.")
+            return
 
-        for table_key, config in TABLE_CONFIG.items():
-            await self._sync_table(table_key, config)
+        mark = self.watermarks.get(table_key)
+        if mark and not full:
+            await self._sync_table_incremental(table_key, config, csv_path, mark)
+        else:
+            await self._sync_table_full(table_key, config, csv_path)
 
-    async def _sync_table(self, table_key: str, config: Dict):
-        """Sync a single table using pandas for delta detection."""
+    async def _sync_table_full(self, table_key: str, config: Dict, csv_path: Path):
+        """Full sync using pandas for delta detection over all remote metadata."""
         table_name = config['table']
         csv_file = config['csv']
         key_field = config['key']
-        csv_path = DATA_DIR / csv_file
-        
-        if not csv_path.exists():
-            logger.warning(f"  [SKIP] {csv_file} not found.")
-            return
 
-        logger.info(f"  Syncing {table_name} <-> {csv_file}...")
+        logger.info(f"  Syncing {table_name} <-> {csv_file} (full)...")
 
         # 1. Fetch Remote Metadata (ID + last_updated)
         try:
@@ -92,6 +193,7 @@ class SyncManager:
 
         # 2. Load Local Data with Pandas
         try:
+            flush_tables(str(csv_path))
             df_local = pd.read_csv(csv_path, dtype=str).fillna('')
             if key_field not in df_local.columns:
                  logger.error(f"    [x] Key field {key_field} missing in local {csv_file}")
@@ -108,18 +210,9 @@ class SyncManager:
 
         # 3. Delta Detection (Latest Wins logic)
         remote_df = pd.DataFrame(list(remote_meta.items()), columns=[key_field, 'remote_ts'])
-        
-        # Normalize timestamps for fair comparison
-        def normalize_ts(ts):
-            if not ts or ts in ('None', 'nan', ''): return '1970-01-01T00:00:00'
-            try:
-                # Ensure ISO format comparison works as string comparison
-                return pd.to_datetime(ts).isoformat()
-            except:
-                return '1970-01-01T00:00:00'
 
-        df_local['last_updated'] = df_local['last_updated'].apply(normalize_ts)
-        remote_df['remote_ts'] = remote_df['remote_ts'].apply(normalize_ts)
+        df_local['last_updated'] = df_local['last_updated'].apply(_normalize_ts)
+        remote_df['remote_ts'] = remote_df['remote_ts'].apply(_normalize_ts)
 
         # Merge to compare
         merged = pd.merge(df_local[[key_field, 'last_updated']], remote_df, on=key_field, how='outer').fillna('')
@@ -127,13 +220,13 @@ class SyncManager:
         # PUSH: Local is strictly newer OR Remote doesn't have it
         to_push_ids = merged[
             (merged['last_updated'] > merged['remote_ts']) | 
-            ((merged['last_updated'] != '1970-01-01T00:00:00') & (merged['remote_ts'] == '1970-01-01T00:00:00'))
+            ((merged['last_updated'] != EPOCH_TS) & (merged['remote_ts'] == EPOCH_TS))
         ][key_field].tolist()
 
         # PULL: Remote is strictly newer OR Local doesn't have it
         to_pull_ids = merged[
             (merged['remote_ts'] > merged['last_updated']) |
-            ((merged['remote_ts'] != '1970-01-01T00:00:00') & (merged['last_updated'] == '1970-01-01T00:00:00'))
+            ((merged['remote_ts'] != EPOCH_TS) & (merged['last_updated'] == EPOCH_TS))
         ][key_field].tolist()
 
         logger.info(f"    Delta: {len(to_push_ids)} to push, {len(to_pull_ids)} to pull. (Conflict resolution: Latest Wins)")
@@ -143,13 +236,100 @@ class SyncManager:
             await self._pull_updates(table_name, key_field, to_pull_ids, csv_path)
 
         # 5. Push Operations
+        pushed = True
+        rows_to_push = []
         if to_push_ids:
              rows_to_push = df_local[df_local[key_field].isin(to_push_ids)].to_dict('records')
-             await self.batch_upsert(table_key, rows_to_push)
+             pushed = await self.batch_upsert(table_key, rows_to_push)
              
              # 6. Verification Phase
              await self._verify_sync_parity(table_key, to_push_ids)
 
+        # 7. Seed watermarks for the incremental path
+        self._advance_watermarks(table_key, remote_meta.values(), rows_to_push if pushed else [])
+
+    async def _sync_table_incremental(self, table_key: str, config: Dict, csv_path: Path, mark: Dict[str, str]):
+        """Pull rows changed remotely since the pull watermark, push rows changed locally since the push watermark."""
+        table_name = config['table']
+        key_field = config['key']
+        csv_key = str(csv_path)
+
+        # 1. Pull: remote rows with last_updated > watermark
+        try:
+            remote_rows = await self._fetch_remote_changes(table_name, mark.get('pull', ''))
+        except Exception as e:
+            logger.error(f"    [x] Failed to fetch remote changes for {table_name}: {e}")
+            return
+
+        local_ts = {str(r.get(key_field)): _normalize_ts(r.get('last_updated')) for r in _read_csv(csv_key)}
+        to_apply = [
+            r for r in remote_rows
+            if r.get(key_field) and _normalize_ts(r.get('last_updated')) > local_ts.get(str(r[key_field]), EPOCH_TS)
+        ]
+        pulled_ids = {str(r[key_field]) for r in to_apply}
+        if to_apply:
+            self._merge_pulled(key_field, to_apply, csv_path)
+
+        # 2. Push: local rows modified since the last successful push
+        local_rows = _read_csv(csv_key)
+        push_mark = mark.get('push', EPOCH_TS)
+        to_push = [
+            r for r in local_rows
+            if str(r.get(key_field)) not in pulled_ids and _normalize_ts(r.get('last_updated')) > push_mark
+        ]
+
+        logger.info(f"  Syncing {table_name}: {len(to_push)} to push, {len(to_apply)}/{len(remote_rows)} pulled (incremental).")
+
+        pushed = True
+        if to_push:
+            pushed = await self.batch_upsert(table_key, to_push)
+            await self._verify_sync_parity(table_key, [str(r[key_field]) for r in to_push])
+
+        self._advance_watermarks(table_key, (r.get('last_updated') for r in remote_rows), to_push if pushed else [])
+
+    def _advance_watermarks(self, table_key: str, remote_stamps, pushed_rows: List[Dict[str, Any]]):
+        """
+        pull: newest remote stamp actually fetched. Our own pushed stamps are
+        host-local and must not move it, or rows other writers stamped in
+        between would never be pulled; pushed rows come back once and are
+        dropped by the last_updated comparison. push: newest pushed stamp.
+        """
+        self._set_watermark(table_key, pull=_max_ts(remote_stamps),
+                            push=_max_ts(r.get('last_updated') for r in pushed_rows))
+
+    def _set_watermark(self, table_key: str, pull: Optional[str] = None, push: Optional[str] = None):
+        """Advances (never rewinds) the per-table watermarks and persists them."""
+        mark = self.watermarks.setdefault(table_key, {})
+        if pull and _normalize_ts(pull) > _normalize_ts(mark.get('pull')):
+            mark['pull'] = pull
+        if push and _normalize_ts(push) > mark.get('push', EPOCH_TS):
+            mark['push'] = _normalize_ts(push)
+        mark.setdefault('pull', '')
+        mark.setdefault('push', EPOCH_TS)
+        _save_watermarks(self.watermarks)
+
+    async def _fetch_remote_changes(self, table_name: str, since: str) -> List[Dict[str, Any]]:
+        """Fetch full rows with last_updated > since (all rows when since is empty)."""
+        rows = []
+        batch_size = 1000
+        offset = 0
+
+        while True:
+            def func(o=offset):
+                query = self.supabase.table(table_name).select("*")
+                if since:
+                    query = query.gt('last_updated', since)
+                return query.order('last_updated').range(o, o + batch_size - 1).execute()
+
+            res = await self._retry_async(func)
+            batch = res.data or []
+            rows.extend(batch)
+            if len(batch) < batch_size:
+                break
+            offset += batch_size
+
+        return rows
+
     async def _fetch_remote_metadata(self, table_name: str, key_field: str) -> Dict[str, str]:
         """Fetch all ID:last_updated pairs from Supabase."""
         remote_map = {}
@@ -202,10 +382,13 @@ class SyncManager:
             pbar.update(len(batch_ids))
         pbar.close()
 
-        if not pulled_data:
-            return
+        if pulled_data:
+            self._merge_pulled(key_field, pulled_data, csv_path)
 
+    def _merge_pulled(self, key_field: str, pulled_data: List[Dict[str, Any]], csv_path: Path):
+        """Merge pulled remote rows into the local CSV using pandas."""
         # Load local, update with pulled, save
+        flush_tables(str(csv_path))
         df_local = pd.read_csv(csv_path, dtype=str).fillna('')
         df_remote = pd.DataFrame(pulled_data).astype(str).fillna('')
         
@@ -215,6 +398,9 @@ class SyncManager:
             df_remote = df_remote.drop(columns=['over_2_5'])
 
         # Data Normalization (PostgreSQL -> CSV formats)
+        if 'last_updated' in df_remote.columns:
+            df_remote['last_updated'] = df_remote['last_updated'].apply(
+                lambda x: _normalize_ts(x) if x not in ('', 'None', 'nan') else '')
         for col in df_remote.columns:
             if col in ['date', 'date_updated', 'last_extracted']:
                 df_remote[col] = df_remote[col].apply(lambda x: f"{x[8:10]}.{x[5:7]}.{x[0:4]}" if len(x) >= 10 and '-' in x else x)
@@ -240,13 +426,13 @@ class SyncManager:
         df_final.to_csv(csv_path, index=False, encoding='utf-8')
         logger.info(f"    [SUCCESS] {csv_path.name} updated via pandas.")
 
-    async def batch_upsert(self, table_key: str, data: List[Dict[str, Any]]):
-        """Upsert a batch of data to Supabase with strict cleaning."""
+    async def batch_upsert(self, table_key: str, data: List[Dict[str, Any]]) -> bool:
+        """Upsert a batch of data to Supabase with strict cleaning. Returns False on failure."""
         if not self.supabase or not data:
-            return
+            return not data
 
         conf = TABLE_CONFIG.get(table_key)
-        if not conf: return
+        if not conf: return False
         
         table_name = conf['table']
         conflict_key = conf['key']
@@ -307,7 +493,7 @@ class SyncManager:
                 if kv not in seen:
                     seen.add(kv); deduped.append(row)
         
-        if not deduped: return
+        if not deduped: return True
 
         try:
             # Batch size for Supabase upsert (usually 1000 is safe)
@@ -322,8 +508,10 @@ class SyncManager:
                 
             pbar.close()
             logger.info(f"    [SYNC] Upserted {len(deduped)} rows to {table_name}.")
+            return True
         except Exception as e:
             logger.error(f"    [x] Upsert failed: {e}")
+            return False
 
     async def _verify_sync_parity(self, table_key: str, pushed_ids: List[str], sample_size: int = 10):
         """Pick a sample and verify parity between local and remote."""
@@ -345,6 +533,7 @@ class SyncManager:
             remote_rows = {str(r[key_field]): r for r in res.data}
             
             # Load local sample
+            flush_tables(str(DATA_DIR / conf['csv']))
             df_local = pd.read_csv(DATA_DIR / conf['csv'], dtype=str).fillna('')
             local_sample = df_local[df_local[key_field].astype(str).isin(sample_ids)].to_dict('records')
             local_rows = {str(r[key_field]): r for r in local_sample}
@@ -390,28 +579,27 @@ class SyncManager:
         except Exception as e:
             logger.error(f"    [x] Parity verification failed: {e}")
 
-async def run_full_sync(session_name: str = "Periodic"):
-    """Wrapper to sync ALL tables with audit logging and failure reporting."""
+async def run_full_sync(session_name: str = "Periodic", full: bool = False):
+    """
+    Wrapper to sync ALL tables with audit logging and failure reporting.
+    Tables with stored watermarks sync incrementally unless full=True.
+    """
     from Data.Access.db_helpers import log_audit_event
     manager = SyncManager()
     logger.info(f"Starting global full sync [{session_name}]...")
     
-    success_count = 0
-    fail_count = 0
-    errors = []
-
-    for table_key, config in TABLE_CONFIG.items():
-        try:
-            await manager._sync_table(table_key, config)
-            success_count += 1
-        except Exception as e:
-            logger.error(f"    [Sync Fatal] {table_key}: {e}")
-            fail_count += 1
-            errors.append(f"{table_key}: {str(e)}")
+    started = time.perf_counter()
+    results = await manager.sync_tables(full=full)
+    errors = [f"{k}: {err}" for k, err in results.items() if err]
+    fail_count = len(errors)
+    success_count = len(results) - fail_count
 
     # Audit Logging
     status = "success" if fail_count == 0 else "partial_failure" if success_count > 0 else "failed"
-    msg = f"Full Chapter Sync ({session_name}): {success_count} passed, {fail_count} failed."
+    slowest = sorted(results, key=lambda k: LAST_SYNC_TIMINGS.get(k, 0), reverse=True)[:3]
+    msg = (f"Full Chapter Sync ({session_name}): {success_count} passed, {fail_count} failed "
+           f"in {time.perf_counter() - started:.1f}s. Slowest: "
+           + ", ".join(f"{k} {LAST_SYNC_TIMINGS.get(k, 0)}s" for k in slowest) + ".")
     if errors:
         msg += f" Errors: {'; '.join(errors[:3])}"
         
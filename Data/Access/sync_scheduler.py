@@ -0,0 +1,107 @@
+# sync_scheduler.py: Coalescing background Supabase sync.
+# Refactored for Clean Architecture (v2.7)
+# This script batches sync requests so scraping never waits on a sync.
+
+"""
+Sync Scheduler Module
+Callers mark the tables they changed as dirty and move on. A single
+background task waits for a debounce window to collect further changes,
+then syncs only the dirty tables. Tables marked while a sync is running are
+picked up by the next window; tables whose sync failed stay dirty.
+
+Configuration:
+- LEO_SYNC_DEBOUNCE: seconds to coalesce requests before syncing (default 30).
+"""
+
+import asyncio
+import logging
+import os
+from typing import Optional, Set
+
+logger = logging.getLogger(__name__)
+
+SYNC_DEBOUNCE = float(os.getenv('LEO_SYNC_DEBOUNCE', 30))
+
+
+class SyncScheduler:
+    """Tracks dirty tables and syncs them in coalesced background batches."""
+
+    def __init__(self, debounce: float = SYNC_DEBOUNCE):
+        self.debounce = debounce
+        self.dirty: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._waiting = False
+        self.sync_count = 0
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def mark_dirty(self, *table_keys: str):
+        """Records changed tables and arms the debounce timer (non-blocking)."""
+        self.dirty.update(table_keys)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop: picked up by the next flush()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._debounced())
+
+    async def _debounced(self):
+        self._waiting = True
+        try:
+            await asyncio.sleep(self.debounce)
+        finally:
+            self._waiting = False
+        await self._sync_dirty("Background")
+        # Changes that arrived during the sync get their own window.
+        if self.dirty:
+            self._task = asyncio.create_task(self._debounced())
+
+    async def _sync_dirty(self, session_name: str) -> bool:
+        from Data.Access.sync_manager import SyncManager
+
+        async with self._get_lock():
+            if not self.dirty:
+                return True
+            tables = sorted(self.dirty)
+            self.dirty.clear()
+
+            manager = SyncManager()
+            if not manager.supabase:
+                return False
+
+            logger.info(f"  [Sync Scheduler] {session_name} sync of {len(tables)} dirty tables: {', '.join(tables)}")
+            try:
+                results = await manager.sync_tables(tables)
+            except Exception as e:
+                logger.error(f"  [Sync Scheduler] Sync failed: {e}")
+                self.dirty.update(tables)
+                return False
+
+            failed = [k for k, err in results.items() if err]
+            self.dirty.update(failed)
+            self.sync_count += 1
+            return not failed
+
+    async def flush(self, session_name: str = "Final") -> bool:
+        """Skips the pending debounce (or waits for a running sync) and syncs all dirty tables now."""
+        task = self._task
+        if task is not None and not task.done() and task is not asyncio.current_task():
+            if self._waiting:
+                task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._task is not None and not self._task.done():
+            # A follow-up window was armed by the sync we waited on; this flush covers it.
+            self._task.cancel()
+        self._task = None
+        return await self._sync_dirty(session_name)
+
+
+# Process-wide singleton
+sync_scheduler = SyncScheduler()
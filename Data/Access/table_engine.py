@@ -0,0 +1,306 @@
+# table_engine.py: In-memory indexed table store behind the CSV helpers.
+# Refactored for Clean Architecture (v2.7)
+# This script keeps Data/Store tables resident in memory and flushes them atomically.
+
+"""
+Table Engine Module
+Loads each CSV table once, indexes it by primary key on demand and serves
+reads/UPSERTs from memory. Changed tables are written back atomically
+(temp file + os.replace) on a configurable interval, at chapter boundaries
+and at process exit.
+
+Configuration:
+- LEO_TABLE_FLUSH_INTERVAL: seconds between automatic flushes of a changed
+  table (default 30). Set to 0 for write-through behaviour.
+"""
+
+import os
+import csv
+import time
+import atexit
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+FLUSH_INTERVAL = float(os.getenv('LEO_TABLE_FLUSH_INTERVAL', 30))
+
+
+def _is_older(row: Dict[str, Any], other: Dict[str, Any]) -> bool:
+    """True if row carries a last_updated strictly older than other's."""
+    ts = row.get('last_updated') or ''
+    other_ts = other.get('last_updated') or ''
+    return bool(ts and other_ts and ts < other_ts)
+
+
+class _Table:
+    """A single CSV file held in memory."""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.rows: List[Dict[str, Any]] = []
+        self.fieldnames: List[str] = []
+        self.indexes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # (unique_key, id) -> fields upserted since the last flush. Re-applied if
+        # the file is rewritten behind our back so buffered writes are never lost,
+        # without clobbering the columns the other writer changed.
+        self.pending: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.dirty = False
+        self.disk_stat: Optional[Tuple[int, int]] = None
+        self.last_flush = time.monotonic()
+
+
+class TableEngine:
+    """Process-wide cache of CSV tables with primary-key indexes."""
+
+    def __init__(self, flush_interval: float = FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._tables: Dict[str, _Table] = {}
+        self._lock = threading.RLock()
+
+    # --- Loading & invalidation ---
+
+    @staticmethod
+    def _stat(filepath: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(filepath)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def _load(self, table: _Table):
+        """(Re)reads the file from disk, replacing the in-memory rows."""
+        table.rows = []
+        table.indexes = {}
+        table.disk_stat = self._stat(table.filepath)
+        if not table.disk_stat or table.disk_stat[1] == 0:
+            return
+        try:
+            with open(table.filepath, 'r', newline='', encoding='utf-8') as f:
+                reader = csv.DictReader(f)
+                table.rows = list(reader)
+                if reader.fieldnames and not table.fieldnames:
+                    table.fieldnames = list(reader.fieldnames)
+        except Exception as e:
+            print(f"    [File Error] Could not read {table.filepath}: {e}")
+            table.rows = []
+
+    def _get(self, filepath: str) -> _Table:
+        """Returns the cached table, reloading it if the file changed on disk."""
+        path = os.path.abspath(filepath)
+        table = self._tables.get(path)
+        if table is None:
+            table = _Table(path)
+            self._load(table)
+            self._tables[path] = table
+        elif self._stat(path) != table.disk_stat:
+            # Written by another process or a legacy direct writer.
+            pending = table.pending
+            self._load(table)
+            table.pending = {}
+            for (unique_key, uid), delta in pending.items():
+                existing = self._index(table, unique_key).get(uid)
+                if existing is not None and _is_older(delta, existing):
+                    continue  # The other writer's row is newer
+                self._apply_upsert(table, delta, unique_key)
+                table.pending[(unique_key, uid)] = delta
+        return table
+
+    def _index(self, table: _Table, unique_key: str) -> Dict[str, Dict[str, Any]]:
+        index = table.indexes.get(unique_key)
+        if index is None:
+            index = {}
+            for row in table.rows:
+                uid = row.get(unique_key)
+                if uid:
+                    index.setdefault(uid, row)
+            table.indexes[unique_key] = index
+        return index
+
+    # --- Mutations ---
+
+    def _apply_upsert(self, table: _Table, data_row: Dict[str, Any], unique_key: str):
+        index = self._index(table, unique_key)
+        unique_id = data_row.get(unique_key)
+        existing = index.get(unique_id)
+        if existing is not None:
+            existing.update(data_row)
+            return existing
+
+        row = dict(data_row)
+        table.rows.append(row)
+        for key, idx in table.indexes.items():
+            uid = row.get(key)
+            if uid:
+                idx.setdefault(uid, row)
+        return row
+
+    @staticmethod
+    def _track(table: _Table, unique_key: str, data_row: Dict[str, Any]):
+        table.pending.setdefault((unique_key, data_row.get(unique_key)), {}).update(data_row)
+
+    def upsert(self, filepath: str, data_row: Dict[str, Any], fieldnames: List[str], unique_key: str):
+        """UPSERTs one row in memory; the file is written on the next flush."""
+        with self._lock:
+            table = self._get(filepath)
+            if fieldnames:
+                table.fieldnames = list(fieldnames)
+            self._apply_upsert(table, data_row, unique_key)
+            self._track(table, unique_key, data_row)
+            table.dirty = True
+            self._maybe_flush(table)
+
+    def upsert_many(self, filepath: str, data_rows: List[Dict[str, Any]], fieldnames: List[str], unique_key: str) -> int:
+        """
+        Merges a batch of rows in one pass. Rows sharing a key resolve by
+        last-write-wins on 'last_updated' (both within the batch and against
+        the stored row). Returns the number of rows applied.
+        """
+        latest: Dict[str, Dict[str, Any]] = {}
+        for row in data_rows:
+            uid = row.get(unique_key)
+            if not uid:
+                continue
+            current = latest.get(uid)
+            if current is None or not _is_older(row, current):
+                latest[uid] = row
+
+        if not latest:
+            return 0
+
+        with self._lock:
+            table = self._get(filepath)
+            if fieldnames:
+                table.fieldnames = list(fieldnames)
+            index = self._index(table, unique_key)
+            applied = 0
+            for uid, row in latest.items():
+                existing = index.get(uid)
+                if existing is not None and _is_older(row, existing):
+                    continue
+                self._apply_upsert(table, row, unique_key)
+                self._track(table, unique_key, row)
+                applied += 1
+            if applied:
+                table.dirty = True
+                self._maybe_flush(table)
+            return applied
+
+    def replace(self, filepath: str, rows: List[Dict[str, Any]], fieldnames: List[str]):
+        """Replaces the whole table and writes it through immediately."""
+        with self._lock:
+            table = self._get(filepath)
+            table.rows = [dict(r) for r in rows]
+            table.indexes = {}
+            table.fieldnames = list(fieldnames)
+            table.pending = {}
+            table.dirty = True
+            self._flush_table(table)
+
+    def append(self, filepath: str, data_row: Dict[str, Any], fieldnames: List[str]):
+        """Appends a row to the file, keeping a loaded table in step."""
+        with self._lock:
+            path = os.path.abspath(filepath)
+            table = self._tables.get(path)
+            if table is not None:
+                self._flush_table(table)
+                if self._stat(path) != table.disk_stat:
+                    del self._tables[path]
+                    table = None
+
+            file_exists = os.path.exists(path) and os.path.getsize(path) > 0
+            try:
+                with open(path, 'a', newline='', encoding='utf-8') as f:
+                    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+                    if not file_exists:
+                        writer.writeheader()
+                    writer.writerow(data_row)
+            except Exception as e:
+                print(f"    [File Error] Failed to write to {filepath}: {e}")
+                return
+
+            if table is not None:
+                if not table.fieldnames:
+                    table.fieldnames = list(fieldnames)
+                row = dict(data_row)
+                table.rows.append(row)
+                for key, idx in table.indexes.items():
+                    uid = row.get(key)
+                    if uid:
+                        idx.setdefault(uid, row)
+                table.disk_stat = self._stat(path)
+
+    # --- Reads ---
+
+    def read(self, filepath: str) -> List[Dict[str, Any]]:
+        """Returns copies of all rows (callers are free to mutate them)."""
+        with self._lock:
+            return [dict(r) for r in self._get(filepath).rows]
+
+    def get(self, filepath: str, unique_key: str, unique_id: str) -> Optional[Dict[str, Any]]:
+        """O(1) primary-key lookup. Returns a copy of the row or None."""
+        with self._lock:
+            row = self._index(self._get(filepath), unique_key).get(unique_id)
+            return dict(row) if row is not None else None
+
+    def query(self, filepath: str, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Returns copies of rows whose columns equal every filter value."""
+        with self._lock:
+            return [
+                dict(r) for r in self._get(filepath).rows
+                if all(r.get(col) == val for col, val in filters.items())
+            ]
+
+    # --- Flushing ---
+
+    def _maybe_flush(self, table: _Table):
+        if time.monotonic() - table.last_flush >= self.flush_interval:
+            self._flush_table(table)
+
+    def _flush_table(self, table: _Table):
+        if not table.dirty:
+            return
+        fieldnames = table.fieldnames
+        if not fieldnames and table.rows:
+            fieldnames = list(table.rows[0].keys())
+
+        temp_file = table.filepath + '.tmp'
+        try:
+            with open(temp_file, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(table.rows)
+            os.replace(temp_file, table.filepath)
+        except Exception as e:
+            print(f"    [File Error] Failed to write to {table.filepath}: {e}")
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+            return
+
+        table.disk_stat = self._stat(table.filepath)
+        table.pending = {}
+        table.dirty = False
+        table.last_flush = time.monotonic()
+
+    def flush(self, filepath: Optional[str] = None):
+        """Flushes one table (or all tables when no path is given) to disk."""
+        with self._lock:
+            if filepath is None:
+                for table in list(self._tables.values()):
+                    self._flush_table(table)
+                return
+            table = self._tables.get(os.path.abspath(filepath))
+            if table is not None:
+                self._flush_table(table)
+
+    def evict(self, filepath: Optional[str] = None):
+        """Flushes and forgets cached tables (used by tests and benchmarks)."""
+        with self._lock:
+            self.flush(filepath)
+            if filepath is None:
+                self._tables.clear()
+            else:
+                self._tables.pop(os.path.abspath(filepath), None)
+
+
+# Process-wide singleton
+table_engine = TableEngine()
+atexit.register(table_engine.flush)
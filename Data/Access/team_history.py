@@ -0,0 +1,132 @@
+# team_history.py: Freshness-aware local form/H2H resolver.
+# Refactored for Clean Architecture (v2.7)
+# This script decides when schedules.csv already holds a team's recent results.
+
+"""
+Team History Module
+Every H2H tab scrape is written back to schedules.csv, so for well-covered
+leagues the last 10 results of both teams are usually already on disk. The
+resolver serves form/H2H input from a HistoryIndex when a side is fresh:
+- at least FORM_SIZE finished results before kickoff,
+- no past fixture of that team newer than its latest known result is still
+  missing a score (i.e. local history reaches its most recent played match),
+- the latest known result is at most LEO_HISTORY_MAX_AGE_DAYS old (default 30),
+  which guards teams whose fixtures are not tracked locally at all.
+
+The index is built once per cycle (refresh()) and kept current with record()
+as new H2H rows are scraped. Hit/miss counters are kept per side and per
+fixture; a fixture is a hit when both sides resolve and the tab is skipped.
+"""
+
+import os
+from datetime import datetime as dt
+from typing import Any, Dict, List, Optional
+
+from .db_helpers import get_all_schedules
+from .history_index import HistoryIndex, _is_finished, _parse_date
+
+FORM_SIZE = 10
+HISTORY_MAX_AGE_DAYS = int(os.getenv('LEO_HISTORY_MAX_AGE_DAYS', 30))
+
+# Past fixtures with these statuses will never get a score: not a gap in history
+VOID_STATUSES = {'postponed', 'cancelled', 'canceled', 'abandoned', 'awarded', 'walkover'}
+
+
+class TeamHistoryResolver:
+    """Serves form and H2H from local schedules when they are provably up to date."""
+
+    def __init__(self, max_age_days: int = HISTORY_MAX_AGE_DAYS):
+        self.max_age_days = max_age_days
+        self.index: Optional[HistoryIndex] = None
+        self._pending: Dict[str, Dict[str, dt]] = {}  # team -> {fixture_id: date} of unscored past fixtures
+        self.stats = {'fixtures': 0, 'hits': 0, 'sides': 0, 'fresh_sides': 0,
+                      'short': 0, 'stale': 0, 'pending': 0}
+
+    def refresh(self, schedules: Optional[List[Dict[str, Any]]] = None):
+        """(Re)builds the index from schedules; call once per cycle."""
+        schedules = get_all_schedules() if schedules is None else schedules
+        self.index = HistoryIndex(schedules)
+        self._pending = {}
+        self.stats = dict.fromkeys(self.stats, 0)
+        today = dt.now()
+        for row in schedules:
+            if _is_finished(row) or (row.get('match_status') or '').lower() in VOID_STATUSES:
+                continue
+            date = _parse_date(row.get('date', ''))
+            if date == dt.min or date.date() >= today.date():
+                continue
+            for team in (row.get('home_team'), row.get('away_team')):
+                if team:
+                    self._pending.setdefault(team, {})[row.get('fixture_id') or id(row)] = date
+
+    def _ensure(self):
+        if self.index is None:
+            self.refresh()
+
+    def record(self, rows: List[Dict[str, Any]]):
+        """Adds freshly scraped finished rows (e.g. from the H2H tab) to the index."""
+        self._ensure()
+        for row in rows:
+            if self.index.add(row):
+                for team in (row.get('home_team'), row.get('away_team')):
+                    self._pending.get(team, {}).pop(row.get('fixture_id'), None)
+
+    def team_form(self, team: str, kickoff: dt) -> Optional[List[Dict[str, Any]]]:
+        """Last FORM_SIZE results before kickoff if the team's history is fresh, else None."""
+        self._ensure()
+        self.stats['sides'] += 1
+        form = self.index.team_form(team, kickoff, FORM_SIZE)
+        if len(form) < FORM_SIZE:
+            self.stats['short'] += 1
+            return None
+        latest = _parse_date(form[0].get('date', ''))
+        if (kickoff - latest).days > self.max_age_days:
+            self.stats['stale'] += 1
+            return None
+        if any(latest < d < kickoff for d in self._pending.get(team, {}).values()):
+            self.stats['pending'] += 1
+            return None
+        self.stats['fresh_sides'] += 1
+        return form
+
+    def resolve(self, match_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        h2h_data built from local history (same shape as extract_h2h_data), or
+        None when either side needs the H2H tab.
+        """
+        self._ensure()
+        home_team, away_team = match_data.get('home_team'), match_data.get('away_team')
+        kickoff = _parse_date(match_data.get('date', ''))
+        if kickoff == dt.min:
+            kickoff = dt.now()
+        kickoff = kickoff.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        self.stats['fixtures'] += 1
+        home_form = self.team_form(home_team, kickoff)
+        away_form = self.team_form(away_team, kickoff)
+        if home_form is None or away_form is None:
+            return None
+
+        self.stats['hits'] += 1
+        return {
+            "home_team": home_team,
+            "away_team": away_team,
+            "home_last_10_matches": home_form,
+            "away_last_10_matches": away_form,
+            "head_to_head": self.index.head_to_head(home_team, away_team, kickoff),
+            "region_league": match_data.get('region_league', 'Unknown'),
+        }
+
+    @property
+    def hit_rate(self) -> float:
+        return self.stats['hits'] / self.stats['fixtures'] if self.stats['fixtures'] else 0.0
+
+    def print_summary(self):
+        s = self.stats
+        if not s['fixtures']:
+            return
+        print(f"    [Team History] H2H tab skipped for {s['hits']}/{s['fixtures']} fixtures ({self.hit_rate:.0%}); "
+              f"fresh sides {s['fresh_sides']}/{s['sides']} (short {s['short']}, stale {s['stale']}, pending {s['pending']}).")
+
+
+team_history = TeamHistoryResolver()
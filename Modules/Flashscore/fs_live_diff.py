@@ -0,0 +1,209 @@
+# fs_live_diff.py: Incremental diff engine for the live score streamer.
+# Refactored for Clean Architecture (v2.7)
+# This script turns successive LIVE tab snapshots into minimal keyed writes.
+
+"""
+Live Diff Engine
+Keeps the previous live snapshot in memory and compares each new extraction
+against it. Only matches whose score, minute or status changed are written:
+- live_scores.csv: one bulk UPSERT of the changed matches,
+- schedules.csv / predictions.csv: primary-key lookups of the affected
+  fixtures and one bulk UPSERT per table (no full-table read/rewrite).
+
+Fixtures that drop off the LIVE tab are remembered until 150 minutes after
+kickoff (or GONE_GRACE after they vanished, when kickoff is unknown), then
+marked finished (predictions also get outcome_correct). A quiet minute with
+no changes and nothing due to finish performs no I/O at all.
+"""
+
+from datetime import datetime as dt, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from Data.Access.db_helpers import (
+    SCHEDULES_CSV, PREDICTIONS_CSV, LIVE_SCORES_CSV, files_and_headers
+)
+from Data.Access.csv_operations import get_entry, query_rows, upsert_many
+from Data.Access.standings_cache import standings_cache
+
+LOCAL_TZ = ZoneInfo("Africa/Lagos")  # Schedules store Lagos kickoff times (browser timezone_id)
+FINISH_AFTER = timedelta(minutes=150)
+GONE_GRACE = timedelta(minutes=15)
+_DIFF_FIELDS = ('home_score', 'away_score', 'minute', 'status')
+
+
+def _compute_outcome_correct(prediction_str, home_score, away_score):
+    """Check if a prediction was correct given the final score."""
+    try:
+        hs = int(home_score)
+        aws = int(away_score)
+    except (ValueError, TypeError):
+        return ''
+    p = (prediction_str or '').lower()
+    if 'home win' in p:
+        return 'True' if hs > aws else 'False'
+    if 'away win' in p:
+        return 'True' if aws > hs else 'False'
+    if 'draw' in p:
+        return 'True' if hs == aws else 'False'
+    if 'over 2.5' in p:
+        return 'True' if (hs + aws) > 2 else 'False'
+    if 'under 2.5' in p:
+        return 'True' if (hs + aws) < 3 else 'False'
+    if 'btts' in p or 'both teams to score' in p:
+        return 'True' if hs > 0 and aws > 0 else 'False'
+    return ''
+
+
+def _local_now() -> dt:
+    """Naive Lagos wall-clock time, comparable with _kickoff()."""
+    return dt.now(LOCAL_TZ).replace(tzinfo=None)
+
+
+def _kickoff(row: Dict[str, Any]) -> Optional[dt]:
+    """Kickoff from a schedule/prediction row (dd.mm.yyyy or ISO date + HH:MM)."""
+    date_val = row.get('date') or ''
+    time_val = row.get('match_time') or '00:00'
+    for fmt in ("%d.%m.%Y %H:%M", "%Y-%m-%d %H:%M"):
+        try:
+            return dt.strptime(f"{date_val} {time_val}", fmt)
+        except ValueError:
+            continue
+    return None
+
+
+class LiveDiffEngine:
+    """Previous LIVE snapshot plus the fixtures waiting to be marked finished."""
+
+    def __init__(self):
+        self.snapshot: Dict[str, Tuple[str, ...]] = {}
+        self.awaiting_finish: Dict[str, dt] = {}  # fixture_id -> time it may be marked finished
+        self._seeded = False
+        self.stats = {'cycles': 0, 'changed': 0, 'finished': 0, 'quiet': 0}  # cycles = applied snapshots/deltas
+
+    @staticmethod
+    def _finish_deadline(fid: str, now: dt) -> dt:
+        row = get_entry(SCHEDULES_CSV, 'fixture_id', fid) or get_entry(PREDICTIONS_CSV, 'fixture_id', fid) or {}
+        kickoff = _kickoff(row)
+        return kickoff + FINISH_AFTER if kickoff else now + GONE_GRACE
+
+    def _seed(self):
+        """Adopts fixtures left 'live' by a previous run so they still get finished."""
+        self._seeded = True
+        now = _local_now()
+        for row in query_rows(SCHEDULES_CSV, match_status='live') + query_rows(PREDICTIONS_CSV, status='live'):
+            fid = row.get('fixture_id')
+            if fid and fid not in self.awaiting_finish:
+                kickoff = _kickoff(row)
+                self.awaiting_finish[fid] = kickoff + FINISH_AFTER if kickoff else now + GONE_GRACE
+
+    def diff(self, live_matches: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """(matches new or changed since the last snapshot, fixture ids that left the LIVE tab)."""
+        current = {m['fixture_id']: m for m in live_matches if m.get('fixture_id')}
+        changed = [
+            m for fid, m in current.items()
+            if self.snapshot.get(fid) != tuple(m.get(f, '') for f in _DIFF_FIELDS)
+        ]
+        gone = [fid for fid in self.snapshot if fid not in current]
+        self.snapshot = {fid: tuple(m.get(f, '') for f in _DIFF_FIELDS) for fid, m in current.items()}
+        return changed, gone
+
+    def apply(self, live_matches: List[Dict[str, Any]]) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """
+        Diffs a new extraction and writes only what changed.
+        Returns (changed live rows, updated schedule rows, updated prediction rows).
+        """
+        changed, gone = self.diff(live_matches)
+        return self._commit(changed, gone, live_matches)
+
+    def apply_delta(self, updates: List[Dict[str, Any]], removed: List[str]) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """
+        Same as apply() for a partial view: `updates` are rows that changed in
+        the page and `removed` the ids that left it (push mode). Other snapshot
+        entries are left untouched.
+        """
+        changed = []
+        for m in updates:
+            fid = m.get('fixture_id')
+            key = tuple(m.get(f, '') for f in _DIFF_FIELDS)
+            if fid and self.snapshot.get(fid) != key:
+                self.snapshot[fid] = key
+                changed.append(m)
+        gone = [fid for fid in removed if self.snapshot.pop(fid, None) is not None]
+        return self._commit(changed, gone, updates)
+
+    def _commit(self, changed: List[Dict[str, Any]], gone: List[str],
+                live_matches: List[Dict[str, Any]]) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        if not self._seeded:
+            self._seed()
+        self.stats['cycles'] += 1
+        now = _local_now()
+
+        for m in live_matches:
+            self.awaiting_finish.pop(m.get('fixture_id'), None)
+        for fid in gone:
+            self.awaiting_finish[fid] = self._finish_deadline(fid, now)
+        due = [fid for fid, deadline in self.awaiting_finish.items() if now >= deadline]
+
+        if not changed and not due:
+            self.stats['quiet'] += 1
+            return [], [], []
+
+        stamp = dt.now().isoformat()  # host clock, like every other last_updated writer
+        live_rows = [dict(m, last_updated=stamp) for m in changed]
+        upsert_many(LIVE_SCORES_CSV, live_rows, files_and_headers[LIVE_SCORES_CSV], 'fixture_id')
+
+        sched_updates: Dict[str, Dict] = {}
+        pred_updates: Dict[str, Dict] = {}
+        for m in changed:
+            fid = m['fixture_id']
+            sched = self._live_update(get_entry(SCHEDULES_CSV, 'fixture_id', fid), m, 'match_status')
+            if sched:
+                sched_updates[fid] = sched
+            pred = self._live_update(get_entry(PREDICTIONS_CSV, 'fixture_id', fid), m, 'status')
+            if pred:
+                if m.get('home_score'):
+                    pred['actual_score'] = f"{m['home_score']}-{m['away_score']}"
+                pred_updates[fid] = pred
+
+        for fid in due:
+            del self.awaiting_finish[fid]
+            self._finish(fid, sched_updates, pred_updates)
+
+        for row in list(sched_updates.values()) + list(pred_updates.values()):
+            row['last_updated'] = stamp
+        upsert_many(SCHEDULES_CSV, list(sched_updates.values()), files_and_headers[SCHEDULES_CSV], 'fixture_id')
+        upsert_many(PREDICTIONS_CSV, list(pred_updates.values()), files_and_headers[PREDICTIONS_CSV], 'fixture_id')
+        self.stats['changed'] += len(changed)
+        return live_rows, list(sched_updates.values()), list(pred_updates.values())
+
+    @staticmethod
+    def _live_update(row: Optional[Dict[str, Any]], m: Dict[str, Any], status_col: str) -> Optional[Dict]:
+        """The row marked live with the current score, or None if absent or already identical."""
+        if row is None:
+            return None
+        updated = dict(row)
+        updated[status_col] = 'live'
+        if m.get('home_score'):
+            updated['home_score'] = m['home_score']
+            updated['away_score'] = m['away_score']
+        return updated if updated != row else None
+
+    def _finish(self, fid: str, sched_updates: Dict[str, Dict], pred_updates: Dict[str, Dict]):
+        """Marks a fixture that left the LIVE tab and is past its deadline as finished."""
+        sched = sched_updates.get(fid) or get_entry(SCHEDULES_CSV, 'fixture_id', fid)
+        pred = pred_updates.get(fid) or get_entry(PREDICTIONS_CSV, 'fixture_id', fid)
+
+        if sched and sched.get('match_status') == 'live':
+            sched['match_status'] = 'finished'
+            sched_updates[fid] = sched
+            standings_cache.invalidate(sched.get('region_league'))
+        if pred and pred.get('status', '').lower() == 'live':
+            pred['status'] = 'finished'
+            # predictions.csv keeps the score only in actual_score
+            home_score, _, away_score = (pred.get('actual_score') or '').partition('-')
+            oc = _compute_outcome_correct(pred.get('prediction', ''), home_score, away_score)
+            if oc:
+                pred['outcome_correct'] = oc
+            pred_updates[fid] = pred
+        self.stats['finished'] += 1
@@ -0,0 +1,96 @@
+# fs_live_scheduler.py: Kickoff-aware pacing for the live score streamer.
+# Refactored for Clean Architecture (v2.7)
+# This script decides how often the LIVE tab is read and when the page can sleep.
+
+"""
+Kickoff Scheduler
+Reads kickoff times of tracked fixtures (schedules.csv, yesterday to tomorrow)
+and derives the streamer's pace from how many of them are in their match
+window (kickoff - PRE_ROLL .. kickoff + FINISH_AFTER):
+- many fixtures in play -> poll close to LEO_LIVE_MIN_INTERVAL (default 20s),
+- few in play -> back off towards LEO_LIVE_MAX_INTERVAL (default 120s),
+- none in play and nothing live on the page -> park the browser page until
+  PRE_ROLL before the next kickoff (re-checked at least every MAX_PARK).
+The kickoff list is re-read every LEO_LIVE_SCHEDULE_REFRESH seconds so newly
+enriched schedules are picked up.
+"""
+
+import bisect
+import os
+from datetime import datetime as dt, timedelta
+from typing import List, Optional, Tuple
+
+from Data.Access.db_helpers import SCHEDULES_CSV
+from Data.Access.csv_operations import query_rows
+from .fs_live_diff import FINISH_AFTER, _kickoff, _local_now
+
+MIN_INTERVAL = int(os.getenv('LEO_LIVE_MIN_INTERVAL', 20))  # seconds
+MAX_INTERVAL = int(os.getenv('LEO_LIVE_MAX_INTERVAL', 120))  # seconds
+BUSY_FIXTURES = 10  # fixtures in play at which the interval halves
+SCHEDULE_REFRESH = int(os.getenv('LEO_LIVE_SCHEDULE_REFRESH', 900))  # seconds
+PRE_ROLL = timedelta(minutes=5)  # page is reopened this long before a kickoff
+MIN_PARK = timedelta(minutes=3)  # shorter gaps are not worth closing the page for
+MAX_PARK = timedelta(minutes=30)
+
+
+class KickoffScheduler:
+    """Sorted kickoffs of tracked fixtures -> (park duration, poll interval)."""
+
+    def __init__(self, refresh_seconds: int = SCHEDULE_REFRESH):
+        self.refresh_after = timedelta(seconds=refresh_seconds)
+        self.kickoffs: List[dt] = []
+        self._loaded_at: Optional[dt] = None
+
+    def refresh(self, now: Optional[dt] = None):
+        """Reloads kickoffs of unfinished fixtures dated yesterday, today or tomorrow."""
+        now = now or _local_now()
+        kickoffs = []
+        for offset in (-1, 0, 1):
+            date = (now + timedelta(days=offset)).strftime("%d.%m.%Y")
+            for row in query_rows(SCHEDULES_CSV, date=date):
+                if (row.get('match_status') or '').lower() not in ('', 'scheduled', 'live'):
+                    continue
+                kickoff = _kickoff(row)
+                if kickoff and kickoff + FINISH_AFTER > now:
+                    kickoffs.append(kickoff)
+        self.kickoffs = sorted(kickoffs)
+        self._loaded_at = now
+
+    def _ensure(self, now: dt):
+        if self._loaded_at is None or now - self._loaded_at >= self.refresh_after:
+            self.refresh(now)
+
+    def in_play(self, now: dt) -> int:
+        """Tracked fixtures whose match window contains `now`."""
+        lo = bisect.bisect_right(self.kickoffs, now - FINISH_AFTER)
+        hi = bisect.bisect_right(self.kickoffs, now + PRE_ROLL)
+        return hi - lo
+
+    def next_kickoff(self, now: dt) -> Optional[dt]:
+        i = bisect.bisect_right(self.kickoffs, now)
+        return self.kickoffs[i] if i < len(self.kickoffs) else None
+
+    @staticmethod
+    def poll_interval(in_play: int) -> float:
+        """MAX_INTERVAL for a single fixture, halving at BUSY_FIXTURES, never below MIN_INTERVAL."""
+        return max(MIN_INTERVAL, min(MAX_INTERVAL, MAX_INTERVAL / (1 + in_play / BUSY_FIXTURES)))
+
+    def plan(self, page_has_live: bool, now: Optional[dt] = None) -> Tuple[float, float, int]:
+        """
+        (seconds to park the page, 0 to keep streaming; poll interval; fixtures in play).
+        `page_has_live` keeps the page open while it still shows (or awaits the
+        finish of) matches the schedules do not account for.
+        """
+        now = now or _local_now()
+        self._ensure(now)
+        active = self.in_play(now)
+        interval = self.poll_interval(active)
+        if active or page_has_live:
+            return 0.0, interval, active
+
+        next_kickoff = self.next_kickoff(now)
+        wake = next_kickoff - PRE_ROLL if next_kickoff else now + MAX_PARK
+        park = min(wake - now, MAX_PARK)
+        if park < MIN_PARK:
+            return 0.0, interval, active
+        return park.total_seconds(), interval, active
@@ -3,253 +3,236 @@
 
 """
 Live Score Streamer
-Scrapes the Flashscore LIVE tab every 60 seconds using its own browser context.
-Saves results to live_scores.csv and upserts to Supabase.
-Propagates live/finished status to schedules.csv and predictions.csv.
+Watches the Flashscore LIVE tab in its own browser context: pushed deltas from
+an in-page MutationObserver (LEO_LIVE_PUSH, default on), reconciled by a full
+extraction every LEO_LIVE_RECONCILE_INTERVAL seconds, or polling at a pace set
+by tracked kickoffs (fs_live_scheduler); the page is parked between windows.
+Only matches that changed since the previous scrape are written (see
+fs_live_diff): one batch to live_scores.csv, keyed updates of schedules.csv and
+predictions.csv for live/finished status, and the same rows to Supabase.
 """
 
 import asyncio
-import csv
 import os
 from datetime import datetime as dt, timedelta
+from typing import Tuple
 from playwright.async_api import Playwright
 
-from Data.Access.db_helpers import (
-    save_live_score_entry, log_audit_event,
-    SCHEDULES_CSV, PREDICTIONS_CSV, LIVE_SCORES_CSV,
-    files_and_headers
-)
+from Data.Access.db_helpers import log_audit_event
 from Data.Access.sync_manager import SyncManager
 from Core.Browser.site_helpers import fs_universal_popup_dismissal
+from Core.Browser.resource_blocker import apply_resource_profile
+from Core.Browser.page_health import page_health
 from Core.Utils.constants import NAVIGATION_TIMEOUT, WAIT_FOR_LOAD_STATE_TIMEOUT
-
-STREAM_INTERVAL = 60  # seconds
+from .fs_live_diff import LiveDiffEngine
+from .fs_live_scheduler import KickoffScheduler
+
+STREAM_INTERVAL = 60  # seconds; fallback pace and retry delay
+# Push mode (MutationObserver deltas); full extraction then only reconciles
+LIVE_PUSH = os.getenv('LEO_LIVE_PUSH', '1') != '0'
+RECONCILE_INTERVAL = int(os.getenv('LEO_LIVE_RECONCILE_INTERVAL', 300))  # seconds
+DELTA_BATCH_WINDOW = 1.0  # seconds of pushed deltas written as one batch
 FLASHSCORE_URL = "https://www.flashscore.com/football/"
 
 
 # ---------------------------------------------------------------------------
-# CSV helper: read all rows from a CSV
+# Flashscore LIVE tab extraction
 # ---------------------------------------------------------------------------
-def _read_csv(path):
-    if not os.path.exists(path):
-        return []
-    with open(path, 'r', newline='', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
-
-
-def _write_csv(path, rows, fieldnames):
-    with open(path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
-
+# Row parser shared by the full extraction and the push-mode observer.
+_LIVE_ROW_JS = r"""
+    const parseLiveRow = (el, regionLeague) => {
+        const rowId = el.getAttribute('id');
+        const cleanId = rowId ? rowId.replace('g_1_', '') : null;
+        if (!cleanId) return null;
+
+        // Team names via wcl-name within participant containers
+        const homeNameEl = el.querySelector('.event__homeParticipant .wcl-name_jjfMf');
+        const awayNameEl = el.querySelector('.event__awayParticipant .wcl-name_jjfMf');
+        // Scores via data-testid="wcl-matchRowScore"
+        const homeScoreEl = el.querySelector('span.event__score--home');
+        const awayScoreEl = el.querySelector('span.event__score--away');
+        // Match minute from event__stage--block
+        const stageEl = el.querySelector('.event__stage--block');
+        // Detail link
+        const linkEl = el.querySelector('a.eventRowLink');
+        if (!homeNameEl || !awayNameEl) return null;
+
+        // Clean minute text — strip blinking character
+        let minute = stageEl ? stageEl.innerText.trim().replace(/\s+/g, '') : '';
+
+        let status = 'live';
+        const minuteLower = minute.toLowerCase();
+        if (minuteLower.includes('half')) status = 'halftime';
+        else if (minuteLower.includes('break')) status = 'break';
+        else if (minuteLower.includes('pen')) status = 'penalties';
+        else if (minuteLower.includes('et')) status = 'extra_time';
+
+        return {
+            fixture_id: cleanId,
+            home_team: homeNameEl.innerText.trim(),
+            away_team: awayNameEl.innerText.trim(),
+            home_score: homeScoreEl ? homeScoreEl.innerText.trim() : '0',
+            away_score: awayScoreEl ? awayScoreEl.innerText.trim() : '0',
+            minute: minute,
+            status: status,
+            region_league: regionLeague,
+            match_link: linkEl ? linkEl.getAttribute('href') : '',
+            timestamp: new Date().toISOString()
+        };
+    };
+
+    const headerRegionLeague = (header) => {
+        const catEl = header.querySelector('.headerLeague__category-text');
+        const titleEl = header.querySelector('.headerLeague__title-text');
+        const region = catEl ? catEl.innerText.trim() : '';
+        const league = titleEl ? titleEl.innerText.trim() : '';
+        return region ? region + ' - ' + league : league || 'Unknown';
+    };
+"""
 
-# ---------------------------------------------------------------------------
-# Status propagation: update schedules + predictions when matches go live/finish
-# ---------------------------------------------------------------------------
-def _compute_outcome_correct(prediction_str, home_score, away_score):
-    """Check if a prediction was correct given the final score."""
-    try:
-        hs = int(home_score)
-        aws = int(away_score)
-    except (ValueError, TypeError):
-        return ''
-    p = (prediction_str or '').lower()
-    if 'home win' in p:
-        return 'True' if hs > aws else 'False'
-    if 'away win' in p:
-        return 'True' if aws > hs else 'False'
-    if 'draw' in p:
-        return 'True' if hs == aws else 'False'
-    if 'over 2.5' in p:
-        return 'True' if (hs + aws) > 2 else 'False'
-    if 'under 2.5' in p:
-        return 'True' if (hs + aws) < 3 else 'False'
-    if 'btts' in p or 'both teams to score' in p:
-        return 'True' if hs > 0 and aws > 0 else 'False'
-    return ''
-
-
-def _propagate_status_updates(live_matches: list):
-    """
-    Propagate live scores into schedules.csv and predictions.csv.
-    1. Mark any matching fixture as 'live' with current score.
-    2. Detect fixtures that are past 2.5hrs → mark 'finished' + compute outcome_correct.
-    """
-    live_ids = {m['fixture_id'] for m in live_matches}
-    live_map = {m['fixture_id']: m for m in live_matches}
-    now = dt.now()
-
-    # --- Update schedules.csv ---
-    sched_headers = files_and_headers.get(SCHEDULES_CSV, [])
-    sched_rows = _read_csv(SCHEDULES_CSV)
-    sched_changed = False
-    for row in sched_rows:
-        fid = row.get('fixture_id', '')
-        if fid in live_ids:
-            lm = live_map[fid]
-            if row.get('status', '').lower() != 'live':
-                row['status'] = 'live'
-                sched_changed = True
-            if lm.get('home_score'):
-                row['home_score'] = lm['home_score']
-                row['away_score'] = lm['away_score']
-                sched_changed = True
-        elif row.get('status', '').lower() == 'live' and fid not in live_ids:
-            # Was live but no longer in LIVE list → check if should be finished
-            try:
-                match_time_str = f"{row.get('date','2000-01-01')}T{row.get('match_time','00:00')}:00"
-                match_start = dt.fromisoformat(match_time_str)
-                if now > match_start + timedelta(minutes=150):
-                    row['status'] = 'finished'
-                    sched_changed = True
-            except Exception:
-                pass
-    sched_updates = []
-    if sched_changed:
-        _write_csv(SCHEDULES_CSV, sched_rows, sched_headers)
-        # Collect only the changed ones for cloud sync (optional, but cleaner)
-        sched_updates = [r for r in sched_rows if r.get('fixture_id') in live_ids]
-
-    # --- Update predictions.csv ---
-    pred_headers = files_and_headers.get(PREDICTIONS_CSV, [])
-    pred_rows = _read_csv(PREDICTIONS_CSV)
-    pred_changed = False
-    pred_updates = []
-    
-    for row in pred_rows:
-        fid = row.get('fixture_id', '')
-        cur_status = row.get('status', row.get('match_status', '')).lower()
-
-        if fid in live_ids:
-            lm = live_map[fid]
-            row_changed = False
-            if cur_status != 'live':
-                row['status'] = 'live'
-                row_changed = True
-            
-            new_hs = lm.get('home_score', '')
-            new_as = lm.get('away_score', '')
-            if row.get('home_score') != new_hs or row.get('away_score') != new_as:
-                row['home_score'] = new_hs
-                row['away_score'] = new_as
-                row['actual_score'] = f"{new_hs}-{new_as}"
-                row_changed = True
-            
-            if row_changed:
-                pred_changed = True
-                pred_updates.append(row)
-        elif cur_status == 'live' and fid not in live_ids:
-            try:
-                date_val = row.get('date', '2000-01-01')
-                time_val = row.get('match_time', '00:00')
-                match_start = dt.fromisoformat(f"{date_val}T{time_val}:00")
-                if now > match_start + timedelta(minutes=150):
-                    row['status'] = 'finished'
-                    # Compute outcome_correct
-                    oc = _compute_outcome_correct(
-                        row.get('prediction', ''),
-                        row.get('home_score', ''),
-                        row.get('away_score', '')
-                    )
-                    if oc:
-                        row['outcome_correct'] = oc
-                    pred_changed = True
-                    pred_updates.append(row)
-            except Exception:
-                pass
-    if pred_changed:
-        _write_csv(PREDICTIONS_CSV, pred_rows, pred_headers)
-        
-    return sched_updates, pred_updates
+_EXTRACT_LIVE_JS = "() => {" + _LIVE_ROW_JS + r"""
+    const matches = [];
+    // All elements live inside div.sportName.soccer (or the body if absent)
+    const container = document.querySelector('.sportName.soccer') || document.body;
+    if (!container) return [];
+
+    // Collect all league headers and match rows in DOM order
+    const allElements = container.querySelectorAll('.headerLeague__wrapper, .event__match--live');
+
+    let currentRegionLeague = 'Unknown';
+    allElements.forEach((el) => {
+        // League header: div.headerLeague__wrapper
+        if (el.classList.contains('headerLeague__wrapper')) {
+            currentRegionLeague = headerRegionLeague(el);
+            return;
+        }
+        // Live match row: div.event__match--live
+        const match = parseLiveRow(el, currentRegionLeague);
+        if (match) matches.push(match);
+    });
+    return matches;
+}"""
+
+# Push mode: a MutationObserver on the live list reports changed rows (and rows
+# that stopped being live) to Python through the LIVE_DELTA_BINDING binding.
+# Mutations are coalesced for 250 ms so one goal is one call, not dozens.
+LIVE_DELTA_BINDING = "__leoLiveDelta"
+
+_LIVE_OBSERVER_JS = "() => {" + _LIVE_ROW_JS + r"""
+    const existing = window.__leoLiveObserver;
+    if (existing && existing.root.isConnected) return true;
+    const root = document.querySelector('.sportName.soccer') || document.body;
+    if (!root || typeof window.__leoLiveDelta !== 'function') return false;
+
+    const regionOf = (row) => {
+        let el = row.previousElementSibling;
+        while (el && !el.classList.contains('headerLeague__wrapper')) el = el.previousElementSibling;
+        return el ? headerRegionLeague(el) : 'Unknown';
+    };
+    const keyOf = (m) => [m.home_score, m.away_score, m.minute, m.status].join('|');
+
+    const last = new Map();
+    root.querySelectorAll('.event__match--live').forEach((row) => {
+        const m = parseLiveRow(row, '');
+        if (m) last.set(m.fixture_id, keyOf(m));
+    });
+
+    const dirty = new Set();
+    let scheduled = false;
+    const flush = () => {
+        scheduled = false;
+        const updates = [];
+        const removed = [];
+        dirty.forEach((row) => {
+            if (!row.isConnected || !row.classList.contains('event__match--live')) return;
+            const m = parseLiveRow(row, regionOf(row));
+            if (m && last.get(m.fixture_id) !== keyOf(m)) {
+                last.set(m.fixture_id, keyOf(m));
+                updates.push(m);
+            }
+        });
+        dirty.clear();
+        const present = new Set();
+        root.querySelectorAll('.event__match--live').forEach((row) => {
+            const id = (row.getAttribute('id') || '').replace('g_1_', '');
+            if (id) present.add(id);
+        });
+        last.forEach((_, id) => { if (!present.has(id)) { last.delete(id); removed.push(id); } });
+        if (updates.length || removed.length) window.__leoLiveDelta({updates, removed});
+    };
+
+    const observer = new MutationObserver((records) => {
+        records.forEach((r) => {
+            const el = r.target.nodeType === 1 ? r.target : r.target.parentElement;
+            const row = el && el.closest('.event__match--live');
+            if (row) dirty.add(row);
+            r.addedNodes.forEach((n) => {
+                if (n.nodeType !== 1) return;
+                if (n.matches('.event__match--live')) dirty.add(n);
+                n.querySelectorAll('.event__match--live').forEach((x) => dirty.add(x));
+            });
+        });
+        if (!scheduled) { scheduled = true; setTimeout(flush, 250); }
+    });
+    observer.observe(root, {subtree: true, childList: true, characterData: true,
+                            attributes: true, attributeFilter: ['class']});
+    window.__leoLiveObserver = {root, observer};
+    return true;
+}"""
 
 
-# ---------------------------------------------------------------------------
-# Flashscore LIVE tab extraction
-# ---------------------------------------------------------------------------
 async def _extract_live_matches(page) -> list:
     """
     Extracts all live matches from the currently visible LIVE tab.
     Uses the actual Flashscore DOM structure with headerLeague__wrapper for
     league grouping and event__match--live for match rows.
     """
-    matches = await page.evaluate(r"""() => {
-        const matches = [];
-        // All elements live inside div.sportName.soccer (or the body if absent)
-        const container = document.querySelector('.sportName.soccer') || document.body;
-        if (!container) return [];
-
-        // Collect all league headers and match rows in DOM order
-        const allElements = container.querySelectorAll(
-            '.headerLeague__wrapper, .event__match--live'
-        );
-
-        let currentRegion = '';
-        let currentLeague = '';
-
-        allElements.forEach((el) => {
-            // League header: div.headerLeague__wrapper
-            if (el.classList.contains('headerLeague__wrapper')) {
-                const catEl = el.querySelector('.headerLeague__category-text');
-                const titleEl = el.querySelector('.headerLeague__title-text');
-                currentRegion = catEl ? catEl.innerText.trim() : '';
-                currentLeague = titleEl ? titleEl.innerText.trim() : '';
-                return;
-            }
-
-            // Live match row: div.event__match--live
-            if (el.classList.contains('event__match--live')) {
-                const rowId = el.getAttribute('id');
-                const cleanId = rowId ? rowId.replace('g_1_', '') : null;
-                if (!cleanId) return;
-
-                // Team names via wcl-name within participant containers
-                const homeNameEl = el.querySelector('.event__homeParticipant .wcl-name_jjfMf');
-                const awayNameEl = el.querySelector('.event__awayParticipant .wcl-name_jjfMf');
-                // Scores via data-testid="wcl-matchRowScore"
-                const homeScoreEl = el.querySelector('span.event__score--home');
-                const awayScoreEl = el.querySelector('span.event__score--away');
-                // Match minute from event__stage--block
-                const stageEl = el.querySelector('.event__stage--block');
-                // Detail link
-                const linkEl = el.querySelector('a.eventRowLink');
-
-                if (homeNameEl && awayNameEl) {
-                    // Clean minute text — strip blinking character
-                    let minute = stageEl ? stageEl.innerText.trim().replace(/\s+/g, '') : '';
-
-                    let status = 'live';
-                    const minuteLower = minute.toLowerCase();
-                    if (minuteLower.includes('half')) status = 'halftime';
-                    else if (minuteLower.includes('break')) status = 'break';
-                    else if (minuteLower.includes('pen')) status = 'penalties';
-                    else if (minuteLower.includes('et')) status = 'extra_time';
-
-                    const regionLeague = currentRegion
-                        ? currentRegion + ' - ' + currentLeague
-                        : currentLeague || 'Unknown';
-
-                    matches.push({
-                        fixture_id: cleanId,
-                        home_team: homeNameEl.innerText.trim(),
-                        away_team: awayNameEl.innerText.trim(),
-                        home_score: homeScoreEl ? homeScoreEl.innerText.trim() : '0',
-                        away_score: awayScoreEl ? awayScoreEl.innerText.trim() : '0',
-                        minute: minute,
-                        status: status,
-                        region_league: regionLeague,
-                        match_link: linkEl ? linkEl.getAttribute('href') : '',
-                        timestamp: new Date().toISOString()
-                    });
-                }
-            }
-        });
-        return matches;
-    }""")
+    matches = await page.evaluate(_EXTRACT_LIVE_JS)
     return matches or []
 
 
+async def _install_live_observer(page) -> bool:
+    """(Re)installs the push-mode observer; a no-op while the current one is attached."""
+    try:
+        return bool(await page.evaluate(_LIVE_OBSERVER_JS))
+    except Exception as e:
+        print(f"   [Streamer] Could not install live observer: {e}")
+        return False
+
+
+async def _next_deltas(queue: asyncio.Queue, timeout: float) -> Tuple[list, list]:
+    """Waits up to `timeout` for pushed deltas, then drains what arrives within DELTA_BATCH_WINDOW."""
+    try:
+        first = await asyncio.wait_for(queue.get(), timeout=max(timeout, 0))
+    except asyncio.TimeoutError:
+        return [], []
+    batch = [first]
+    await asyncio.sleep(DELTA_BATCH_WINDOW)
+    while not queue.empty():
+        batch.append(queue.get_nowait())
+    updates = {m['fixture_id']: m for d in batch for m in d.get('updates', []) if m.get('fixture_id')}
+    removed = [fid for d in batch for fid in d.get('removed', []) if fid not in updates]
+    return list(updates.values()), removed
+
+
+async def _sync_changes(sync: SyncManager, live_upd: list, sched_upd: list, pred_upd: list):
+    """Pushes only the changed rows to Supabase."""
+    if not sync.supabase or not (live_upd or sched_upd or pred_upd):
+        return
+    try:
+        # 1. Push changed live scores
+        if live_upd:
+            await sync.batch_upsert('live_scores', live_upd)
+        # 2. Push modified predictions (for Realtime listeners)
+        if pred_upd:
+            await sync.batch_upsert('predictions', pred_upd)
+        # 3. Push modified schedules
+        if sched_upd:
+            await sync.batch_upsert('schedules', sched_upd)
+    except Exception as e:
+        print(f"   [Streamer] Cloud sync error: {e}")
+
+
 async def _click_live_tab(page) -> bool:
     """Clicks the LIVE tab on the Flashscore football page using the exact
     data-analytics-alias attribute from knowledge.json."""
@@ -271,10 +254,50 @@ async def _click_live_tab(page) -> bool:
         return False
 
 
+async def _open_live_page(browser, delta_queue: asyncio.Queue):
+    """New context and page on the LIVE tab; in push mode the delta binding is exposed first."""
+    context = await browser.new_context(
+        user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        timezone_id="Africa/Lagos"
+    )
+    try:
+        await apply_resource_profile(context, "flashscore_live")
+        page = await context.new_page()
+        if LIVE_PUSH:
+            await page.expose_binding(LIVE_DELTA_BINDING, lambda source, delta: delta_queue.put_nowait(delta))
+
+        print("   [Streamer] Navigating to Flashscore...")
+        await page.goto(FLASHSCORE_URL, timeout=NAVIGATION_TIMEOUT, wait_until="domcontentloaded")
+        await asyncio.sleep(3)
+        await fs_universal_popup_dismissal(page, "fs_home_page")
+    except Exception:
+        await context.close()
+        raise
+
+    if not await _click_live_tab(page):
+        print("   [Streamer] ⚠ Could not find LIVE tab. Will retry on next cycle.")
+    return context, page
+
+
+async def _close_live_page(context, page, delta_queue: asyncio.Queue):
+    """Closes the streamer's context and drops deltas the old page still queued."""
+    page_health.forget(page)
+    try:
+        await context.close()
+    except Exception:
+        pass
+    while not delta_queue.empty():
+        delta_queue.get_nowait()
+
+
 async def live_score_streamer(playwright: Playwright):
     """
     Main streaming loop. Runs independently in its own browser context.
-    Scrapes the LIVE tab every 60 seconds and saves results.
+    In push mode the page reports changes as they happen and the LIVE tab is
+    fully re-extracted every RECONCILE_INTERVAL; otherwise it is polled at the
+    KickoffScheduler's interval. Between match windows the page is closed
+    (parked) and reopened shortly before the next tracked kickoff; a page past
+    the page_health memory thresholds gets a fresh context the same way.
     Never crashes — errors are logged and retried.
     """
     print("\n   [Streamer] 🔴 Live Score Streamer starting...")
@@ -287,80 +310,78 @@ async def live_score_streamer(playwright: Playwright):
             args=["--disable-dev-shm-usage", "--no-sandbox", "--disable-gpu"]
         )
 
-        context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            timezone_id="Africa/Lagos"
-        )
-        page = await context.new_page()
-
-        # Initial navigation
-        print("   [Streamer] Navigating to Flashscore...")
-        await page.goto(FLASHSCORE_URL, timeout=NAVIGATION_TIMEOUT, wait_until="domcontentloaded")
-        await asyncio.sleep(3)
-        await fs_universal_popup_dismissal(page, "fs_home_page")
-
-        # Click LIVE tab
-        if not await _click_live_tab(page):
-            print("   [Streamer] ⚠ Could not find LIVE tab. Will retry on next cycle.")
-
         sync = SyncManager()
+        diff_engine = LiveDiffEngine()
+        scheduler = KickoffScheduler()
         cycle = 0
 
+        # Push mode: the page reports deltas as they happen; full extraction
+        # only runs every RECONCILE_INTERVAL as a safety net.
+        delta_queue: asyncio.Queue = asyncio.Queue()
+        context = page = None
+        observer_ready = False
+        next_reconcile = 0.0
+
         while True:
+            if page is None:
+                try:
+                    context, page = await _open_live_page(browser, delta_queue)
+                except Exception as e:
+                    print(f"   [Streamer] ⚠ Could not open Flashscore: {e}")
+                    await asyncio.sleep(STREAM_INTERVAL)
+                    continue
+                observer_ready = False
+
+            loop_time = asyncio.get_running_loop().time()
+            if observer_ready and loop_time < next_reconcile:
+                updates, removed = await _next_deltas(delta_queue, next_reconcile - loop_time)
+                if updates or removed:
+                    try:
+                        live_upd, sched_upd, pred_upd = diff_engine.apply_delta(updates, removed)
+                        if live_upd or sched_upd:
+                            print(f"   [Streamer] {dt.now().strftime('%H:%M:%S')} — pushed: "
+                                  f"{len(live_upd)} changed, {len(removed)} left the live list")
+                        await _sync_changes(sync, live_upd, sched_upd, pred_upd)
+                    except Exception as e:
+                        print(f"   [Streamer] ⚠ Delta apply error: {e}")
+                continue
+
             cycle += 1
             try:
-                # Refresh the page periodically (every 10 cycles = ~10 min)
+                # Refresh the page periodically (every 10 full extractions)
                 if cycle % 10 == 0:
                     await page.reload(wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT)
                     await asyncio.sleep(3)
                     await fs_universal_popup_dismissal(page, "fs_home_page")
                     await _click_live_tab(page)
 
-                # Extract live matches
+                # Full extraction (reconciliation); write only what changed since last cycle
                 live_matches = await _extract_live_matches(page)
                 now = dt.now().strftime("%H:%M:%S")
+                live_upd, sched_upd, pred_upd = diff_engine.apply(live_matches)
 
                 if live_matches:
-                    print(f"   [Streamer] {now} — {len(live_matches)} live matches found (cycle {cycle})")
-
-                    # Save each match locally
-                    for m in live_matches:
-                        save_live_score_entry(m)
-
-                    # Propagate status to schedules + predictions
-                    sched_upd, pred_upd = _propagate_status_updates(live_matches)
-
-                    # Sync everything to Supabase
-                    if sync.supabase:
-                        try:
-                            # 1. Push raw live scores
-                            await sync.batch_upsert('live_scores', live_matches)
-                            # 2. Push modified predictions (for Realtime listeners)
-                            if pred_upd:
-                                await sync.batch_upsert('predictions', pred_upd)
-                            # 3. Push modified schedules
-                            if sched_upd:
-                                await sync.batch_upsert('schedules', sched_upd)
-                        except Exception as e:
-                            print(f"   [Streamer] Cloud sync error: {e}")
-                else:
-                    # Even with no live matches, check for matches that should be finished
-                    sched_upd, pred_upd = _propagate_status_updates([])
-                    
-                    if sync.supabase and (pred_upd or sched_upd):
-                        try:
-                            if pred_upd:
-                                await sync.batch_upsert('predictions', pred_upd)
-                            if sched_upd:
-                                await sync.batch_upsert('schedules', sched_upd)
-                        except Exception as e:
-                            print(f"   [Streamer] Cloud sync error (empty live): {e}")
-
-                    if cycle % 5 == 1:  # Log "no matches" every 5 cycles to reduce noise
-                        print(f"   [Streamer] {now} — No live matches (cycle {cycle})")
+                    print(f"   [Streamer] {now} — {len(live_matches)} live matches found, "
+                          f"{len(live_upd)} changed (cycle {cycle})")
+                elif cycle % 5 == 1:  # Log "no matches" every 5 cycles to reduce noise
+                    print(f"   [Streamer] {now} — No live matches (cycle {cycle})")
+
+                await _sync_changes(sync, live_upd, sched_upd, pred_upd)
+
+                if LIVE_PUSH:
+                    observer_ready = await _install_live_observer(page)
+
+                # Renderer memory grows over multi-day runs: rebuild the context past the thresholds
+                reason = await page_health.check(page)
+                if reason:
+                    page_health.log_recycle("live streamer page", reason)
+                    await _close_live_page(context, page, delta_queue)
+                    context = page = None
+                    continue
 
             except Exception as e:
                 print(f"   [Streamer] ⚠ Extraction error (cycle {cycle}): {e}")
+                observer_ready = False
                 # Try to recover by reloading
                 try:
                     await page.goto(FLASHSCORE_URL, timeout=NAVIGATION_TIMEOUT, wait_until="domcontentloaded")
@@ -370,7 +391,24 @@ async def live_score_streamer(playwright: Playwright):
                 except Exception:
                     pass
 
-            await asyncio.sleep(STREAM_INTERVAL)
+            # Pace from tracked kickoffs: park between match windows, poll faster when busy
+            try:
+                park, poll_interval, in_play = scheduler.plan(bool(diff_engine.snapshot or diff_engine.awaiting_finish))
+            except Exception as e:
+                print(f"   [Streamer] ⚠ Kickoff schedule unavailable: {e}")
+                park, poll_interval, in_play = 0.0, STREAM_INTERVAL, 0
+            if park:
+                resume = dt.now() + timedelta(seconds=park)
+                print(f"   [Streamer] No tracked fixtures in play — parking page until {resume.strftime('%H:%M')}.")
+                await _close_live_page(context, page, delta_queue)
+                context = page = None
+                await asyncio.sleep(park)
+                continue
+
+            # Without a working observer, fall back to polling at the scheduler's pace
+            next_reconcile = asyncio.get_running_loop().time() + (RECONCILE_INTERVAL if observer_ready else poll_interval)
+            if not observer_ready:
+                await asyncio.sleep(poll_interval)
 
     except asyncio.CancelledError:
         print("   [Streamer] Streamer cancelled.")
@@ -5,19 +5,29 @@
 from datetime import datetime as dt, timedelta
 from zoneinfo import ZoneInfo
 from playwright.async_api import Playwright
-from Data.Access.db_helpers import get_all_schedules, get_standings, save_prediction
+from Data.Access.db_helpers import get_all_schedules, get_standings, save_predictions
+from Data.Access.history_index import HistoryIndex
+from Data.Access.standings_cache import numeric_standings
 from Scripts.recommend_bets import get_recommendations
-from Core.Intelligence.model import RuleEngine
+from Core.Intelligence.model import RuleEngine, LearningEngine, MLModel
 from Core.Intelligence.rule_config import RuleConfig
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import csv
 import os
 
 NIGERIA_TZ = ZoneInfo("Africa/Lagos")
 
-async def run_flashscore_offline_repredict(playwright: Playwright, custom_config: RuleConfig = None):
+# Worker processes for offline re-prediction / backtests (1 = in-process)
+OFFLINE_WORKERS = int(os.getenv('LEO_OFFLINE_WORKERS', os.cpu_count() or 1))
+# Below this many fixtures, process start-up costs more than it saves
+PARALLEL_MIN_FIXTURES = 500
+
+async def run_flashscore_offline_repredict(playwright: Playwright, custom_config: RuleConfig = None, workers: int = None):
     """
     Offline reprediction mode: Uses stored CSV data.
     If custom_config is provided, runs in "Backtest Mode" and saves to a separate file.
+    Fixtures are sharded across `workers` processes (default LEO_OFFLINE_WORKERS).
     """
     mode_label = "BACKTEST" if custom_config else "OFFLINE"
     print(f"\n   [{mode_label}] Starting reprediction engine...")
@@ -56,106 +66,37 @@ async def run_flashscore_offline_repredict(playwright: Playwright, custom_config
     elif not to_process:
         return
 
-    # Sort historical matches once
-    def parse_date(d_str):
-        try:
-            return dt.strptime(d_str, "%d.%m.%Y")
-        except:
-            return dt.min
-
-    historical_matches = [m for m in all_schedules if m.get('match_status') != 'scheduled' and m.get('home_score') not in ('', 'N/A', None) and m.get('away_score') not in ('', 'N/A', None)]
-    historical_matches.sort(key=lambda x: parse_date(x.get('date', '')), reverse=True)
-
-    print(f"    [{mode_label}] Processing {len(to_process)} matches...")
-
-    total_repredicted = 0
-    for m in to_process:
-        home_team = m.get('home_team')
-        away_team = m.get('away_team')
-        region_league = m.get('region_league', 'Unknown')
-        match_label = f"{home_team} vs {away_team}"
-
-        # 1. Build H2H Data
-        home_last_10 = []
-        away_last_10 = []
-        h2h_list = []
-        
-        for hist in historical_matches:
-            h_home = hist.get('home_team')
-            h_away = hist.get('away_team')
-            hs = hist.get('home_score', '0')
-            ascore = hist.get('away_score', '0')
-            try:
-                hsi = int(hs)
-                asi = int(ascore)
-                winner = "Home" if hsi > asi else "Away" if asi > hsi else "Draw"
-            except:
-                winner = "Draw"
-                
-            mapped_hist = {
-                "date": hist.get("date"),
-                "home": h_home,
-                "away": h_away,
-                "score": f"{hs}-{ascore}",
-                "winner": winner
-            }
-
-            if (h_home == home_team or h_away == home_team) and len(home_last_10) < 10:
-                home_last_10.append(mapped_hist)
-            if (h_home == away_team or h_away == away_team) and len(away_last_10) < 10:
-                away_last_10.append(mapped_hist)
-            if ((h_home == home_team and h_away == away_team) or (h_home == away_team and h_away == home_team)):
-                h2h_list.append(mapped_hist)
-
-        h2h_data = {
-            "home_team": home_team,
-            "away_team": away_team,
-            "home_last_10_matches": home_last_10,
-            "away_last_10_matches": away_last_10,
-            "head_to_head": h2h_list,
-            "region_league": region_league
-        }
-
-        # 2. Get Standings
-        raw_standings = get_standings(region_league)
-        standings_data = []
-        for s in raw_standings:
-            try:
-                standings_data.append({
-                    "team_name": s.get("team_name"),
-                    "position": int(s.get("position", 0)),
-                    "goal_difference": int(s.get("goal_difference", 0)),
-                    "goals_for": int(s.get("goals_for", 0)),
-                    "goals_against": int(s.get("goals_against", 0))
-                })
-            except:
-                continue
+    # Index finished matches once: per-team and per-pair timelines (newest first)
+    history = HistoryIndex(all_schedules)
+    standings_by_league = {
+        league: _load_standings(league)
+        for league in {m.get('region_league', 'Unknown') for m in to_process}
+    }
+
+    workers = OFFLINE_WORKERS if workers is None else workers
+    print(f"    [{mode_label}] Processing {len(to_process)} matches against {history.size} historical results "
+          f"({workers} worker{'s' if workers != 1 else ''})...")
 
-        # 3. Data Quality Validation
-        if len(home_last_10) < 3 or len(away_last_10) < 3:
+    results = _run_predictions(to_process, history, standings_by_league, custom_config, workers)
+
+    to_save = []
+    for m, prediction in results:
+        reason = prediction.get("reason")
+        if isinstance(reason, str) and reason.startswith("Analysis error"):
+            print(f"      [Offline Error] Failed predicting {m.get('home_team')} vs {m.get('away_team')}: {reason}")
             continue
+        if prediction.get("type", "SKIP") != "SKIP":
+            match_data_for_save = m.copy()
+            match_data_for_save['id'] = m.get('fixture_id')
+            match_data_for_save['time'] = m.get('match_time')
+            to_save.append((match_data_for_save, prediction))
 
-        # 4. Predict
-        analysis_input = {"h2h_data": h2h_data, "standings": standings_data}
-        try:
-            prediction = RuleEngine.analyze(analysis_input, config=custom_config)
-            
-            if prediction.get("type", "SKIP") != "SKIP":
-                match_data_for_save = m.copy()
-                match_data_for_save['id'] = m.get('fixture_id')
-                match_data_for_save['time'] = m.get('match_time')
-                
-                if custom_config:
-                    # Save to custom CSV
-                    _save_custom_prediction(match_data_for_save, prediction, custom_config.name)
-                else:
-                    save_prediction(match_data_for_save, prediction)
-
-                total_repredicted += 1
-                if total_repredicted % 50 == 0:
-                    print(f"    [{mode_label}] Processed {total_repredicted} matches...")
-        except Exception as e:
-            print(f"      [Offline Error] Failed predicting {match_label}: {e}")
+    # Single bulk write from the parent
+    if custom_config:
+        _save_custom_predictions(to_save, custom_config.name)
+    else:
+        save_predictions(to_save)
+    total_repredicted = len(to_save)
 
     print(f"\n--- {mode_label} Complete: {total_repredicted} matches processed. ---")
     
@@ -163,35 +104,107 @@ async def run_flashscore_offline_repredict(playwright: Playwright, custom_config
         print("\n   [Auto] Generating betting recommendations after offline update...")
         get_recommendations(save_to_file=True)
 
-def _save_custom_prediction(match_data, prediction, config_name):
-    """Saves backtest results to a separate CSV."""
+def _build_analysis_input(m, history, standings_by_league):
+    """RuleEngine input for one fixture, or None when either side has fewer than 3 results."""
+    home_team = m.get('home_team')
+    away_team = m.get('away_team')
+    region_league = m.get('region_league', 'Unknown')
+
+    # 1. Build H2H Data (as of kickoff day, so backtests never see the result itself)
+    try:
+        as_of = dt.strptime(m.get('date', ''), "%d.%m.%Y")
+    except (ValueError, TypeError):
+        as_of = None
+    home_last_10 = history.team_form(home_team, as_of)
+    away_last_10 = history.team_form(away_team, as_of)
+
+    # 2. Data Quality Validation
+    if len(home_last_10) < 3 or len(away_last_10) < 3:
+        return None
+
+    h2h_data = {
+        "home_team": home_team,
+        "away_team": away_team,
+        "home_last_10_matches": home_last_10,
+        "away_last_10_matches": away_last_10,
+        "head_to_head": history.head_to_head(home_team, away_team, as_of),
+        "region_league": region_league
+    }
+    return {"h2h_data": h2h_data, "standings": standings_by_league.get(region_league, [])}
+
+# Read-only state for worker processes (inherited copy-on-write under fork)
+_WORKER_STATE = {}
+
+def _init_worker(history, standings_by_league, config):
+    _WORKER_STATE['history'] = history
+    _WORKER_STATE['standings'] = standings_by_league
+    _WORKER_STATE['config'] = config
+
+def _predict_shard(fixtures):
+    """Builds inputs for a shard of fixtures and predicts them in one batch. Returns (index, prediction) pairs."""
+    history, standings_by_league = _WORKER_STATE['history'], _WORKER_STATE['standings']
+    indexed_inputs = []
+    for i, m in fixtures:
+        analysis_input = _build_analysis_input(m, history, standings_by_league)
+        if analysis_input is not None:
+            indexed_inputs.append((i, analysis_input))
+    predictions = RuleEngine.analyze_batch([x for _, x in indexed_inputs], config=_WORKER_STATE['config'])
+    return [(i, prediction) for (i, _), prediction in zip(indexed_inputs, predictions)]
+
+def _run_predictions(to_process, history, standings_by_league, config, workers):
+    """Predicts all fixtures, sharded over a process pool when the run is large enough."""
+    indexed = list(enumerate(to_process))
+    if workers <= 1 or len(indexed) < PARALLEL_MIN_FIXTURES:
+        _init_worker(history, standings_by_league, config)
+        pairs = _predict_shard(indexed)
+    else:
+        shard_size = max(1, -(-len(indexed) // (workers * 4)))
+        shards = [indexed[i:i + shard_size] for i in range(0, len(indexed), shard_size)]
+        # Load weights/models once here; forked workers inherit them copy-on-write
+        LearningEngine.warm()
+        MLModel.load_models()
+        methods = multiprocessing.get_all_start_methods()
+        mp_context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context, initializer=_init_worker,
+                                     initargs=(history, standings_by_league, config)) as pool:
+                pairs = [pair for shard_pairs in pool.map(_predict_shard, shards) for pair in shard_pairs]
+        except Exception as e:
+            print(f"    [Offline] Worker pool failed ({e}); predicting in-process.")
+            _init_worker(history, standings_by_league, config)
+            pairs = _predict_shard(indexed)
+    return [(to_process[i], prediction) for i, prediction in pairs]
+
+def _load_standings(region_league):
+    """Standings rows for one league, converted to the rule engine's numeric shape."""
+    return numeric_standings(get_standings(region_league))
+
+def _save_custom_predictions(items, config_name):
+    """Saves backtest results to a separate CSV in one append."""
+    if not items:
+        return
     # Use consistent Data/Store path
     filename = f"Data/Store/predictions_custom_{config_name}.csv"
     os.makedirs("Data/Store", exist_ok=True)
-    
-    # Determine correctness if actual score exists
-    actual_score = f"{match_data.get('home_score')}-{match_data.get('away_score')}"
-    is_correct = "N/A"
-    
-    # Simple check for now (can expand to use evaluate_prediction)
-    if "win" in prediction['market_prediction'].lower():
-        # Implementation of simple check
-        pass
-        
-    row = {
-        'fixture_id': match_data.get('fixture_id'),
-        'date': match_data.get('date'),
-        'home_team': match_data.get('home_team'),
-        'away_team': match_data.get('away_team'),
-        'prediction': prediction['market_prediction'],
-        'confidence': prediction['confidence'],
-        'actual_score': actual_score,
-        'config_name': config_name
-    }
-    
+
+    rows = []
+    for match_data, prediction in items:
+        # Determine correctness if actual score exists (can expand to use evaluate_prediction)
+        actual_score = f"{match_data.get('home_score')}-{match_data.get('away_score')}"
+        rows.append({
+            'fixture_id': match_data.get('fixture_id'),
+            'date': match_data.get('date'),
+            'home_team': match_data.get('home_team'),
+            'away_team': match_data.get('away_team'),
+            'prediction': prediction['market_prediction'],
+            'confidence': prediction['confidence'],
+            'actual_score': actual_score,
+            'config_name': config_name
+        })
+
     file_exists = os.path.exists(filename)
     with open(filename, 'a', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=row.keys())
+        writer = csv.DictWriter(f, fieldnames=rows[0].keys())
         if not file_exists:
             writer.writeheader()
-        writer.writerow(row)
+        writer.writerows(rows)
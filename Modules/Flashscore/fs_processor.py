@@ -3,13 +3,19 @@
 # This script orchestrates the full extraction/analysis pipeline for a single match.
 
 import asyncio
-from playwright.async_api import Browser
-from Data.Access.db_helpers import save_prediction, save_region_league_entry, save_standings, save_team_entry
+from playwright.async_api import Browser, Page
+from Data.Access.db_helpers import save_prediction, save_region_league_entry, save_team_entry
+from Data.Access.team_history import team_history
+from Data.Access.standings_cache import standings_cache
 from Core.Browser.site_helpers import fs_universal_popup_dismissal
+from Core.Browser.page_pool import PagePool
+from Core.Browser.resource_blocker import apply_resource_profile
+from Core.Browser.wait_toolkit import wait_for_visible, wait_for_count_change
+from Core.Intelligence.intelligence import get_selector
 from Core.Browser.Extractors.h2h_extractor import extract_h2h_data, activate_h2h_tab, save_extracted_h2h_to_schedules
 from Core.Browser.Extractors.standings_extractor import extract_standings_data, activate_standings_tab
 from Core.Utils.monitor import PageMonitor
-from Core.Utils.utils import log_error_state
+from Core.Utils.utils import log_error_state, report_task_error
 import re
 
 def strip_league_stage(league_name: str):
@@ -26,20 +32,45 @@ from Core.Utils.constants import NAVIGATION_TIMEOUT, WAIT_FOR_LOAD_STATE_TIMEOUT
 from Core.Intelligence.model import RuleEngine
 from .fs_utils import retry_extraction
 
-async def process_match_task(match_data: dict, browser: Browser):
+# Mobile context used for match pages (per-task contexts and the warm page pool)
+MATCH_CONTEXT_OPTIONS = {
+    'user_agent': (
+        "Mozilla/5.0 (Linux; Android 10; SM-G973F) AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/91.0.4472.124 Mobile Safari/537.36"
+    ),
+    'viewport': {'width': 450, 'height': 900},
+    'timezone_id': "Africa/Lagos"
+}
+
+async def _setup_match_page(page: Page):
+    PageMonitor.attach_listeners(page)
+    await apply_resource_profile(page, "flashscore")
+
+def create_match_page_pool(browser: Browser, size: int) -> PagePool:
+    """Warm page pool for process_match_task, sized to the batch concurrency."""
+    return PagePool(browser, size, context_options=MATCH_CONTEXT_OPTIONS, setup=_setup_match_page)
+
+async def process_match_task(match_data: dict, browser: Browser = None, pool: PagePool = None):
     """
-    Worker function to process a single match in a new page/context.
+    Worker function to process a single match.
+    Uses a leased page from `pool` when given, otherwise a new page/context on `browser`.
     """
-    context = await browser.new_context(
-        user_agent=(
-            "Mozilla/5.0 (Linux; Android 10; SM-G973F) AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/91.0.4472.124 Mobile Safari/537.36"
-        ),
-        viewport={'width': 450, 'height': 900},
-        timezone_id="Africa/Lagos"
-    )
-    page = await context.new_page()
-    PageMonitor.attach_listeners(page)
+    if pool is not None:
+        async with pool.page() as page:
+            return await _process_match_on_page(match_data, page)
+    if browser is None:
+        raise ValueError("process_match_task needs a browser or a page pool")
+
+    context = await browser.new_context(**MATCH_CONTEXT_OPTIONS)
+    try:
+        page = await context.new_page()
+        await _setup_match_page(page)
+        return await _process_match_on_page(match_data, page)
+    finally:
+        await asyncio.sleep(1.0)
+        await context.close()
+
+async def _process_match_on_page(match_data: dict, page: Page):
     match_label = f"{match_data.get('home_team', 'unknown')}_vs_{match_data.get('away_team', 'unknown')}"
 
     try:
@@ -47,19 +78,23 @@ async def process_match_task(match_data: dict, browser: Browser):
 
         full_match_url = f"{match_data['match_link']}"
         await page.goto(full_match_url, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT)
-        await asyncio.sleep(2.0)
+        await wait_for_visible(page, get_selector("fs_match_page", "tab_h2h") or ".detail__tabs", "match_page_tabs", timeout_ms=8000)
 
         await fs_universal_popup_dismissal(page, "fs_match_page")
         await page.wait_for_load_state("domcontentloaded", timeout=WAIT_FOR_LOAD_STATE_TIMEOUT)
         
-        # --- H2H Tab & Expansion (Mobile Optimized) ---
-        h2h_data = {}
-        if await activate_h2h_tab(page):
+        # --- H2H: local history when both sides are fresh, else the tab ---
+        h2h_data = team_history.resolve(match_data) or {}
+        if h2h_data:
+            print(f"      [OK H2H] Local history is current for {match_label}; H2H tab skipped.")
+        elif await activate_h2h_tab(page):
             try:
                 # Sections: Home Last 5/10, Away Last 5/10, Mutual H2H
                 show_more_selector = ".h2h__section .h2h__showMore"
+                row_selector = get_selector("fs_h2h_tab", "h2h_row_general") or ".h2h__row"
                 
                 print("    [H2H Expansion] Expanding sections for deep analysis...")
+                row_count = await page.locator(row_selector).count()
                 for _ in range(2): # Click twice for each to get ~15 matches
                     buttons = page.locator(show_more_selector)
                     btn_count = await buttons.count()
@@ -68,17 +103,17 @@ async def process_match_task(match_data: dict, browser: Browser):
                             btn = buttons.nth(j)
                             if await btn.is_visible():
                                 await btn.click(timeout=5000)
-                                await asyncio.sleep(1.0)
+                                # Proceed as soon as the extra rows are rendered
+                                row_count = await wait_for_count_change(page, row_selector, row_count, "h2h_show_more", timeout_ms=3000)
                         except:
                             continue
                 
-                await asyncio.sleep(1.5)
                 h2h_data = await retry_extraction(extract_h2h_data, page, match_data['home_team'], match_data['away_team'], "fs_h2h_tab")
 
                 h2h_count = len(h2h_data.get("home_last_10_matches", [])) + len(h2h_data.get("away_last_10_matches", [])) + len(h2h_data.get("head_to_head", []))
                 print(f"      [OK H2H] H2H tab data extracted for {match_label} ({h2h_count} matches found)")
 
-                await save_extracted_h2h_to_schedules(h2h_data)
+                team_history.record(await save_extracted_h2h_to_schedules(h2h_data))
 
             except Exception as e:
                 print(f"      [Warning] Failed to fully load/expand H2H tab for {match_label}: {e}")
@@ -93,11 +128,16 @@ async def process_match_task(match_data: dict, browser: Browser):
             print(f"      [Data Quality] Skipped {match_label}: Insufficient form data (Home: {home_form_count}, Away: {away_form_count})")
             return False
 
-        # --- Standings Tab ---
+        # --- Standings (shared per league and season within the cycle) ---
         standings_data = []
         standings_league = "Unknown"
-        
-        if await activate_standings_tab(page):
+        cached_standings = standings_cache.get(match_data.get('region_league'), match_data.get('date'))
+
+        if cached_standings is not None:
+            standings_data = cached_standings['standings']
+            standings_league = cached_standings['region_league']
+            print(f"      [OK Standing] Reused cached standings for {standings_league}")
+        elif await activate_standings_tab(page):
             try:
                 standings_result = await retry_extraction(extract_standings_data, page)
                 standings_data = standings_result.get("standings", [])
@@ -108,10 +148,9 @@ async def process_match_task(match_data: dict, browser: Browser):
                 if standings_result.get("has_draw_table"):
                     print(f"      [Graceful Skip] Match has Draw table (Cup/Tournament). Proceeding without standings.")
                     # We don't return False here, allowing H2H-only prediction
+                standings_cache.put(match_data.get('region_league'), match_data.get('date'),
+                                    standings_data, standings_league, standings_league_url)
                 if standings_data and standings_league != "Unknown":
-                    for row in standings_data:
-                        row['url'] = standings_league_url
-                    save_standings(standings_data, standings_league)
                     print(f"      [OK Standing] Standings tab data extracted for {standings_league}")
                 ## Phase 5: League Stage Parsing Fix
                 # - [x] Update `db_helpers.py` headers for `league_stage`
@@ -125,14 +164,20 @@ async def process_match_task(match_data: dict, browser: Browser):
         try:
             from Core.Intelligence.selector_manager import SelectorManager
             
-            sel_region_name = await SelectorManager.get_selector_auto(page, "fs_match_page", "region_name")
-            sel_region_flag = await SelectorManager.get_selector_auto(page, "fs_match_page", "region_flag_img")
-            sel_league_url = await SelectorManager.get_selector_auto(page, "fs_match_page", "league_url")
+            # One validation round-trip (and at most one heal) for all metadata selectors
+            sels = await SelectorManager.get_selectors_auto(page, "fs_match_page", [
+                "region_name", "region_flag_img", "region_url", "league_url",
+                "home_crest", "home_url", "away_crest", "away_url"
+            ])
+            sel_region_name = sels.get("region_name")
+            sel_region_flag = sels.get("region_flag_img")
+            sel_region_url = sels.get("region_url")
+            sel_league_url = sels.get("league_url")
             
-            sel_home_crest = await SelectorManager.get_selector_auto(page, "fs_match_page", "home_crest")
-            sel_home_url = await SelectorManager.get_selector_auto(page, "fs_match_page", "home_url")
-            sel_away_crest = await SelectorManager.get_selector_auto(page, "fs_match_page", "away_crest")
-            sel_away_url = await SelectorManager.get_selector_auto(page, "fs_match_page", "away_url")
+            sel_home_crest = sels.get("home_crest")
+            sel_home_url = sels.get("home_url")
+            sel_away_crest = sels.get("away_crest")
+            sel_away_url = sels.get("away_url")
 
             region_name = await page.locator(sel_region_name).inner_text() if sel_region_name else "Unknown"
             region_flag = await page.locator(sel_region_flag).get_attribute("src") if sel_region_flag else ""
@@ -244,8 +289,6 @@ async def process_match_task(match_data: dict, browser: Browser):
 
     except Exception as e:
         print(f"      [Error] Match failed {match_label}: {e}")
+        report_task_error(e)
         await log_error_state(page, f"process_match_task_{match_label}", e)
         return False
-    finally:
-        await asyncio.sleep(1.0)
-        await context.close()
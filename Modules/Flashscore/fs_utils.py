@@ -4,22 +4,31 @@
 
 import asyncio
 
+from playwright.async_api import Page
+
+from Core.Browser.wait_toolkit import wait_for_network_idle
+
 
 MAX_EXTRACTION_RETRIES = 3
+# Upper bounds (seconds) between attempts; with a page the wait ends once its network is idle
 EXTRACTION_RETRY_DELAYS = [5, 10, 15]
 
 async def retry_extraction(extraction_func, *args, **kwargs):
     """
-    Retry wrapper for extraction functions with progressive delays.
+    Retry wrapper for extraction functions with progressive, condition-bounded delays.
     """
+    page = next((a for a in args if isinstance(a, Page)), None)
     for attempt in range(MAX_EXTRACTION_RETRIES):
         try:
             return await extraction_func(*args, **kwargs)
         except Exception as e:
             if attempt < MAX_EXTRACTION_RETRIES - 1:
                 delay = EXTRACTION_RETRY_DELAYS[attempt]
-                print(f"      [Retry] Extraction failed (attempt {attempt + 1}), retrying in {delay}s: {e}")
-                await asyncio.sleep(delay)
+                print(f"      [Retry] Extraction failed (attempt {attempt + 1}), retrying after network idle (max {delay}s): {e}")
+                if page is not None and not page.is_closed():
+                    await wait_for_network_idle(page, f"extraction_retry_{attempt + 1}", timeout_ms=delay * 1000)
+                else:
+                    await asyncio.sleep(delay)
             else:
                 print(f"      [Retry] Extraction failed after {MAX_EXTRACTION_RETRIES} attempts: {e}")
                 raise
@@ -14,9 +14,14 @@ from zoneinfo import ZoneInfo
 from playwright.async_api import Playwright
 
 from Data.Access.db_helpers import (
-    get_last_processed_info, save_schedule_entry, save_team_entry
+    get_last_processed_info, save_schedule_entries, save_team_entries
 )
+from Data.Access.sync_scheduler import sync_scheduler
+from Data.Access.team_history import team_history
+from Data.Access.standings_cache import standings_cache
 from Core.Browser.site_helpers import fs_universal_popup_dismissal, click_next_day
+from Core.Browser.resource_blocker import apply_resource_profile
+from Core.Browser.wait_toolkit import print_wait_summary
 from Core.Utils.utils import BatchProcessor
 from Core.Utils.monitor import PageMonitor
 from Core.Intelligence.selector_manager import SelectorManager
@@ -24,11 +29,14 @@ from Core.Utils.constants import NAVIGATION_TIMEOUT, WAIT_FOR_LOAD_STATE_TIMEOUT
 
 # Modular Imports
 from .fs_schedule import extract_matches_from_page
-from .fs_processor import process_match_task
+from .fs_processor import process_match_task, create_match_page_pool
 from .fs_offline import run_flashscore_offline_repredict
 
 NIGERIA_TZ = ZoneInfo("Africa/Lagos")
 
+# Tables written while analysing matches (predictions, schedules, teams, standings, leagues)
+CHAPTER_1_TABLES = ('predictions', 'schedules', 'teams', 'standings', 'region_league')
+
 async def run_flashscore_analysis(playwright: Playwright):
     """
     Main function to handle Flashscore data extraction and analysis.
@@ -42,11 +50,13 @@ async def run_flashscore_analysis(playwright: Playwright):
     )
 
     context = None
+    match_pool = None
     try:
         context = await browser.new_context(
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             timezone_id="Africa/Lagos"
         )
+        await apply_resource_profile(context, "flashscore")
         page = await context.new_page()
         PageMonitor.attach_listeners(page)
         
@@ -74,137 +84,174 @@ async def run_flashscore_analysis(playwright: Playwright):
         await fs_universal_popup_dismissal(page, "fs_home_page")
 
         last_processed_info = get_last_processed_info()
+        # Cycle-scoped local history; kept current as H2H tabs are scraped
+        team_history.refresh()
+        standings_cache.begin_cycle()
         
         # Fix #5: If resume date is already in the future, skip forward scanning
         resume_date = last_processed_info.get('date_obj')
         if resume_date and resume_date > (dt.now(NIGERIA_TZ) + timedelta(days=7)).date():
             print(f"  [Chapter 1A] Resume date {resume_date} is beyond 7-day window. All caught up — skipping forward scan.")
         else:
-            print(f"  [Chapter 1A] Starting analysis loop for 7 days...")
-            for day_offset in range(7):
-                target_date = dt.now(NIGERIA_TZ) + timedelta(days=day_offset)
-                target_full = target_date.strftime("%d.%m.%Y")
-            
-                if day_offset > 0:
-                    match_row_sel = await SelectorManager.get_selector_auto(page, "fs_home_page", "match_rows")
-                    if not match_row_sel or not await click_next_day(page, match_row_sel):
-                        break
-                    await asyncio.sleep(2)
-
-                if resume_date and target_date.date() < resume_date:
-                    continue
-
-                print(f"\n--- ANALYZING DATE: {target_full} ---")
-                await fs_universal_popup_dismissal(page, "fs_home_page")
-
-                try:
-                    scheduled_tab_sel = await SelectorManager.get_selector_auto(page, "fs_home_page", "tab_scheduled")
-                    if scheduled_tab_sel and await page.locator(scheduled_tab_sel).is_visible(timeout=WAIT_FOR_LOAD_STATE_TIMEOUT):
-                        await page.click(scheduled_tab_sel)
-                        await asyncio.sleep(2.0)
-                except Exception:
-                    pass
-
-                await fs_universal_popup_dismissal(page, "fs_home_page")
-                matches_data = await extract_matches_from_page(page)
-                
-                # --- Cleaning & Sorting ---
-                for m in matches_data:
-                    original_time_str = m.get('time')
-                    if original_time_str:
-                        clean_time_str = original_time_str.split('\n')[0].strip()
-                        m['time'] = clean_time_str if clean_time_str and clean_time_str != 'N/A' else 'N/A'
-
-                matches_data.sort(key=lambda x: x.get('time', '23:59'))
-
-                # --- Load existing predictions for robust resume ---
-                from Data.Access.db_helpers import PREDICTIONS_CSV
-                import csv
-                existing_ids = set()
-                if os.path.exists(PREDICTIONS_CSV):
-                    try:
-                        with open(PREDICTIONS_CSV, 'r', encoding='utf-8') as f:
-                            reader = csv.DictReader(f)
-                            existing_ids = {row['fixture_id'] for row in reader if row.get('fixture_id')}
-                    except Exception:
-                        pass
-
-                # --- Save to DB & Filter ---
-                valid_matches = []
-                now_time = dt.now(NIGERIA_TZ).time()
-                is_today = target_date.date() == dt.now(NIGERIA_TZ).date()
-
-                def is_time_parsable(t_str):
+            print(f"  [Chapter 1A] Starting streaming analysis for 7 days...")
+            # Stage 1 (discovery) feeds a bounded queue; stage 2 workers extract and
+            # predict matches under the adaptive limit; stage 3 (persistence) is the
+            # background sync scheduler. A full queue pauses discovery (backpressure).
+            processor = BatchProcessor(max_concurrent=env_concurrency)
+            match_pool = create_match_page_pool(browser, processor.max_concurrent)
+            await match_pool.start()
+
+            match_queue: asyncio.Queue = asyncio.Queue(maxsize=processor.ceiling * 2)
+            stats = {'queued': 0, 'done': 0, 'predicted': 0}
+
+            async def match_worker():
+                while True:
+                    m = await match_queue.get()
                     try:
-                        dt.strptime(t_str, '%H:%M')
-                        return True
-                    except (ValueError, TypeError):
-                        return False
-
-                for m in matches_data:
-                    fixture_id = m.get('id')
-                    m['date'] = target_full
-                    save_schedule_entry({
-                        'fixture_id': fixture_id, 'date': m.get('date'), 'match_time': m.get('time'),
-                        'region_league': m.get('region_league'), 'home_team': m.get('home_team'),
-                        'away_team': m.get('away_team'), 'home_team_id': m.get('home_team_id'),
-                        'away_team_id': m.get('away_team_id'), 'match_status': 'scheduled',
-                        'match_link': m.get('match_link')
-                    })
-                    save_team_entry({'team_id': m.get('home_team_id'), 'team_name': m.get('home_team'), 'region_league': m.get('region_league'), 'team_url': m.get('home_team_url')})
-                    save_team_entry({'team_id': m.get('away_team_id'), 'team_name': m.get('away_team'), 'region_league': m.get('region_league'), 'team_url': m.get('away_team_url')})
-
-                    # Robust Resume: Skip if already predicted
-                    if fixture_id in existing_ids:
-                        continue
-
-                    if is_today:
-                        time_str = m.get('time')
-                        if is_time_parsable(time_str):
-                            if dt.strptime(time_str, '%H:%M').time() > now_time:
-                                valid_matches.append(m)
-                        else:
-                            # Non-parsable time (Postponed, etc) - Keep it in valid_matches for analysis
-                            # unless it's explicitly 'N/A' or 'Fin'
-                            if time_str not in ('N/A', 'Fin', 'Finished', 'CAN'):
-                                valid_matches.append(m)
-                    else:
-                        valid_matches.append(m)
+                        if m is None:
+                            return
+                        try:
+                            result = await processor.run(process_match_task, m, pool=match_pool)
+                        except Exception as e:
+                            print(f"      [Worker Error] {m.get('home_team')} vs {m.get('away_team')}: {e}")
+                            result = False
+                        stats['done'] += 1
+                        if result:
+                            stats['predicted'] += 1
+                            sync_scheduler.mark_dirty(*CHAPTER_1_TABLES)
+                            if stats['predicted'] % 10 == 0:
+                                print(f"\n   [Analytics Sync] {stats['predicted']} predictions generated. Queued background sync.")
+                        # Keep one warm page per slot as the adaptive limit moves
+                        await match_pool.resize(processor.current_limit)
+                    finally:
+                        match_queue.task_done()
 
-                # --- Batch Processing With Dynamic Concurrency ---
-                if valid_matches:
-                    # Dynamic scaling
-                    if len(valid_matches) > 100:
-                        max_concurrent = min(env_concurrency + 3, 10) # Aggressive
-                    elif len(valid_matches) < 20:
-                        max_concurrent = max(env_concurrency - 2, 2) # Conservative
-                    else:
-                        max_concurrent = env_concurrency             # Standard
-                    
-                    print(f"    [Batching] Processing {len(valid_matches)} matches concurrently (Scaling: {max_concurrent})...")
-                    processor = BatchProcessor(max_concurrent=max_concurrent)
-                    
-                    # Process in smaller chunks to trigger frequent syncs
-                    analysis_chunk_size = 10
-                    for i in range(0, len(valid_matches), analysis_chunk_size):
-                        chunk = valid_matches[i:i + analysis_chunk_size]
-                        chunk_results = await processor.run_batch(chunk, process_match_task, browser=browser)
-                        
-                        successful_in_chunk = sum(1 for r in chunk_results if r)
-                        total_cycle_predictions += successful_in_chunk
-                        
-                        if successful_in_chunk > 0:
-                            print(f"\n   [Analytics Sync] {total_cycle_predictions} predictions generated. Triggering micro-batch sync...")
-                            from Data.Access.sync_manager import run_full_sync
-                            await run_full_sync()
-                else:
-                    print("    [Info] No new matches to process.")
+            workers = [asyncio.create_task(match_worker()) for _ in range(processor.ceiling)]
+            try:
+                await _discover_schedules(page, resume_date, match_queue, stats)
+            finally:
+                for _ in workers:
+                    await match_queue.put(None)
+                await asyncio.gather(*workers, return_exceptions=True)
+
+            total_cycle_predictions = stats['predicted']
+            print(f"    [Pipeline] {stats['queued']} matches queued, {stats['done']} processed, final concurrency {processor.current_limit}.")
 
     finally:
+        if match_pool is not None:
+            await match_pool.close()
         if context is not None:
             await context.close()
         if 'browser' in locals():
              await browser.close()
+        # Chapter end: one final sync of everything still dirty.
+        await sync_scheduler.flush("Chapter 1A/1B")
              
     print(f"\n--- Data Extraction & Analysis Complete: {total_cycle_predictions} new predictions found. ---")
+    print_wait_summary("Observed page waits this cycle:")
+    team_history.print_summary()
+    standings_cache.print_summary()
+
+
+def _is_time_parsable(t_str):
+    try:
+        dt.strptime(t_str, '%H:%M')
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+async def _discover_schedules(page, resume_date, match_queue: asyncio.Queue, stats: dict):
+    """
+    Pipeline stage 1: walks the next 7 days on the schedule page, saves each
+    day's schedule and teams in one bulk write, and queues matches that still
+    need a prediction. Blocks on a full queue, which throttles discovery to the
+    pace of the match workers.
+    """
+    # --- Load existing predictions for robust resume ---
+    from Data.Access.db_helpers import PREDICTIONS_CSV, _read_csv
+    existing_ids = {row['fixture_id'] for row in _read_csv(PREDICTIONS_CSV) if row.get('fixture_id')}
+
+    for day_offset in range(7):
+        target_date = dt.now(NIGERIA_TZ) + timedelta(days=day_offset)
+        target_full = target_date.strftime("%d.%m.%Y")
+
+        if day_offset > 0:
+            match_row_sel = await SelectorManager.get_selector_auto(page, "fs_home_page", "match_rows")
+            if not match_row_sel or not await click_next_day(page, match_row_sel):
+                break
+            await asyncio.sleep(2)
+
+        if resume_date and target_date.date() < resume_date:
+            continue
+
+        print(f"\n--- ANALYZING DATE: {target_full} ---")
+        await fs_universal_popup_dismissal(page, "fs_home_page")
+
+        try:
+            scheduled_tab_sel = await SelectorManager.get_selector_auto(page, "fs_home_page", "tab_scheduled")
+            if scheduled_tab_sel and await page.locator(scheduled_tab_sel).is_visible(timeout=WAIT_FOR_LOAD_STATE_TIMEOUT):
+                await page.click(scheduled_tab_sel)
+                await asyncio.sleep(2.0)
+        except Exception:
+            pass
+
+        await fs_universal_popup_dismissal(page, "fs_home_page")
+        matches_data = await extract_matches_from_page(page)
+
+        # --- Cleaning & Sorting ---
+        for m in matches_data:
+            original_time_str = m.get('time')
+            if original_time_str:
+                clean_time_str = original_time_str.split('\n')[0].strip()
+                m['time'] = clean_time_str if clean_time_str and clean_time_str != 'N/A' else 'N/A'
+
+        matches_data.sort(key=lambda x: x.get('time', '23:59'))
+
+        # --- Save to DB (one bulk write per table) & Filter ---
+        now_time = dt.now(NIGERIA_TZ).time()
+        is_today = target_date.date() == dt.now(NIGERIA_TZ).date()
+
+        schedule_entries, team_entries, valid_matches = [], [], []
+        for m in matches_data:
+            fixture_id = m.get('id')
+            m['date'] = target_full
+            schedule_entries.append({
+                'fixture_id': fixture_id, 'date': m.get('date'), 'match_time': m.get('time'),
+                'region_league': m.get('region_league'), 'home_team': m.get('home_team'),
+                'away_team': m.get('away_team'), 'home_team_id': m.get('home_team_id'),
+                'away_team_id': m.get('away_team_id'), 'match_status': 'scheduled',
+                'match_link': m.get('match_link')
+            })
+            team_entries.append({'team_id': m.get('home_team_id'), 'team_name': m.get('home_team'), 'region_league': m.get('region_league'), 'team_url': m.get('home_team_url')})
+            team_entries.append({'team_id': m.get('away_team_id'), 'team_name': m.get('away_team'), 'region_league': m.get('region_league'), 'team_url': m.get('away_team_url')})
+
+            # Robust Resume: Skip if already predicted
+            if fixture_id in existing_ids:
+                continue
+
+            if is_today:
+                time_str = m.get('time')
+                if _is_time_parsable(time_str):
+                    if dt.strptime(time_str, '%H:%M').time() > now_time:
+                        valid_matches.append(m)
+                else:
+                    # Non-parsable time (Postponed, etc) - Keep it in valid_matches for analysis
+                    # unless it's explicitly 'N/A' or 'Fin'
+                    if time_str not in ('N/A', 'Fin', 'Finished', 'CAN'):
+                        valid_matches.append(m)
+            else:
+                valid_matches.append(m)
+
+        save_schedule_entries(schedule_entries)
+        save_team_entries(team_entries)
+
+        if not valid_matches:
+            print("    [Info] No new matches to process.")
+            continue
 
+        print(f"    [Pipeline] Queuing {len(valid_matches)} matches for {target_full}...")
+        for m in valid_matches:
+            existing_ids.add(m.get('id'))
+            await match_queue.put(m)
+            stats['queued'] += 1
@@ -9,6 +9,7 @@ from pathlib import Path
 from datetime import datetime as dt
 from playwright.async_api import Page
 from Core.Browser.site_helpers import get_main_frame
+from Core.Browser.page_health import page_health
 from Data.Access.db_helpers import (
     update_prediction_status, 
     update_site_match_status, 
@@ -25,6 +26,7 @@ from .slip import get_bet_slip_count
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from .slip import force_clear_slip
+from ..fb_session import restore_fb_page
 from Data.Access.sync_manager import run_full_sync
 
 async def ensure_bet_insights_collapsed(page: Page):
@@ -115,11 +117,12 @@ async def check_match_start_time(page: Page) -> bool:
         print(f"    [Time Check] Error checking match time: {e}. Assuming safe to proceed.")
         return True
 
-async def harvest_booking_codes(page: Page, matched_urls: Dict[str, str], day_predictions: List[Dict], target_date: str):
+async def harvest_booking_codes(page: Page, matched_urls: Dict[str, str], day_predictions: List[Dict], target_date: str) -> Page:
     """
     Chapter 1C: Odds Selection & Extraction.
     Follows flowchart: Navigate -> Select -> Book -> Save Code -> Clear Slip.
     Includes 10-harvest progressive synchronization to Supabase.
+    Returns the page to keep using (a recycled replacement if it grew too large).
     """
     processed_urls = set()
     harvest_success_count = 0
@@ -137,6 +140,9 @@ async def harvest_booking_codes(page: Page, matched_urls: Dict[str, str], day_pr
         processed_urls.add(match_url)
 
         try:
+            # 0. Swap the page for a fresh one if its renderer memory grew too large
+            page = await page_health.ensure_healthy(page, "Football.com harvest page", restore=restore_fb_page)
+
             # 1. Navigation
             await page.goto(match_url, wait_until='domcontentloaded', timeout=30000)
             await asyncio.sleep(3)
@@ -195,6 +201,8 @@ async def harvest_booking_codes(page: Page, matched_urls: Dict[str, str], day_pr
         print(f"\n    [Harvest Sync] Finalizing sync for {harvest_success_count} harvests...")
         await run_full_sync()
 
+    return page
+
 async def find_and_click_outcome(page: Page, m_name: str, o_name: str) -> tuple:
     """Helper to search for and click the outcome button."""
     frame = await get_main_frame(page)
@@ -13,11 +13,12 @@ from playwright.async_api import Playwright
 
 # Modular Imports
 from .fb_setup import get_pending_predictions_by_date
-from .fb_session import launch_browser_with_retry
+from .fb_session import launch_browser_with_retry, restore_fb_page
 from .fb_url_resolver import resolve_urls
 from .navigator import load_or_create_session, extract_balance
 from Core.Utils.utils import log_error_state
 from Core.Utils.monitor import PageMonitor
+from Core.Browser.page_health import page_health
 from Core.System.lifecycle import log_state
 
 
@@ -69,7 +70,7 @@ async def run_odds_harvesting(playwright: Playwright):
                 # 2. Odds Selection & Code Extraction
                 print(f"  [Chapter 1C] Starting odds discovery for {target_date}...")
                 from Modules.FootballCom.booker.booking_code import harvest_booking_codes
-                await harvest_booking_codes(page, matched_urls, day_preds, target_date)
+                page = await harvest_booking_codes(page, matched_urls, day_preds, target_date)
 
             break  # Success exit
 
@@ -131,6 +132,7 @@ async def run_automated_booking(playwright: Playwright):
 
             for target_date, harvested in booking_queue.items():
                 print(f"\n--- Booking Date: {target_date} ---")
+                page = await page_health.ensure_healthy(page, "Football.com booking page", restore=restore_fb_page)
                 await place_multi_bet_from_codes(page, harvested, current_balance)
                 log_state(chapter="Chapter 2A", action="Booking Complete", next_step=f"Processed {target_date}")
 
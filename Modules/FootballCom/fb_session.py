@@ -6,7 +6,10 @@ import asyncio
 import os
 import subprocess
 from pathlib import Path
-from playwright.async_api import Playwright, BrowserContext
+from playwright.async_api import Playwright, BrowserContext, Page
+
+from Core.Utils.constants import NAVIGATION_TIMEOUT
+from Core.Utils.monitor import PageMonitor
 
 async def cleanup_chrome_processes():
     """Automatically terminate conflicting Chrome processes before launch."""
@@ -78,3 +81,10 @@ async def launch_browser_with_retry(playwright: Playwright, user_data_dir: Path,
             else:
                 print(f"  [Launch] All {max_retries} attempts failed.")
                 raise e
+
+async def restore_fb_page(page: Page, url: str):
+    """Restores a recycled Football.com page: monitor listeners and the previous URL.
+    The login session lives in the persistent context, so it carries over."""
+    PageMonitor.attach_listeners(page)
+    target = url if url.startswith("http") else "https://www.football.com/ng"
+    await page.goto(target, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT)
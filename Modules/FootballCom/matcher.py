@@ -7,13 +7,11 @@ Matcher Module
 Handles matching predictions.csv data with extracted Football.com matches using Leo AI.
 """
 
-import csv
 import difflib
 from typing import List, Dict, Optional, Any
 from datetime import datetime, timedelta
 
-from pathlib import Path
-from Data.Access.db_helpers import PREDICTIONS_CSV, update_prediction_status
+from Data.Access.db_helpers import PREDICTIONS_CSV, update_prediction_status, _read_csv
 # Import LLM matcher conditionally
 try:
     import Core.Intelligence.llm_matcher as llm_module
@@ -34,14 +32,9 @@ except ImportError:
 
 async def filter_pending_predictions() -> List[Dict]:
     """Load and filter predictions that are pending booking."""
-    pending_predictions = []
-    csv_path = Path(PREDICTIONS_CSV)
-    if csv_path.exists():
-        with open(csv_path, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            # v2.8: Pick 'pending' and 'failed_harvest' (to allow retries).
-            # Statuses like 'no_site_match', 'added_to_slip', 'booked' are skipped.
-            pending_predictions = [row for row in reader if row.get('status') in ['pending', 'failed_harvest']]
+    # v2.8: Pick 'pending' and 'failed_harvest' (to allow retries).
+    # Statuses like 'no_site_match', 'added_to_slip', 'booked' are skipped.
+    pending_predictions = [row for row in _read_csv(PREDICTIONS_CSV) if row.get('status') in ['pending', 'failed_harvest']]
     print(f"  [Matcher] Found {len(pending_predictions)} pending predictions.")
     return pending_predictions
 
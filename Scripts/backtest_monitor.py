@@ -9,7 +9,7 @@ import traceback
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(PROJECT_ROOT)
 
-from Modules.Flashscore.fs_offline import run_flashscore_offline_repredict
+from Modules.Flashscore.fs_offline import run_flashscore_offline_repredict, OFFLINE_WORKERS
 from Core.Intelligence.rule_config import RuleConfig
 
 import asyncio
@@ -18,9 +18,10 @@ STORE_PATH = os.path.join(PROJECT_ROOT, "Data", "Store")
 TRIGGER_FILE = os.path.join(STORE_PATH, "trigger_backtest.json")
 CONFIG_FILE = os.path.join(STORE_PATH, "rule_config.json")
 
-async def run_backtest(config):
-    # Pass None for playwright as it appears unused in offline mode
-    await run_flashscore_offline_repredict(playwright=None, custom_config=config)
+async def run_backtest(config, workers=OFFLINE_WORKERS):
+    # Pass None for playwright as it appears unused in offline mode.
+    # Fixtures are sharded across `workers` processes (LEO_OFFLINE_WORKERS).
+    await run_flashscore_offline_repredict(playwright=None, custom_config=config, workers=workers)
 
 def monitor():
     print(f"--- LeoBook Backtest Monitor Started ---")
@@ -0,0 +1,115 @@
+"""
+Benchmark: legacy read-merge-rewrite UPSERT vs the in-memory table engine.
+
+Runs N upserts (default 10,000; half updates, half inserts) against a
+schedules-shaped CSV in a temporary directory and reports wall time for:
+  1. the legacy path (read whole CSV, merge one row, rewrite whole CSV)
+  2. the table engine path (indexed in-memory UPSERT + one atomic flush)
+
+Usage:
+    python Scripts/benchmark_table_engine.py [--upserts 10000] [--base-rows 0]
+"""
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from Data.Access.table_engine import TableEngine
+from Data.Access.db_helpers import SCHEDULES_CSV, files_and_headers
+
+HEADERS = files_and_headers[SCHEDULES_CSV]
+
+
+def _legacy_upsert_entry(filepath, data_row, fieldnames, unique_key):
+    """Verbatim copy of the pre-engine csv_operations.upsert_entry."""
+    all_rows = []
+    if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
+        with open(filepath, 'r', newline='', encoding='utf-8') as f:
+            all_rows = list(csv.DictReader(f))
+
+    unique_id = data_row.get(unique_key)
+    updated = False
+    for row in all_rows:
+        if row.get(unique_key) == unique_id:
+            row.update(data_row)
+            updated = True
+            break
+    if not updated:
+        all_rows.append(data_row)
+
+    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(all_rows)
+
+
+def _make_row(i, key_space):
+    fid = f"FX{i % key_space:07d}"
+    return {
+        'fixture_id': fid, 'date': '17.02.2026', 'match_time': '15:00',
+        'region_league': 'ENGLAND - Premier League', 'league_id': 'dYlOSQOD',
+        'home_team': f"Home {fid}", 'away_team': f"Away {fid}",
+        'home_team_id': f"H{fid}", 'away_team_id': f"A{fid}",
+        'home_score': str(i % 4), 'away_score': str(i % 3),
+        'match_status': 'finished', 'match_link': f"https://www.flashscore.com/match/{fid}/",
+        'league_stage': '', 'last_updated': f"2026-02-17T15:00:{i % 60:02d}"
+    }
+
+
+def _seed(filepath, base_rows):
+    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=HEADERS)
+        writer.writeheader()
+        for i in range(base_rows):
+            row = _make_row(i, base_rows)
+            row['fixture_id'] = f"BASE{i:07d}"
+            writer.writerow(row)
+
+
+def run(upserts: int, base_rows: int):
+    key_space = max(upserts // 2, 1)
+    rows = [_make_row(i, key_space) for i in range(upserts)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = os.path.join(tmp, "legacy_schedules.csv")
+        engine_path = os.path.join(tmp, "engine_schedules.csv")
+        _seed(legacy_path, base_rows)
+        _seed(engine_path, base_rows)
+
+        print(f"  [Bench] {upserts} upserts ({key_space} unique keys) on {base_rows} seeded rows")
+
+        start = time.perf_counter()
+        for i, row in enumerate(rows, 1):
+            _legacy_upsert_entry(legacy_path, dict(row), HEADERS, 'fixture_id')
+            if i % 1000 == 0:
+                print(f"    [Legacy] {i}/{upserts} ({time.perf_counter() - start:.1f}s)")
+        legacy_s = time.perf_counter() - start
+
+        engine = TableEngine(flush_interval=float('inf'))
+        start = time.perf_counter()
+        for row in rows:
+            engine.upsert(engine_path, dict(row), HEADERS, 'fixture_id')
+        engine.flush()
+        engine_s = time.perf_counter() - start
+
+        with open(legacy_path, 'r', newline='', encoding='utf-8') as a, \
+             open(engine_path, 'r', newline='', encoding='utf-8') as b:
+            identical = a.read() == b.read()
+
+    print(f"  [Legacy] {legacy_s:.2f}s  ({upserts / legacy_s:,.0f} upserts/s)")
+    print(f"  [Engine] {engine_s:.2f}s  ({upserts / engine_s:,.0f} upserts/s)")
+    print(f"  [Speedup] {legacy_s / engine_s:,.1f}x | Output identical: {identical}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark CSV UPSERT paths")
+    parser.add_argument('--upserts', type=int, default=10000)
+    parser.add_argument('--base-rows', type=int, default=0)
+    args = parser.parse_args()
+    run(args.upserts, args.base_rows)
@@ -37,12 +37,13 @@ from Data.Access.sync_manager import SyncManager, run_full_sync
 from Data.Access.db_helpers import (
     SCHEDULES_CSV, TEAMS_CSV, REGION_LEAGUE_CSV, STANDINGS_CSV, PREDICTIONS_CSV,
     save_team_entry, save_region_league_entry, save_schedule_entry,
-    save_standings, backfill_prediction_entry
+    save_standings, backfill_prediction_entry, flush_tables
 )
 from Data.Access.outcome_reviewer import smart_parse_datetime
 from Core.Browser.Extractors.standings_extractor import extract_standings_data, activate_standings_tab
 from Core.Browser.Extractors.league_page_extractor import extract_league_match_urls
 from Modules.Flashscore.fs_utils import retry_extraction
+from Core.Browser.resource_blocker import apply_resource_profile
 from Core.Utils.constants import NAVIGATION_TIMEOUT, WAIT_FOR_LOAD_STATE_TIMEOUT
 
 # Configuration
@@ -327,6 +328,7 @@ async def process_match_task_isolated(browser: Browser, match: Dict, sel: Dict[s
             user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             ignore_https_errors=True
         )
+        await apply_resource_profile(context, "enrichment")
         try:
             page = await context.new_page()
             needs = match.get('_enrich_needs', [])
@@ -503,7 +505,9 @@ async def enrich_all_schedules(limit: Optional[int] = None, dry_run: bool = Fals
             async with async_playwright() as p:
                 browser = await p.chromium.launch(headless=True)
                 page = await browser.new_page()
+                await apply_resource_profile(page, "enrichment")
                 
+                flush_tables(REGION_LEAGUE_CSV)
                 leagues_df = pd.read_csv(REGION_LEAGUE_CSV, dtype=str).fillna('')
                 # Filter for leagues that have a URL
                 active_leagues = leagues_df[leagues_df['league_url'] != ''].to_dict('records')
@@ -525,6 +529,7 @@ async def enrich_all_schedules(limit: Optional[int] = None, dry_run: bool = Fals
                 if new_match_urls:
                     print(f"[SUCCESS] Harvested {len(new_match_urls)} total match URLs from league pages.")
                     # Load current schedules to avoid duplicates
+                    flush_tables(SCHEDULES_CSV)
                     df_current = pd.read_csv(SCHEDULES_CSV, dtype=str).fillna('')
                     existing_links = set(df_current['match_link'].tolist())
                     
@@ -551,7 +556,8 @@ async def enrich_all_schedules(limit: Optional[int] = None, dry_run: bool = Fals
     print("  Goal: Identify and resolve fixture gaps using Pandas & Cloud Merge.")
     print("=" * 80)
 
-    # Load with Pandas for Analysis
+    # Load with Pandas for Analysis (buffered schedule writes flushed first)
+    flush_tables(SCHEDULES_CSV)
     df_schedules = pd.read_csv(SCHEDULES_CSV, dtype=str).fillna('')
     
     # --- ROW CLEANUP: Remove invalid matches (with safety guard) ---
@@ -816,6 +822,7 @@ async def enrich_all_schedules(limit: Optional[int] = None, dry_run: bool = Fals
                 print(f"\n   [PROLOGUE] Rebuilding Search Dictionary...")
                 try:
                     from Scripts.build_search_dict import main as build_search
+                    flush_tables()  # build_search_dict reads and rewrites the CSV files directly
                     build_search()
                     print(f"   [SUCCESS] Search dictionary rebuilt and synced.")
                 except Exception as e:
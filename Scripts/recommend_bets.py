@@ -2,7 +2,6 @@
 # Refactored for Clean Architecture (v2.7)
 # This script displays the top-rated AI predictions for manual review or export.
 
-import csv
 import os
 import sys
 import argparse
@@ -25,14 +24,11 @@ script_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(script_dir)
 sys.path.append(project_root)
 
-from Data.Access.db_helpers import PREDICTIONS_CSV
+from Data.Access.db_helpers import PREDICTIONS_CSV, files_and_headers, _read_csv, _write_csv
 from Data.Access.prediction_accuracy import get_market_option
 
 def load_data():
-    if not os.path.exists(PREDICTIONS_CSV):
-        return []
-    with open(PREDICTIONS_CSV, 'r', encoding='utf-8', newline='') as f:
-        return list(csv.DictReader(f))
+    return _read_csv(PREDICTIONS_CSV)
 
 def calculate_market_reliability(predictions):
     """Calculates accuracy for each market type based on historical results."""
@@ -242,10 +238,8 @@ def save_recommendations_to_predictions_csv(recommendations):
     updates_count = 0
 
     try:
-        with open(PREDICTIONS_CSV, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            headers = reader.fieldnames
-            data = list(reader)
+        data = _read_csv(PREDICTIONS_CSV)
+        headers = list(data[0].keys()) if data else list(files_and_headers[PREDICTIONS_CSV])
 
         if 'is_recommended' not in headers:
             headers.append('is_recommended')
@@ -270,10 +264,7 @@ def save_recommendations_to_predictions_csv(recommendations):
             
             updated_rows.append(row)
 
-        with open(PREDICTIONS_CSV, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            writer.writerows(updated_rows)
+        _write_csv(PREDICTIONS_CSV, updated_rows, headers)
             
         print(f"[DB] Updated predictions.csv with {updates_count} recommendations.")
 
@@ -0,0 +1,43 @@
+"""
+Import the Data/Store CSV tables into the SQLite backend, or export them back.
+
+The SQLite backend (LEO_STORAGE_BACKEND=sqlite) imports and exports on its own
+during normal runs; this script is for one-off migrations and recovery.
+
+Usage:
+    python Scripts/sqlite_import_export.py import   # CSV -> leobook.db
+    python Scripts/sqlite_import_export.py export   # leobook.db -> CSV
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from Data.Access.sqlite_store import sqlite_store
+from Data.Access.db_helpers import files_and_headers
+
+
+def run(direction: str):
+    print(f"  [SQLite] {direction} using {sqlite_store.db_path}")
+    for filepath in files_and_headers:
+        name = os.path.basename(filepath)
+        start = time.perf_counter()
+        if direction == 'import':
+            if not os.path.exists(filepath):
+                continue
+            sqlite_store.import_csv(filepath)
+        else:
+            sqlite_store.export_csv(filepath)
+        rows = len(sqlite_store.read(filepath))
+        print(f"    [{name}] {rows} rows ({time.perf_counter() - start:.2f}s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move Data/Store tables between CSV and SQLite")
+    parser.add_argument('direction', choices=['import', 'export'])
+    args = parser.parse_args()
+    run(args.direction)
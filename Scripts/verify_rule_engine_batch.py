@@ -0,0 +1,116 @@
+"""
+Golden check: RuleEngine.analyze_batch must match RuleEngine.analyze exactly.
+
+Generates a synthetic fixture set per seed (form lists with malformed scores
+and dates, partial standings, missing teams, H2H) and compares the batch
+output with per-fixture analyze() for the default config and a custom one.
+Tag lists are compared order-insensitively; every other field must be equal.
+Run it after touching the feature frame or _finalize.
+
+Usage:
+    python Scripts/verify_rule_engine_batch.py [--fixtures 3000] [--seeds 7 11 13]
+Exits with status 1 on any mismatch.
+"""
+
+import argparse
+import copy
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from Core.Intelligence.rule_engine import RuleEngine
+from Core.Intelligence.rule_config import RuleConfig
+
+TEAMS = [f"Team {c}" for c in "ABCDEFGHIJKLMNOP"] + ["Top W", "vs Top Wolves"]
+TAG_KEYS = ("home_tags", "away_tags", "h2h_tags", "standings_tags")
+# Non-default weights so config threading through the batch path is exercised
+CUSTOM_CONFIG = RuleConfig(name="Golden", xg_draw=4.0, h2h_draw=1.0, form_no_score=2.0, min_h2h_games=2)
+
+
+def _match(rnd, home, away):
+    hs, as_ = rnd.randint(0, 5), rnd.randint(0, 5)
+    score = rnd.choice([f"{hs}-{as_}"] * 10 + ["x-y", "", "2 - 1"])
+    winner = "Home" if hs > as_ else "Away" if as_ > hs else "Draw"
+    date = rnd.choice(["12.03.2026", "01.01.2020", "2026-05-01", "bad"])
+    return {"date": date, "home": home, "away": away, "score": score, "winner": winner}
+
+
+def _form(rnd, team):
+    out = []
+    for _ in range(rnd.randint(0, 12)):
+        other = rnd.choice(TEAMS)
+        out.append(_match(rnd, team, other) if rnd.random() < .5 else _match(rnd, other, team))
+    if rnd.random() < .1:
+        out.append(None)
+    return out
+
+
+def build_fixtures(seed: int, count: int):
+    rnd = random.Random(seed)
+    items = []
+    for _ in range(count):
+        home, away = rnd.sample(TEAMS, 2)
+        standings = []
+        if rnd.random() < .7:
+            size = rnd.randint(4, 20)
+            for pos, team in enumerate(rnd.sample(TEAMS, min(size, len(TEAMS))), 1):
+                standings.append({"team_name": team, "position": pos, "goal_difference": rnd.randint(-25, 25)})
+        h2h_data = {
+            "home_team": home, "away_team": away,
+            "home_last_10_matches": _form(rnd, home), "away_last_10_matches": _form(rnd, away),
+            "head_to_head": [_match(rnd, home, away) if rnd.random() < .5 else _match(rnd, away, home)
+                             for _ in range(rnd.randint(0, 8))],
+            "region_league": rnd.choice(["X", "Y"]),
+        }
+        if rnd.random() < .02:
+            h2h_data["home_team"] = None
+        items.append({"h2h_data": h2h_data, "standings": standings})
+    return items
+
+
+def _single(item, config):
+    """analyze() with the same error wrapping analyze_batch applies per fixture."""
+    try:
+        return RuleEngine.analyze(copy.deepcopy(item), config=config)
+    except Exception as e:
+        return {"type": "SKIP", "confidence": "Low", "reason": f"Analysis error: {e}"}
+
+
+def compare(items, config) -> int:
+    expected = [_single(i, config) for i in items]
+    got = RuleEngine.analyze_batch(items, config=config)
+    mismatches = 0
+    for exp, res in zip(expected, got):
+        for key in TAG_KEYS:
+            if key in exp:
+                exp[key] = sorted(exp[key])
+                res[key] = sorted(res.get(key, []))
+        if exp != res:
+            mismatches += 1
+            if mismatches <= 3:
+                print("  diff:", {k: (exp.get(k), res.get(k)) for k in set(exp) | set(res) if exp.get(k) != res.get(k)})
+    return mismatches + abs(len(expected) - len(got))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify analyze_batch against analyze on synthetic fixtures.")
+    parser.add_argument("--fixtures", type=int, default=3000)
+    parser.add_argument("--seeds", type=int, nargs="+", default=[7, 11, 13])
+    args = parser.parse_args()
+
+    total = 0
+    for seed in args.seeds:
+        items = build_fixtures(seed, args.fixtures)
+        for name, config in (("default", None), ("custom", CUSTOM_CONFIG)):
+            bad = compare(items, config)
+            total += bad
+            print(f"seed {seed} / {name} config: {bad} mismatches of {len(items)}")
+
+    print("OK" if total == 0 else f"FAILED: {total} mismatches")
+    sys.exit(1 if total else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Check: standings served from standings.csv must be usable by RuleEngine.analyze.
+
+Stored rows come back from the CSV layer as strings. The script feeds such
+rows through StandingsCache's store path (get_standings is replaced with an
+in-memory table, nothing is read or written) and runs the result through
+RuleEngine.analyze, which must produce standings tags without an
+'Analysis error'.
+
+Usage:
+    python Scripts/verify_standings_store_hit.py
+Exits with status 1 on failure.
+"""
+
+import sys
+from datetime import datetime as dt
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from Data.Access import standings_cache as cache_module
+from Data.Access.standings_cache import StandingsCache
+from Core.Intelligence.rule_engine import RuleEngine
+
+LEAGUE = "ENGLAND - Premier League"
+TEAMS = ["Leaders FC", "Second City", "Mid Town", "Lower Rovers", "Bottom United"]
+
+
+def stored_rows():
+    """Rows as get_standings() returns them: every value a CSV string."""
+    stamp = dt.now().isoformat()
+    rows = []
+    for pos, team in enumerate(TEAMS, 1):
+        gf, ga = 40 - pos * 6, 10 + pos * 4
+        rows.append({
+            "standings_key": f"{LEAGUE}_{team}", "team_name": team, "position": str(pos),
+            "played": "20", "wins": "", "draws": "", "losses": "",
+            "goals_for": str(gf), "goals_against": str(ga), "goal_difference": str(gf - ga),
+            "points": str(50 - pos * 8), "last_updated": stamp, "url": "", "region_league": LEAGUE,
+        })
+    return rows
+
+
+def _match(home, away, score, winner):
+    return {"date": "01.03.2026", "home": home, "away": away, "score": score, "winner": winner}
+
+
+def main():
+    cache_module.get_standings = lambda region_league: stored_rows()
+    cache = StandingsCache()
+    entry = cache.get(LEAGUE, "15.03.2026")
+    if not entry or cache.stats['store'] != 1:
+        print("FAILED: stored standings were not served from the store")
+        sys.exit(1)
+
+    home, away = TEAMS[0], TEAMS[-1]
+    form = [_match(home, away, "2-0", "Home"), _match(away, home, "1-3", "Away")] * 3
+    vision_data = {
+        "h2h_data": {
+            "home_team": home, "away_team": away, "region_league": LEAGUE,
+            "home_last_10_matches": form, "away_last_10_matches": form,
+            "head_to_head": form[:4],
+        },
+        "standings": entry["standings"],
+    }
+    try:
+        result = RuleEngine.analyze(vision_data)
+    except Exception as e:
+        print(f"FAILED: analyze raised {type(e).__name__}: {e}")
+        sys.exit(1)
+
+    reason = result.get("reason")
+    if isinstance(reason, str) and reason.startswith("Analysis error"):
+        print(f"FAILED: {reason}")
+        sys.exit(1)
+    if result.get("type") != "SKIP" and not result.get("standings_tags"):
+        print("FAILED: no standings tags generated from stored standings")
+        sys.exit(1)
+    print(f"OK: {result.get('type')} ({result.get('confidence')}), standings tags {result.get('standings_tags')}")
+
+
+if __name__ == "__main__":
+    main()